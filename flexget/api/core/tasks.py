@@ -376,8 +376,8 @@ class TaskQueueAPI(APIResource):
         """ List task(s) in queue for execution """
         tasks = [_task_info_dict(task) for task in self.manager.task_queue.run_queue.queue]
 
-        if self.manager.task_queue.current_task:
-            tasks.insert(0, _task_info_dict(self.manager.task_queue.current_task))
+        for task in reversed(self.manager.task_queue.running_tasks):
+            tasks.insert(0, _task_info_dict(task))
 
         return jsonify(tasks)
 
@@ -8,6 +8,7 @@ from flexget import plugin
 from flexget.entry import Entry
 from flexget.event import event
 from flexget.manager import Session
+from flexget.utils import db_writer
 from . import db
 
 log = logging.getLogger('archive')
@@ -31,11 +32,7 @@ class Archive(object):
         else:
             tag_names = config
 
-        tags = []
-        for tag_name in set(tag_names):
-            tags.append(db.get_tag(tag_name, task.session))
-
-        count = 0
+        items = []
         processed = []
         for entry in task.entries + task.rejected + task.failed:
             # I think entry can be in multiple of those lists .. not sure though!
@@ -43,42 +40,8 @@ class Archive(object):
                 continue
             else:
                 processed.append(entry)
-
-            ae = (
-                task.session.query(db.ArchiveEntry)
-                .filter(db.ArchiveEntry.title == entry['title'])
-                .filter(db.ArchiveEntry.url == entry['url'])
-                .first()
-            )
-            if ae:
-                # add (missing) sources
-                source = db.get_source(task.name, task.session)
-                if source not in ae.sources:
-                    log.debug('Adding `%s` into `%s` sources' % (task.name, ae))
-                    ae.sources.append(source)
-                # add (missing) tags
-                for tag_name in tag_names:
-                    atag = db.get_tag(tag_name, task.session)
-                    if atag not in ae.tags:
-                        log.debug('Adding tag %s into %s' % (tag_name, ae))
-                        ae.tags.append(atag)
-            else:
-                # create new archive entry
-                ae = db.ArchiveEntry()
-                ae.title = entry['title']
-                ae.url = entry['url']
-                if 'description' in entry:
-                    ae.description = entry['description']
-                ae.task = task.name
-                ae.sources.append(db.get_source(task.name, task.session))
-                if tags:
-                    # note, we're extending empty list
-                    ae.tags.extend(tags)
-                log.debug('Adding `%s` with %i tags to archive' % (ae, len(tags)))
-                task.session.add(ae)
-                count += 1
-        if count:
-            log.verbose('Added %i new entries to archive' % count)
+            items.append((entry['title'], entry['url'], entry.get('description')))
+        db_writer.write(task, archive_entries, (task.name, tag_names, items))
 
     def on_task_abort(self, task, config):
         """
@@ -89,6 +52,51 @@ class Archive(object):
             self.on_task_learn(task, config)
 
 
+def archive_entries(session, task_name, tag_names, items):
+    """Add (title, url, description) `items` seen by task `task_name` into the archive."""
+    tags = []
+    for tag_name in set(tag_names):
+        tags.append(db.get_tag(tag_name, session))
+
+    count = 0
+    for title, url, description in items:
+        ae = (
+            session.query(db.ArchiveEntry)
+            .filter(db.ArchiveEntry.title == title)
+            .filter(db.ArchiveEntry.url == url)
+            .first()
+        )
+        if ae:
+            # add (missing) sources
+            source = db.get_source(task_name, session)
+            if source not in ae.sources:
+                log.debug('Adding `%s` into `%s` sources' % (task_name, ae))
+                ae.sources.append(source)
+            # add (missing) tags
+            for tag_name in tag_names:
+                atag = db.get_tag(tag_name, session)
+                if atag not in ae.tags:
+                    log.debug('Adding tag %s into %s' % (tag_name, ae))
+                    ae.tags.append(atag)
+        else:
+            # create new archive entry
+            ae = db.ArchiveEntry()
+            ae.title = title
+            ae.url = url
+            if description is not None:
+                ae.description = description
+            ae.task = task_name
+            ae.sources.append(db.get_source(task_name, session))
+            if tags:
+                # note, we're extending empty list
+                ae.tags.extend(tags)
+            log.debug('Adding `%s` with %i tags to archive' % (ae, len(tags)))
+            session.add(ae)
+            count += 1
+    if count:
+        log.verbose('Added %i new entries to archive' % count)
+
+
 class UrlrewriteArchive(object):
     """
     Provides capability to rewrite urls from archive or make searches with discover.
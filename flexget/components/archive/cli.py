@@ -159,7 +159,7 @@ def cli_search(options):
     table_data = []
     with Session() as session:
         for archived_entry in flexget.components.archive.db.search(
-            session, query, tags=tags, sources=sources
+            session, query, tags=tags, sources=sources, limit=options.limit
         ):
             days_ago = (datetime.now() - archived_entry.added).days
             source_names = ', '.join([s.name for s in archived_entry.sources])
@@ -256,6 +256,9 @@ def register_parser_arguments():
     search_parser.add_argument(
         '--sources', metavar='SOURCE', nargs='+', default=[], help='Source(s) to search within'
     )
+    search_parser.add_argument(
+        '--limit', type=int, metavar='NUMBER', help='Maximum number of results to show'
+    )
     inject_parser = archive_parser.add_subparser(
         'inject', help='Inject entries from the archive back into tasks'
     )
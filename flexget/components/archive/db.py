@@ -2,7 +2,20 @@ import logging
 import re
 from datetime import datetime
 
-from sqlalchemy import Table, Column, Integer, ForeignKey, Index, Unicode, DateTime
+from sqlalchemy import (
+    Table,
+    Column,
+    Integer,
+    ForeignKey,
+    Index,
+    Unicode,
+    DateTime,
+    Float,
+    MetaData,
+)
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy import text as sql_text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -11,7 +24,7 @@ from flexget.utils.sqlalchemy_utils import table_schema, get_index_by_name
 
 log = logging.getLogger('archive.db')
 
-SCHEMA_VER = 0
+SCHEMA_VER = 1
 
 Base = db_schema.versioned_base('archive', SCHEMA_VER)
 
@@ -34,6 +47,45 @@ archive_sources_table = Table(
 Base.register_table(archive_tags_table)
 Base.register_table(archive_sources_table)
 
+# Full text index of archive entries kept up to date by triggers, created by create_fts_index
+archive_fts_table = Table(
+    'archive_fts',
+    MetaData(),
+    Column('rowid', Integer),
+    Column('title', Unicode),
+    Column('description', Unicode),
+    Column('rank', Float),
+)
+
+FTS_DDL = [
+    'DROP TABLE IF EXISTS archive_fts',
+    """
+    CREATE VIRTUAL TABLE archive_fts
+    USING fts5(title, description, content='archive_entry', content_rowid='id')
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS archive_fts_insert AFTER INSERT ON archive_entry BEGIN
+        INSERT INTO archive_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS archive_fts_delete AFTER DELETE ON archive_entry BEGIN
+        INSERT INTO archive_fts(archive_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS archive_fts_update AFTER UPDATE OF title, description
+    ON archive_entry BEGIN
+        INSERT INTO archive_fts(archive_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO archive_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
 
 class ArchiveEntry(Base):
     __tablename__ = 'archive_entry'
@@ -89,6 +141,38 @@ class ArchiveSource(Base):
         return '<ArchiveSource(id=%s,name=%s)>' % (self.id, self.name)
 
 
+def create_fts_index(connection):
+    """
+    Create the full text index of archive entries and fill it with the existing ones.
+
+    :return: False if SQLite is not compiled with FTS5, searches fall back to LIKE queries then.
+    """
+    if connection.dialect.name != 'sqlite':
+        return False
+    try:
+        for statement in FTS_DDL:
+            connection.execute(statement)
+    except OperationalError as e:
+        log.warning('Unable to create full text index of archive, searching will be slow: %s', e)
+        return False
+    connection.execute("INSERT INTO archive_fts(archive_fts) VALUES ('rebuild')")
+    return True
+
+
+@sqlalchemy_event.listens_for(ArchiveEntry.__table__, 'after_create')
+def after_archive_create(target, connection, **kw):
+    create_fts_index(connection)
+
+
+def has_fts_index(session):
+    return bool(
+        session.bind.dialect.name == 'sqlite'
+        and session.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'archive_fts'"
+        ).first()
+    )
+
+
 @db_schema.upgrade('archive')
 def upgrade(ver, session):
     if ver is None:
@@ -117,6 +201,10 @@ def upgrade(ver, session):
             log.critical('one time when you have time, it may take hours')
             log.critical('----------------------------------------------')
         ver = 0
+    if ver == 0:
+        log.info('Creating full text index of the archive (may take a while) ...')
+        create_fts_index(session.connection())
+        ver = 1
     return ver
 
 
@@ -146,22 +234,34 @@ def get_tag(name, session):
         return source
 
 
-def search(session, text, tags=None, sources=None, desc=False):
+def search(session, text, tags=None, sources=None, desc=False, limit=None):
     """
-    Search from the archive.
+    Search from the archive, ordered by relevance when the full text index is available.
 
     :param string text: Search text, spaces and dots are tried to be ignored.
     :param Session session: SQLAlchemy session, should not be closed while iterating results.
     :param list tags: Optional list of acceptable tags
     :param list sources: Optional list of acceptable sources
-    :param bool desc: Sort results descending
+    :param bool desc: Sort results (of equal relevance) descending by the time they were added
+    :param int limit: Optional maximum number of results
     :return: ArchiveEntries responding to query
     """
-    keyword = str(text).replace(' ', '%').replace('.', '%')
     # clean the text from any unwanted regexp, convert spaces and keep dots as dots
     normalized_re = re.escape(text.replace('.', ' ')).replace('\\ ', ' ').replace(' ', '.')
     find_re = re.compile(normalized_re, re.IGNORECASE)
-    query = session.query(ArchiveEntry).filter(ArchiveEntry.title.like('%' + keyword + '%'))
+    words = re.findall(r'\w+', str(text), re.UNICODE)
+    query = session.query(ArchiveEntry)
+    if words and has_fts_index(session):
+        # All words as prefixes of title words, titles are matched against the whole text below
+        match = 'title : (%s)' % ' '.join('"%s"*' % word for word in words)
+        query = (
+            query.join(archive_fts_table, archive_fts_table.c.rowid == ArchiveEntry.id)
+            .filter(sql_text('archive_fts MATCH :match').bindparams(match=match))
+            .order_by(archive_fts_table.c.rank)
+        )
+    else:
+        keyword = str(text).replace(' ', '%').replace('.', '%')
+        query = query.filter(ArchiveEntry.title.like('%' + keyword + '%'))
     if tags:
         query = query.filter(ArchiveEntry.tags.any(ArchiveTag.name.in_(tags)))
     if sources:
@@ -170,8 +270,12 @@ def search(session, text, tags=None, sources=None, desc=False):
         query = query.order_by(ArchiveEntry.added.desc())
     else:
         query = query.order_by(ArchiveEntry.added.asc())
+    count = 0
     for a in query.yield_per(5):
         if find_re.match(a.title):
             yield a
+            count += 1
+            if limit and count >= limit:
+                return
         else:
             log.trace('title %s is too wide match' % a.title)
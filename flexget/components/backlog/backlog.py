@@ -9,6 +9,7 @@ from flexget import plugin
 from flexget.components.backlog.db import log, BacklogEntry, get_entries, clear_entries
 from flexget.event import event
 from flexget.manager import Session
+from flexget.utils import db_writer
 from flexget.utils.database import with_session
 from flexget.utils.tools import parse_timedelta
 
@@ -58,7 +59,6 @@ class InputBacklog(object):
             log.debug('Remembering all entries to backlog because of task abort.')
             self.learn_backlog(task)
 
-    @with_session
     def add_backlog(self, task, entry, amount='', session=None):
         """Add single entry to task backlog
 
@@ -71,26 +71,12 @@ class InputBacklog(object):
                     'No input snapshot available for `%s`, using current state' % entry['title']
                 )
             snapshot = entry
-        expire_time = datetime.now() + parse_timedelta(amount)
-        backlog_entry = (
-            session.query(BacklogEntry)
-            .filter(BacklogEntry.title == entry['title'])
-            .filter(BacklogEntry.task == task.name)
-            .first()
-        )
-        if backlog_entry:
-            # If there is already a backlog entry for this, update the expiry time if necessary.
-            if backlog_entry.expire < expire_time:
-                log.debug('Updating expiry time for %s' % entry['title'])
-                backlog_entry.expire = expire_time
-        else:
-            log.debug('Saving %s' % entry['title'])
-            backlog_entry = BacklogEntry()
-            backlog_entry.title = entry['title']
-            backlog_entry.entry = snapshot
-            backlog_entry.task = task.name
-            backlog_entry.expire = expire_time
-            session.add(backlog_entry)
+        backlog_entry = BacklogEntry()
+        backlog_entry.title = entry['title']
+        backlog_entry.entry = snapshot
+        backlog_entry.task = task.name
+        backlog_entry.expire = datetime.now() + parse_timedelta(amount)
+        db_writer.write(task, save_backlog_entry, (backlog_entry,), session=session)
 
     def learn_backlog(self, task, amount=''):
         """Learn current entries into backlog. All task inputs must have been executed."""
@@ -120,6 +106,24 @@ class InputBacklog(object):
         return entries
 
 
+def save_backlog_entry(session, backlog_entry):
+    """Add `backlog_entry`, or update the expiry time of an existing backlog entry for it."""
+    existing = (
+        session.query(BacklogEntry)
+        .filter(BacklogEntry.title == backlog_entry.title)
+        .filter(BacklogEntry.task == backlog_entry.task)
+        .first()
+    )
+    if existing:
+        # If there is already a backlog entry for this, update the expiry time if necessary.
+        if existing.expire < backlog_entry.expire:
+            log.debug('Updating expiry time for %s' % backlog_entry.title)
+            existing.expire = backlog_entry.expire
+    else:
+        log.debug('Saving %s' % backlog_entry.title)
+        session.add(backlog_entry)
+
+
 @event('plugin.register')
 def register_plugin():
     plugin.register(InputBacklog, 'backlog', builtin=True, api_ver=2)
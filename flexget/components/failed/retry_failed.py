@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from flexget import plugin
 from flexget.event import event
 from flexget.manager import Session
+from flexget.utils.database import bulk_key_lookup
 from flexget.utils.tools import parse_timedelta
 from . import db
 
@@ -120,13 +121,13 @@ class PluginFailed(object):
             return
         config = self.prepare_config(config)
         max_count = config['max_retries']
+        failed = bulk_key_lookup(
+            task.session.query(db.FailedEntry),
+            [db.FailedEntry.title, db.FailedEntry.url],
+            [(entry['title'], entry['original_url']) for entry in task.entries],
+        )
         for entry in task.entries:
-            item = (
-                task.session.query(db.FailedEntry)
-                .filter(db.FailedEntry.title == entry['title'])
-                .filter(db.FailedEntry.url == entry['original_url'])
-                .first()
-            )
+            item = failed.get((entry['title'], entry['original_url']))
             if item:
                 if item.count > max_count:
                     entry.reject(
@@ -5,6 +5,7 @@ import logging
 
 from flexget import plugin
 from flexget.event import event
+from flexget.utils import db_writer
 from . import db
 
 log = logging.getLogger('history')
@@ -20,6 +21,7 @@ class PluginHistory(object):
         if config is False:
             return  # Explicitly disabled with configuration
 
+        items = []
         for entry in task.accepted:
             item = db.History()
             item.task = task.name
@@ -30,7 +32,9 @@ class PluginHistory(object):
             if 'reason' in entry:
                 reason = ' (reason: %s)' % entry['reason']
             item.details = 'Accepted by %s%s' % (entry.get('accepted_by', '<unknown>'), reason)
-            task.session.add(item)
+            items.append(item)
+        if items:
+            db_writer.add(task, items)
 
 
 @event('plugin.register')
@@ -43,9 +43,11 @@ class ListMatch(object):
                     thelist = plugin.get(plugin_name, self).get_list(plugin_config)
                 except AttributeError:
                     raise PluginError('Plugin %s does not support list interface' % plugin_name)
+                # Lists offering a matcher are loaded only once for all the entries
+                matcher = thelist.matcher() if hasattr(thelist, 'matcher') else thelist
                 already_accepted = []
                 for entry in task.entries:
-                    result = thelist.get(entry)
+                    result = matcher.get(entry)
                     if not result:
                         continue
                     if config['action'] == 'accept':
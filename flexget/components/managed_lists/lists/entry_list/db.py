@@ -180,6 +180,35 @@ class DBEntrySet(MutableSet):
             match = self._entry_query(session=session, entry=entry)
             return Entry(match.entry) if match else None
 
+    def matcher(self):
+        """Return a matcher for looking up many entries from this list at once."""
+        return DBEntryMatcher(self)
+
+
+class DBEntryMatcher(object):
+    """Matches entries against a snapshot of an entry list, indexed in memory by title."""
+
+    def __init__(self, entry_set):
+        # Like _entry_query, which only ever matches by title: its original_url condition tests the url
+        # itself for truth, and text is false in SQLite
+        self.by_title = {}
+        with Session() as session:
+            query = (
+                session.query(EntryListEntry.id, EntryListEntry.title)
+                .filter(EntryListEntry.list_id == entry_set._db_list(session).id)
+                .order_by(EntryListEntry.id)
+            )
+            for entry_id, title in query:
+                self.by_title.setdefault(title, entry_id)
+
+    def get(self, entry):
+        entry_id = self.by_title.get(entry['title'])
+        if entry_id is None:
+            return None
+        with Session() as session:
+            match = session.query(EntryListEntry).get(entry_id)
+            return Entry(match.entry) if match else None
+
 
 @with_session
 def get_entry_lists(name=None, session=None):
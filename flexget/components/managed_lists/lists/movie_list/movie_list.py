@@ -143,13 +143,22 @@ class MovieList(MutableSet):
         return res
 
     @staticmethod
-    def _parse_title(entry):
+    def _parse_title(entry, update=True):
+        """
+        Parse movie name and year from the title of `entry`.
+
+        :param bool update: Update the parsed fields into the entry
+        :return: Dict of parsed fields, empty if title could not be parsed
+        """
         parser = plugin.get('parsing', 'movie_list').parse_movie(data=entry['title'])
         if parser and parser.valid:
             parser.name = plugin_parser_common.normalize_name(
                 plugin_parser_common.remove_dirt(parser.name)
             )
-            entry.update(parser.fields)
+            if update:
+                entry.update(parser.fields)
+            return parser.fields
+        return {}
 
     @property
     def immutable(self):
@@ -168,6 +177,75 @@ class MovieList(MutableSet):
         match = self._find_entry(entry=entry, session=session)
         return match.to_entry() if match else None
 
+    def matcher(self):
+        """Return a matcher for looking up many entries from this list at once."""
+        return MovieListMatcher(self)
+
+
+class MovieListMatcher(object):
+    """
+    Matches entries against a snapshot of a movie list, indexed in memory by ids and title/year.
+    Only ids already present in the entries are used, lazy lookups are not triggered.
+    """
+
+    def __init__(self, movie_list):
+        self.movie_list = movie_list
+        self.supported_ids = MovieListBase().supported_ids
+        self.by_id = {}
+        self.by_title = {}
+        with Session() as session:
+            list_id = movie_list._db_list(session).id
+            ids = (
+                session.query(
+                    db.MovieListID.id_name, db.MovieListID.id_value, db.MovieListID.movie_id
+                )
+                .join(db.MovieListID.movie)
+                .filter(db.MovieListMovie.list_id == list_id)
+                .order_by(db.MovieListMovie.id)
+            )
+            for id_name, id_value, movie_id in ids:
+                self.by_id.setdefault((id_name, str(id_value)), movie_id)
+            movies = (
+                session.query(
+                    db.MovieListMovie.id, db.MovieListMovie.title, db.MovieListMovie.year
+                )
+                .filter(db.MovieListMovie.list_id == list_id)
+                .order_by(db.MovieListMovie.id)
+            )
+            for movie_id, title, year in movies:
+                self.by_title.setdefault(((title or '').lower(), year), movie_id)
+        log.debug(
+            'loaded %s movies with %s ids from list %s',
+            len(self.by_title),
+            len(self.by_id),
+            movie_list.list_name,
+        )
+
+    def _match(self, entry):
+        for id_name in self.supported_ids:
+            id_value = entry.get(id_name, eval_lazy=False)
+            if id_value and (id_name, str(id_value)) in self.by_id:
+                log.debug('matched movie based off id %s: %s', id_name, id_value)
+                return self.by_id[(id_name, str(id_value))]
+        name = entry.get('movie_name', eval_lazy=False)
+        year = entry.get('movie_year', eval_lazy=False)
+        if not name:
+            # Don't overwrite a lazy field which hasn't been looked up
+            fields = MovieList._parse_title(entry, update=not entry.is_lazy('movie_name'))
+            name, year = fields.get('movie_name'), fields.get('movie_year')
+        if not name:
+            log.warning('Could not get a movie name, skipping')
+            return
+        return self.by_title.get((name.lower(), year or None))
+
+    def get(self, entry):
+        movie_id = self._match(entry)
+        if movie_id is None:
+            return None
+        with Session() as session:
+            movie = session.query(db.MovieListMovie).get(movie_id)
+            return movie.to_entry() if movie else None
+
 
 class PluginMovieList(object):
     """Remove all accepted elements from your trakt.tv watchlist/library/seen or custom list."""
@@ -0,0 +1,47 @@
+from __future__ import unicode_literals, division, absolute_import
+from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
+
+from flask import jsonify
+
+from flexget.api import api, APIResource
+from flexget.api.app import base_message_schema, success_response
+from flexget.components.parsing.plugin_parsing import parse_cache
+
+parsing_api = api.namespace('parsing', description='Parse release titles')
+
+
+class ObjectsContainer(object):
+    cache_object = {
+        'type': 'object',
+        'properties': {
+            'hits': {'type': 'integer'},
+            'misses': {'type': 'integer'},
+            'hit_rate': {'type': 'number'},
+            'size': {'type': 'integer'},
+            'max_size': {'type': 'integer'},
+            'ttl': {'type': 'integer'},
+        },
+        'required': ['hits', 'misses', 'hit_rate', 'size', 'max_size', 'ttl'],
+        'additionalProperties': False,
+    }
+
+
+cache_schema = api.schema_model('parsing.cache', ObjectsContainer.cache_object)
+
+
+@parsing_api.route('/cache/')
+class ParsingCacheAPI(APIResource):
+    @api.response(200, model=cache_schema)
+    def get(self, session=None):
+        """ Get parse result cache statistics """
+        info = parse_cache.info()
+        lookups = info['hits'] + info['misses']
+        info['hit_rate'] = info['hits'] / lookups if lookups else 0
+        info['ttl'] = parse_cache.ttl
+        return jsonify(info)
+
+    @api.response(200, model=base_message_schema)
+    def delete(self, session=None):
+        """ Clear parse result cache """
+        parse_cache.clear()
+        return success_response('parse result cache cleared')
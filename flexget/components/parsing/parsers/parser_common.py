@@ -40,6 +40,22 @@ def old_assume_quality(guessed_quality, assumed_quality):
     return guessed_quality
 
 
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def kwargs_key(kwargs):
+    """:return: Hashable key for parser `kwargs`, or None if they contain unhashable values"""
+    key = tuple(sorted((name, _freeze(value)) for name, value in kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def remove_dirt(name):
     if name:
         name = re.sub(r'[_.,\[\]\(\): ]+', ' ', name).strip().lower()
@@ -3,8 +3,10 @@ from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 from future.utils import native
 
 import logging
+import multiprocessing
 import re
 import sys
+import threading
 import time
 
 from guessit.api import GuessItApi, GuessitException
@@ -14,6 +16,7 @@ from rebulk.match import MatchesDict
 from rebulk.pattern import RePattern
 
 from flexget import plugin
+from flexget.config_schema import register_config_key
 from flexget.event import event
 from flexget.utils import qualities
 from flexget.utils.parsers.generic import ParseWarning, default_ignore_prefixes, name_to_re
@@ -64,6 +67,23 @@ try:
 except AttributeError:
     preferred_clock = time.clock
 
+# Smaller batches of titles are parsed in the calling thread, even when the pool is enabled
+DEFAULT_MIN_BATCH = 50
+
+pool_schema = {
+    'oneOf': [
+        {'type': 'boolean'},
+        {
+            'type': 'object',
+            'properties': {
+                'workers': {'type': 'integer', 'minimum': 1},
+                'min_batch': {'type': 'integer', 'minimum': 1},
+            },
+            'additionalProperties': False,
+        },
+    ]
+}
+
 
 class ParserGuessit(object):
     SOURCE_MAP = {
@@ -425,6 +445,116 @@ class ParserGuessit(object):
 
         return group.lower() in normalized_allow_groups
 
+    def parse_series_many(self, data, **kwargs):
+        """
+        Parse series information from many strings, in worker processes if `guessit_pool` is set.
+
+        :param list data: The raw strings to parse information from
+        :returns: List of results in the order of `data`
+        """
+        config = pool_config
+        if config and len(data) >= config[1]:
+            try:
+                return get_pool(config).parse_series(data, kwargs)
+            except Exception as e:
+                log.warning('Parsing with guessit worker processes failed: %s', e)
+                log.debug('Worker processes failed', exc_info=True)
+        return [self.parse_series(item, **kwargs) for item in data]
+
+
+class ParserPool(object):
+    """
+    Worker processes parsing batches of titles with guessit in parallel.
+    Guessit is pure python and holds the GIL, so threads wouldn't help.
+    """
+
+    def __init__(self, workers, min_batch=DEFAULT_MIN_BATCH):
+        self.workers = workers
+        self.min_batch = min_batch
+        # Forking while other threads hold locks is unsafe, start fresh interpreters if possible
+        if hasattr(multiprocessing, 'get_context'):
+            context = multiprocessing.get_context('spawn')
+        else:
+            context = multiprocessing
+        self._pool = context.Pool(workers, initializer=_init_worker)
+
+    def parse_series(self, data, kwargs):
+        chunksize = max(1, len(data) // (self.workers * 4))
+        return self._pool.map(_parse_series_job, [(item, kwargs) for item in data], chunksize)
+
+    def close(self):
+        """Stop the workers once they have finished the batches being parsed."""
+        self._pool.close()
+        self._pool.join()
+
+
+# Parser of a worker process
+_worker_parser = None
+
+
+def _init_worker():
+    global _worker_parser
+    _worker_parser = ParserGuessit()
+    # Build the guessit rules before the first batch arrives
+    _worker_parser.parse_series('Warm.Up.S01E01.720p.HDTV.x264-FlexGet', name='Warm Up')
+
+
+def _parse_series_job(job):
+    data, kwargs = job
+    return _worker_parser.parse_series(data, **kwargs)
+
+
+# Worker count and minimum batch size of the pool, None when it is disabled
+pool_config = None
+# Started when first needed
+pool = None
+_pool_lock = threading.Lock()
+
+
+def prepare_pool_config(config):
+    """:return: Tuple of worker count and minimum batch size, or None if the pool is disabled"""
+    if not config:
+        return None
+    if config is True:
+        config = {}
+    return (
+        config.get('workers') or multiprocessing.cpu_count(),
+        config.get('min_batch', DEFAULT_MIN_BATCH),
+    )
+
+
+def get_pool(config):
+    global pool
+    with _pool_lock:
+        if pool is None:
+            log.debug('Starting %s guessit worker processes', config[0])
+            pool = ParserPool(*config)
+        return pool
+
+
+@event('manager.config_updated')
+def configure_pool(manager):
+    global pool_config
+    config = prepare_pool_config(manager.config.get('guessit_pool'))
+    if config != pool_config:
+        stop_pool(manager)
+        pool_config = config
+
+
+@event('manager.shutdown')
+def stop_pool(manager):
+    global pool
+    with _pool_lock:
+        old_pool, pool = pool, None
+    if old_pool:
+        log.debug('Stopping guessit worker processes')
+        old_pool.close()
+
+
+@event('config.register')
+def register_config():
+    register_config_key('guessit_pool', pool_schema)
+
 
 @event('plugin.register')
 def register_plugin():
@@ -2,7 +2,9 @@ from __future__ import absolute_import, division, unicode_literals
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
 import logging
+import threading
 import time
+from collections import OrderedDict
 
 from flexget import plugin
 from flexget.event import event
@@ -11,7 +13,7 @@ from flexget.utils.parsers.generic import ParseWarning
 from flexget.utils.parsers.movie import MovieParser
 from flexget.utils.parsers.series import SeriesParser
 
-from .parser_common import MovieParseResult, SeriesParseResult
+from .parser_common import MovieParseResult, SeriesParseResult, kwargs_key
 
 log = logging.getLogger('parser_internal')
 
@@ -21,8 +23,55 @@ try:
 except AttributeError:
     preferred_clock = time.clock
 
+# Maximum number of compiled series parsers kept around for reuse
+MAX_CACHED_PARSERS = 2000
+
+
+class SeriesParserCache(object):
+    """
+    Keeps compiled :class:`SeriesParser` instances for reuse, so that the name and identifier
+    regexps of a series are only built once, rather than for every parsed title.
+
+    A parser is taken out of the cache while in use, so concurrent parses of the same series
+    never share an instance.
+    """
+
+    def __init__(self, size=MAX_CACHED_PARSERS):
+        self.size = size
+        self._parsers = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(kwargs):
+        """:return: Hashable key for parser `kwargs`, or None if such parsers can't be reused"""
+        # Without a name the parser guesses one from each title, and keeps it
+        if not kwargs.get('name'):
+            return None
+        return kwargs_key(kwargs)
+
+    def acquire(self, key, kwargs):
+        parser = None
+        if key is not None:
+            with self._lock:
+                parser = self._parsers.pop(key, None)
+        return parser or SeriesParser(**kwargs)
+
+    def release(self, key, parser):
+        if key is None:
+            return
+        with self._lock:
+            self._parsers[key] = parser
+            while len(self._parsers) > self.size:
+                self._parsers.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._parsers.clear()
+
 
 class ParserInternal(object):
+    def __init__(self):
+        self.series_parsers = SeriesParserCache()
 
     # movie_parser API
 
@@ -51,7 +100,18 @@ class ParserInternal(object):
     def parse_series(self, data, **kwargs):
         log.debug('Parsing series: `%s` kwargs: %s', data, kwargs)
         start = preferred_clock()
-        parser = SeriesParser(**kwargs)
+        key = self.series_parsers.key(kwargs)
+        parser = self.series_parsers.acquire(key, kwargs)
+        try:
+            result = self._parse_series(parser, data)
+            log.debug('Parsing result: %s (in %s ms)', parser, (preferred_clock() - start) * 1000)
+        finally:
+            self.series_parsers.release(key, parser)
+        return result
+
+    def _parse_series(self, parser, data):
+        # A reused parser still holds the previous title
+        parser.data = data
         try:
             parser.parse(data)
         except ParseWarning as pw:
@@ -59,7 +119,7 @@ class ParserInternal(object):
         # TODO: Returning this invalid object seems a bit silly, raise an exception is probably better
         if not parser.valid:
             return SeriesParseResult(valid=False)
-        result = SeriesParseResult(
+        return SeriesParseResult(
             data=data,
             name=parser.name,
             episodes=parser.episodes,
@@ -73,8 +133,6 @@ class ParserInternal(object):
             strict_name=parser.strict_name,
             identified_by=parser.identified_by,
         )
-        log.debug('Parsing result: %s (in %s ms)', parser, (preferred_clock() - start) * 1000)
-        return result
 
 
 @event('plugin.register')
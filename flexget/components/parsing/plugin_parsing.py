@@ -1,20 +1,76 @@
 from __future__ import unicode_literals, division, absolute_import
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
+import copy
 import logging
 
 from flexget import plugin
 from flexget.event import event
+from flexget.utils.tools import LRUCache
+
+from .parsers.parser_common import kwargs_key
 
 log = logging.getLogger('parsing')
 PARSER_TYPES = ['movie', 'series']
 
+# Maximum number of parse results kept, and seconds they are kept for
+PARSE_CACHE_SIZE = 10000
+PARSE_CACHE_TTL = 6 * 60 * 60
+
 # Mapping of parser type to (mapping of parser name to plugin instance)
 parsers = {}
 # Mapping from parser type to the name of the default/selected parser for that type
 default_parsers = {}
 selected_parsers = {}
 
+# Results of all parsers, shared by all tasks.
+# Results are copied when returned, since callers may modify them.
+parse_cache = LRUCache(PARSE_CACHE_SIZE, ttl=PARSE_CACHE_TTL)
+
+
+def cached_parse(parser_type, parser_name, parse_func, data, **kwargs):
+    """
+    :return: Copy of the cached result of `parse_func` for `data` and `kwargs`, parsed if missing
+    """
+    key = kwargs_key(kwargs)
+    if key is None:
+        return parse_func(data, **kwargs)
+    result = parse_cache.get(
+        (parser_type, parser_name, data, key), lambda: parse_func(data, **kwargs)
+    )
+    return _copy_result(result)
+
+
+def cached_parse_many(parser_type, parser_name, parse_many_func, data, **kwargs):
+    """
+    :return: List of copies of the cached results of `parse_many_func` for each of `data` and
+        `kwargs`. Strings without a cached result are parsed in a single call.
+    """
+    key = kwargs_key(kwargs)
+    results = {}
+    missing = []
+    for item in data:
+        if item in results:
+            continue
+        result = None
+        if key is not None:
+            result = parse_cache.lookup((parser_type, parser_name, item, key))
+        results[item] = result
+        if result is None:
+            missing.append(item)
+    if missing:
+        for item, result in zip(missing, parse_many_func(missing, **kwargs)):
+            results[item] = result
+            if key is not None:
+                parse_cache.put((parser_type, parser_name, item, key), result)
+    return [_copy_result(results[item]) for item in data]
+
+
+def _copy_result(result):
+    result = copy.copy(result)
+    result.quality = copy.copy(result.quality)
+    return result
+
 
 # We need to wait until manager startup to access other plugin instances, to make sure they have all been loaded
 @event('manager.startup')
@@ -73,8 +129,30 @@ class PluginParsing(object):
 
         :returns: An object containing the parsed information. The `valid` attribute will be set depending on success.
         """
-        parser = parsers['series'][selected_parsers.get('series', default_parsers.get('series'))]
-        return parser.parse_series(data, name=name, **kwargs)
+        parser_name = selected_parsers.get('series', default_parsers.get('series'))
+        parser = parsers['series'][parser_name]
+        return cached_parse('series', parser_name, parser.parse_series, data, name=name, **kwargs)
+
+    def parse_series_many(self, data, name=None, **kwargs):
+        """
+        Use the selected series parser to parse series information from many strings at once.
+        Parsers supporting it parse them in parallel.
+
+        :param list data: The raw strings to parse information from.
+        :param name: The series name to parse data for. If not supplied, parser will attempt to
+            guess series name automatically from each string.
+
+        :returns: List of result objects, in the order of `data`.
+        """
+        parser_name = selected_parsers.get('series', default_parsers.get('series'))
+        parser = parsers['series'][parser_name]
+        parse_many = getattr(parser, 'parse_series_many', None)
+        if parse_many is None:
+
+            def parse_many(items, **kwargs):
+                return [parser.parse_series(item, **kwargs) for item in items]
+
+        return cached_parse_many('series', parser_name, parse_many, data, name=name, **kwargs)
 
     def parse_movie(self, data, **kwargs):
         """
@@ -84,8 +162,9 @@ class PluginParsing(object):
 
         :returns: An object containing the parsed information. The `valid` attribute will be set depending on success.
         """
-        parser = parsers['movie'][selected_parsers.get('movie') or default_parsers['movie']]
-        return parser.parse_movie(data, **kwargs)
+        parser_name = selected_parsers.get('movie') or default_parsers['movie']
+        parser = parsers['movie'][parser_name]
+        return cached_parse('movie', parser_name, parser.parse_movie, data, **kwargs)
 
 
 @event('plugin.register')
@@ -27,6 +27,7 @@ class PendingApproval(object):
             .first()
         )
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         if not config:
             return
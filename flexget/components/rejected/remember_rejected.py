@@ -5,11 +5,12 @@ from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 from datetime import datetime, timedelta
 
 from past.builtins import basestring
-from sqlalchemy import and_
 
 from flexget import plugin
 from flexget.event import event
 from flexget.manager import Session
+from flexget.utils import db_writer
+from flexget.utils.database import bulk_key_lookup
 from flexget.utils.tools import parse_timedelta
 
 from . import db
@@ -70,17 +71,16 @@ class FilterRememberRejected(object):
                 db.RememberEntry.task_id == task_id
             )
             if reject_entries.count():
+                # We don't record or reject any entries without url
+                entries = [entry for entry in task.entries if entry.get('url')]
+                remembered = bulk_key_lookup(
+                    reject_entries,
+                    [db.RememberEntry.title, db.RememberEntry.url],
+                    [(entry['title'], entry['original_url']) for entry in entries],
+                )
                 # Reject all the remembered entries
-                for entry in task.entries:
-                    if not entry.get('url'):
-                        # We don't record or reject any entries without url
-                        continue
-                    reject_entry = reject_entries.filter(
-                        and_(
-                            db.RememberEntry.title == entry['title'],
-                            db.RememberEntry.url == entry['original_url'],
-                        )
-                    ).first()
+                for entry in entries:
+                    reject_entry = remembered.get((entry['title'], entry['original_url']))
                     if reject_entry:
                         entry.reject(
                             'Rejected on behalf of %s plugin: %s'
@@ -105,20 +105,19 @@ class FilterRememberRejected(object):
 
     @plugin.priority(plugin.PRIORITY_LAST)
     def on_task_learn(self, task, config):
+        entries = [entry for entry in task.all_entries if entry.get('remember_rejected')]
+        if not entries:
+            return
         with Session() as session:
-            for entry in task.all_entries:
-                if not entry.get('remember_rejected'):
-                    continue
+            (remember_task_id,) = (
+                session.query(db.RememberTask.id).filter(db.RememberTask.name == task.name).first()
+            )
+            remember_entries = []
+            for entry in entries:
                 expires = None
                 if isinstance(entry['remember_rejected'], timedelta):
                     expires = datetime.now() + entry['remember_rejected']
-
-                (remember_task_id,) = (
-                    session.query(db.RememberTask.id)
-                    .filter(db.RememberTask.name == task.name)
-                    .first()
-                )
-                session.add(
+                remember_entries.append(
                     db.RememberEntry(
                         title=entry['title'],
                         url=entry['original_url'],
@@ -128,6 +127,7 @@ class FilterRememberRejected(object):
                         expires=expires,
                     )
                 )
+            db_writer.add(task, remember_entries, session=session)
 
 
 @event('plugin.register')
@@ -10,6 +10,7 @@ forget (string)
 import logging
 from datetime import datetime
 
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy import or_
 from sqlalchemy import (
     select,
@@ -26,10 +27,13 @@ from sqlalchemy.orm import relation
 
 from flexget import db_schema
 from flexget import plugin
+from flexget.config_schema import register_config_key
 from flexget.event import event
 from flexget.manager import Session
 from flexget.utils.database import with_session
 from flexget.utils.sqlalchemy_utils import table_schema, table_add_column
+from flexget.utils.tools import chunked
+from .index import seen_index, DEFAULT_MAX_MEMORY
 
 try:
     # NOTE: Importing other plugins is discouraged!
@@ -192,6 +196,7 @@ def forget(value):
             count += 1
             log.debug('forgetting %s', se)
             session.delete(se)
+    seen_index.remove(field_count)
     return count, field_count
 
 
@@ -214,6 +219,108 @@ def search_by_field_values(field_value_list, task_name, local=False, session=Non
     return found.first()
 
 
+@with_session
+def search_by_field_values_bulk(field_value_list, task_name, local=False, session=None):
+    """
+    Return the seen matches for many field values at once, querying them in chunks
+    :param field_value_list: List of field values to match
+    :param task_name: Name of task to compare to in case local flag is sent
+    :param local: Local flag
+    :param session: Current session
+    :return: Dict mapping matched field values to (SeenField, SeenEntry) tuples
+    """
+    matches = {}
+    for values in chunked(list(set(field_value_list))):
+        query = (
+            session.query(SeenField, SeenEntry)
+            .join(SeenEntry, SeenField.seen_entry_id == SeenEntry.id)
+            .filter(SeenField.value.in_(values))
+        )
+        if local:
+            query = query.filter(SeenEntry.task == task_name)
+        else:
+            # Entries added from CLI were having local marked as None rather than False for a while gh#879
+            query = query.filter(or_(SeenEntry.local == False, SeenEntry.local == None))
+        # Oldest match wins when a value has been seen more than once
+        for field, entry in query.order_by(SeenField.id):
+            matches.setdefault(field.value, (field, entry))
+    return matches
+
+
+@event('config.register')
+def register_config():
+    register_config_key(
+        'seen_index',
+        {
+            'oneOf': [
+                {'type': 'boolean'},
+                {
+                    'type': 'object',
+                    'properties': {'max_memory': {'type': 'integer', 'minimum': 1}},
+                    'additionalProperties': False,
+                },
+            ]
+        },
+    )
+
+
+def load_seen_index_values():
+    """
+    :return: Number of seen field values, and an iterator over them
+    """
+    session = Session()
+    count = session.query(SeenField).count()
+
+    def values():
+        try:
+            for (value,) in session.query(SeenField.value).yield_per(10000):
+                yield value
+        finally:
+            session.close()
+
+    return count, values()
+
+
+@event('manager.config_updated')
+@event('manager.daemon.started')
+def configure_seen_index(manager):
+    """The seen index is only used by the daemon, where it is built once and kept up to date."""
+    if not manager.is_daemon:
+        return
+    config = manager.config.get('seen_index', True)
+    if isinstance(config, bool):
+        config = {} if config else None
+    max_memory = config.get('max_memory', DEFAULT_MAX_MEMORY) if config is not None else None
+    if max_memory == seen_index.max_memory:
+        return
+    if max_memory is None:
+        log.debug('Disabling seen index')
+    else:
+        log.debug('Building seen index with a memory budget of %s MB', max_memory)
+    seen_index.configure(max_memory, load_seen_index_values)
+
+
+@sqlalchemy_event.listens_for(Session, 'after_flush')
+def collect_seen_values(session, flush_context):
+    if not seen_index.enabled:
+        return
+    values = [obj.value for obj in session.new if isinstance(obj, SeenField)]
+    if values:
+        session.info.setdefault('seen_index_values', []).extend(values)
+
+
+@sqlalchemy_event.listens_for(Session, 'after_commit')
+def index_seen_values(session):
+    values = session.info.pop('seen_index_values', None)
+    if values:
+        seen_index.add(values)
+
+
+@sqlalchemy_event.listens_for(Session, 'after_soft_rollback')
+def discard_seen_values(session, previous_transaction):
+    session.info.pop('seen_index_values', None)
+
+
 @event('manager.db_cleanup')
 def db_cleanup(manager, session):
     # TODO: Look into this, is it still valid?
@@ -265,4 +372,5 @@ def forget_by_id(entry_id, session=None):
     """
     entry = get_entry_by_id(entry_id, session=session)
     log.debug('Deleting seen entry with ID {0}'.format(entry_id))
+    seen_index.remove(len(entry.fields))
     session.delete(entry)
@@ -0,0 +1,195 @@
+"""
+Memory resident index of seen field values, used by the daemon to avoid querying the database for values which have
+definitely never been seen.
+"""
+from __future__ import unicode_literals, division, absolute_import
+from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
+
+import hashlib
+import logging
+import math
+import struct
+import threading
+import time
+
+log = logging.getLogger('seen.index')
+
+# Index is sized for this many values at least, so it doesn't need to be rebuilt right away on a fresh database
+MIN_CAPACITY = 100000
+# Desired rate of false positives, the actual rate is higher if the memory budget does not allow for it
+ERROR_RATE = 0.01
+# Default memory budget in megabytes
+DEFAULT_MAX_MEMORY = 32
+
+
+class BloomFilter(object):
+    """
+    Probabilistic set of strings. Membership tests may return false positives, but never false negatives.
+    Values cannot be removed.
+    """
+
+    def __init__(self, capacity, error_rate=ERROR_RATE, max_bytes=None):
+        num_bits = int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        if max_bytes and num_bits > max_bytes * 8:
+            num_bits = max_bytes * 8
+        self.num_bits = max(num_bits, 8)
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.capacity = capacity
+        self.count = 0
+        self.bits = bytearray(int(math.ceil(self.num_bits / 8)))
+
+    def _positions(self, value):
+        digest = hashlib.md5(value.encode('utf-8')).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        for position in self._positions(value):
+            if not self.bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def full(self):
+        return self.count > self.capacity
+
+
+class SeenIndex(object):
+    """
+    Index of all seen field values. Until it has been loaded, or while it is being rebuilt, every value is reported
+    as possibly seen, so the database is always consulted.
+
+    Values must only be added once they have been committed to the database, so that a rebuild never misses them.
+    """
+
+    def __init__(self):
+        self.max_memory = None
+        self._filter = None
+        self._ready = False
+        self._removed = 0
+        # Values added while the index is being (re)built
+        self._pending = None
+        self._load_values = None
+        # Incremented on every (re)configuration, so that stale loads are discarded
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._loading = None
+
+    @property
+    def enabled(self):
+        return self.max_memory is not None
+
+    @property
+    def ready(self):
+        return self._ready
+
+    def configure(self, max_memory, load_values=None):
+        """
+        Enable the index and (re)build it in the background.
+
+        :param int max_memory: Memory budget in megabytes, or None to disable the index
+        :param load_values: Callable returning the number of seen values and an iterable over them
+        """
+        with self._lock:
+            self.max_memory = max_memory
+            self._load_values = load_values
+            self._generation += 1
+            self._filter = None
+            self._ready = False
+            self._pending = None
+        self.rebuild()
+
+    def rebuild(self):
+        with self._lock:
+            if not self.enabled or self._pending is not None:
+                return
+            self._ready = False
+            self._pending = []
+            self._loading = threading.Thread(
+                target=self._load,
+                args=(self._generation, self._load_values, self.max_memory),
+                name='seen_index',
+            )
+            self._loading.daemon = True
+            self._loading.start()
+
+    def wait(self):
+        """Block until a rebuild in progress has finished."""
+        loading = self._loading
+        if loading:
+            loading.join()
+
+    def _load(self, generation, load_values, max_memory):
+        start = time.time()
+        try:
+            count, values = load_values()
+            bloom = BloomFilter(max(count * 2, MIN_CAPACITY), max_bytes=max_memory * 1024 * 1024)
+            for value in values:
+                bloom.add(value)
+        except Exception as e:
+            log.error('Failed to load seen index: %s', e)
+            log.debug('Failed to load seen index', exc_info=True)
+            with self._lock:
+                if generation == self._generation:
+                    self._pending = None
+            return
+        with self._lock:
+            if generation != self._generation:
+                # Disabled or reconfigured while loading
+                return
+            for value in self._pending:
+                bloom.add(value)
+            self._filter = bloom
+            self._pending = None
+            self._removed = 0
+            self._ready = True
+        log.verbose(
+            'Loaded %s seen values into index (%s KiB, %s hashes) in %.2f seconds',
+            count,
+            len(bloom.bits) // 1024,
+            bloom.num_hashes,
+            time.time() - start,
+        )
+
+    def add(self, values):
+        """Add committed seen field `values` to the index."""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.extend(values)
+            if not self._ready:
+                return
+            for value in values:
+                self._filter.add(value)
+            full = self._filter.full
+        if full:
+            log.debug('Seen index is over capacity, rebuilding it')
+            self.rebuild()
+
+    def remove(self, count):
+        """Values can't be removed from the filter, rebuild it once enough of them are stale."""
+        with self._lock:
+            if not self._ready:
+                return
+            self._removed += count
+            stale = self._removed > self._filter.count // 4
+        if stale:
+            log.debug('Seen index has too many forgotten values, rebuilding it')
+            self.rebuild()
+
+    def might_contain(self, value):
+        """
+        :return: False if `value` has definitely never been seen, otherwise True
+        """
+        with self._lock:
+            if not self._ready:
+                return True
+            return value in self._filter
+
+
+seen_index = SeenIndex()
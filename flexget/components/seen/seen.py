@@ -7,7 +7,9 @@ from past.builtins import basestring
 
 from flexget import plugin
 from flexget.event import event
+from flexget.utils import db_writer
 from . import db
+from .index import seen_index
 
 log = logging.getLogger(__name__)
 
@@ -72,8 +74,9 @@ class FilterSeen(object):
         fields = config.get('fields')
         local = config.get('local')
 
+        # construct list of values looked for each entry
+        entry_values = []
         for entry in task.entries:
-            # construct list of values looked
             values = []
             for field in fields:
                 if field not in entry:
@@ -81,26 +84,40 @@ class FilterSeen(object):
                 if entry[field] not in values and entry[field]:
                     values.append(str(entry[field]))
             if values:
-                log.trace('querying for: %s' % ', '.join(values))
-                # check if SeenField.value is any of the values
-                found = db.search_by_field_values(
-                    field_value_list=values, task_name=task.name, local=local, session=task.session
+                entry_values.append((entry, values))
+        if not entry_values:
+            return
+
+        # check which SeenField.values are any of the values, for all entries at once
+        all_values = [value for _, values in entry_values for value in values]
+        if seen_index.ready:
+            # values missing from the index have definitely never been seen
+            all_values = [value for value in all_values if seen_index.might_contain(value)]
+            if not all_values:
+                log.trace('none of the values are in the seen index')
+                return
+        log.trace('querying for %s values' % len(all_values))
+        matches = db.search_by_field_values_bulk(
+            field_value_list=all_values, task_name=task.name, local=local, session=task.session
+        )
+        if not matches:
+            return
+
+        for entry, values in entry_values:
+            for value in values:
+                if value not in matches:
+                    continue
+                found, se = matches[value]
+                log.debug(
+                    "Rejecting '%s' '%s' because of seen '%s'"
+                    % (entry['url'], entry['title'], found.value)
+                )
+                entry.reject(
+                    'Entry with %s `%s` is already marked seen in the task %s at %s'
+                    % (found.field, found.value, se.task, se.added.strftime('%Y-%m-%d %H:%M')),
+                    remember=remember_rejected,
                 )
-                if found:
-                    log.debug(
-                        "Rejecting '%s' '%s' because of seen '%s'"
-                        % (entry['url'], entry['title'], found.value)
-                    )
-                    se = (
-                        task.session.query(db.SeenEntry)
-                        .filter(db.SeenEntry.id == found.seen_entry_id)
-                        .one()
-                    )
-                    entry.reject(
-                        'Entry with %s `%s` is already marked seen in the task %s at %s'
-                        % (found.field, found.value, se.task, se.added.strftime('%Y-%m-%d %H:%M')),
-                        remember=remember_rejected,
-                    )
+                break
 
     def on_task_learn(self, task, config):
         """Remember succeeded entries"""
@@ -140,7 +157,7 @@ class FilterSeen(object):
             log.debug("Learned '%s' (field: %s, local: %d)" % (entry[field], field, local))
         # Only add the entry to the session if it has one of the required fields
         if se.fields:
-            task.session.add(se)
+            db_writer.add(task, [se])
 
     def forget(self, task, title):
         """Forget SeenEntry with :title:. Return True if forgotten."""
@@ -52,7 +52,7 @@ def series_details(show, begin=False, latest=False):
     if begin:
         series_dict['begin_episode'] = show.begin.to_dict() if show.begin else None
     if latest:
-        latest_entity = db.get_latest_release(show)
+        latest_entity = show.latest_entity
         series_dict['latest_entity'] = latest_entity.to_dict() if latest_entity else None
         if latest_entity:
             series_dict['latest_entity']['latest_release'] = latest_entity.latest_release.to_dict()
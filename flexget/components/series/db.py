@@ -6,6 +6,8 @@ import re
 from datetime import datetime, timedelta
 from functools import total_ordering
 
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy import inspect
 from sqlalchemy import (
     Column,
     Integer,
@@ -24,7 +26,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.hybrid import hybrid_property, Comparator
-from sqlalchemy.orm import relation, backref
+from sqlalchemy.orm import relation, backref, contains_eager, joinedload
 
 from flexget import db_schema, plugin
 from flexget.components.series.utils import normalize_series_name
@@ -39,9 +41,9 @@ from flexget.utils.sqlalchemy_utils import (
     table_schema,
     create_index,
 )
-from flexget.utils.tools import parse_episode_identifier
+from flexget.utils.tools import chunked, parse_episode_identifier
 
-SCHEMA_VER = 14
+SCHEMA_VER = 15
 log = logging.getLogger('series.db')
 Base = db_schema.versioned_base('series', SCHEMA_VER)
 
@@ -94,6 +96,13 @@ class Series(Base):
 
     seasons = relation('Season', backref='series', cascade='all, delete, delete-orphan')
 
+    summary = relation(
+        'SeriesSummary',
+        uselist=False,
+        backref=backref('series', uselist=False),
+        cascade='all, delete, delete-orphan',
+    )
+
     # Make a special property that does indexed case insensitive lookups on name, but stores/returns specified case
     @hybrid_property
     def name(self):
@@ -131,6 +140,13 @@ class Series(Base):
     def completed_seasons(self):
         return [season.season for season in self.seasons if season.completed]
 
+    @property
+    def latest_entity(self):
+        """Latest downloaded episode or season pack, taken from the summary once it has been created"""
+        if self.summary:
+            return self.summary.latest
+        return get_latest_release(self)
+
 
 class Season(Base):
     __tablename__ = 'series_seasons'
@@ -562,6 +578,50 @@ class SeriesTask(Base):
         self.name = name
 
 
+class SeriesSummary(Base):
+    """
+    Precalculated state of a series, used for listing series without aggregating over all their episodes.
+    Updated whenever a session changing the series is committed.
+    """
+
+    __tablename__ = 'series_summary'
+
+    series_id = Column(Integer, ForeignKey('series.id'), primary_key=True)
+    latest_episode_id = Column(Integer, ForeignKey('series_episodes.id'))
+    latest_season_id = Column(Integer, ForeignKey('series_seasons.id'))
+    # Number of episodes or seasons seen after the latest downloaded one
+    behind = Column(Integer, default=0)
+    episodes = Column(Integer, default=0)
+    # Highest season and episode number downloaded
+    max_season = Column(Integer)
+    max_number = Column(Integer)
+    # When the newest episode release was seen
+    last_seen = Column(DateTime)
+    tasks = Column(Integer, default=0)
+
+    latest_episode = relation('Episode', foreign_keys=[latest_episode_id])
+    latest_season = relation('Season', foreign_keys=[latest_season_id])
+
+    @property
+    def latest(self):
+        return self.latest_episode or self.latest_season
+
+    @property
+    def behind_entities(self):
+        """:return: Tuple of the number of entities after the latest one, and their type"""
+        return self.behind, 'seasons' if self.latest_season else 'eps'
+
+    def __str__(self):
+        return '<SeriesSummary(series_id=%s,latest_episode=%s,latest_season=%s)>' % (
+            self.series_id,
+            self.latest_episode_id,
+            self.latest_season_id,
+        )
+
+    def __repr__(self):
+        return str(self).encode('ascii', 'replace')
+
+
 Index('episode_series_identifier', Episode.series_id, Episode.identifier)
 
 
@@ -722,27 +782,36 @@ def upgrade(ver, session):
         # New season_releases table, added by "create_all"
         log.info('Adding season_releases table')
         ver = 14
+    if ver == 14:
+        # New series_summary table, added by "create_all"
+        log.info('Creating series summaries')
+        update_series_summary(session)
+        ver = 15
     return ver
 
 
 @event('manager.db_cleanup')
 def db_cleanup(manager, session):
     # Clean up old undownloaded releases
-    result = (
+    old_releases = (
         session.query(EpisodeRelease)
         .filter(EpisodeRelease.downloaded == False)
         .filter(EpisodeRelease.first_seen < datetime.now() - timedelta(days=120))
-        .delete(False)
     )
+    changed = old_releases.join(EpisodeRelease.episode).with_entities(Episode.series_id)
+    outdate_summaries(session, [row.series_id for row in changed.distinct()])
+    result = old_releases.delete(False)
     if result:
         log.verbose('Removed %d undownloaded episode releases.', result)
     # Clean up episodes without releases
-    result = (
+    empty_episodes = (
         session.query(Episode)
         .filter(~Episode.releases.any())
         .filter(~Episode.begins_series.any())
-        .delete(False)
     )
+    changed = empty_episodes.with_entities(Episode.series_id)
+    outdate_summaries(session, [row.series_id for row in changed.distinct()])
+    result = empty_episodes.delete(False)
     if result:
         log.verbose('Removed %d episodes without releases.', result)
     # Clean up series without episodes that aren't in any tasks
@@ -754,6 +823,9 @@ def db_cleanup(manager, session):
     )
     if result:
         log.verbose('Removed %d series without episodes.', result)
+        session.query(SeriesSummary).filter(
+            ~SeriesSummary.series_id.in_(select([Series.id]))
+        ).delete(False)
 
 
 def set_alt_names(alt_names, db_series, session):
@@ -935,32 +1007,136 @@ def get_series_summary(
         raise LookupError(
             '"configured" parameter must be either "configured", "unconfigured", or "all"'
         )
-    query = session.query(Series)
-    query = (
-        query.outerjoin(Series.episodes)
-        .outerjoin(Episode.releases)
-        .outerjoin(Series.in_tasks)
-        .group_by(Series.id)
-    )
+    query = session.query(Series).join(Series.summary)
     if configured == 'configured':
-        query = query.having(func.count(SeriesTask.id) >= 1)
+        query = query.filter(SeriesSummary.tasks >= 1)
     elif configured == 'unconfigured':
-        query = query.having(func.count(SeriesTask.id) < 1)
+        query = query.filter(SeriesSummary.tasks < 1)
     if name:
         query = query.filter(Series._name_normalized.contains(name))
     if premieres:
-        query = (
-            query.having(func.max(Episode.season) <= 1).having(func.max(Episode.number) <= 2)
-        ).filter(EpisodeRelease.downloaded == True)
+        query = query.filter(SeriesSummary.max_season <= 1).filter(SeriesSummary.max_number <= 2)
     if count:
-        return query.group_by(Series).count()
+        return query.count()
     if sort_by == 'show_name':
         order_by = Series.name
     else:
-        order_by = func.max(EpisodeRelease.first_seen)
+        order_by = SeriesSummary.last_seen
     query = query.order_by(desc(order_by)) if descending else query.order_by(order_by)
+    summary = contains_eager(Series.summary)
+    query = query.options(
+        summary.joinedload(SeriesSummary.latest_episode).joinedload(Episode.releases),
+        summary.joinedload(SeriesSummary.latest_season).joinedload(Season.releases),
+        joinedload(Series.begin),
+        joinedload(Series.in_tasks),
+        joinedload(Series.alternate_names),
+    )
+
+    return query.slice(start, stop)
+
+
+def outdate_summaries(session, series_ids):
+    """
+    Mark the summaries of `series_ids` outdated, they are updated when `session` is committed.
+    Changes done through the ORM are noticed automatically, this is needed after bulk updates and deletes.
+    """
+    session.info.setdefault('outdated_series', set()).update(series_ids)
+
 
-    return query.slice(start, stop).from_self()
+def _grouped(query, column, ids):
+    """Map values of `column` to the rest of the columns of the grouped `query`"""
+    query = query.group_by(column)
+    if ids is not None:
+        query = query.filter(column.in_(ids))
+    return dict((row[0], row[1:]) for row in query)
+
+
+def update_series_summary(session, series_ids=None):
+    """
+    Recalculate the summaries of `series_ids`, or of all series when not given.
+    """
+    query = session.query(Series).options(joinedload(Series.summary))
+    batches = [None] if series_ids is None else chunked(sorted(series_ids), 500)
+    for ids in batches:
+        series_list = query.filter(Series.id.in_(ids)).all() if ids else query.all()
+        episodes = _grouped(
+            session.query(Episode.series_id, func.count(Episode.id)), Episode.series_id, ids
+        )
+        downloaded = _grouped(
+            session.query(Episode.series_id, func.max(Episode.season), func.max(Episode.number))
+            .join(Episode.releases)
+            .filter(EpisodeRelease.downloaded == True),
+            Episode.series_id,
+            ids,
+        )
+        last_seen = _grouped(
+            session.query(Episode.series_id, func.max(EpisodeRelease.first_seen)).join(
+                Episode.releases
+            ),
+            Episode.series_id,
+            ids,
+        )
+        tasks = _grouped(
+            session.query(SeriesTask.series_id, func.count(SeriesTask.id)),
+            SeriesTask.series_id,
+            ids,
+        )
+        for series in series_list:
+            summary = series.summary or SeriesSummary()
+            latest = get_latest_release(series)
+            summary.latest_episode = latest if latest and not latest.is_season else None
+            summary.latest_season = latest if latest and latest.is_season else None
+            summary.behind = new_entities_after(latest)[0] if latest else 0
+            summary.episodes = episodes.get(series.id, (0,))[0]
+            summary.max_season, summary.max_number = downloaded.get(series.id, (None, None))
+            summary.last_seen = last_seen.get(series.id, (None,))[0]
+            summary.tasks = tasks.get(series.id, (0,))[0]
+            series.summary = summary
+    log.debug('updated summary of %s series', len(series_ids) if series_ids else 'all')
+
+
+@sqlalchemy_event.listens_for(Session, 'after_flush')
+def collect_changed_series(session, flush_context):
+    series_ids = set()
+    episode_ids = set()
+    season_ids = set()
+    for obj in session.new | session.dirty | session.deleted:
+        if isinstance(obj, Series):
+            # Latest episode depends on identified_by
+            if obj not in session.deleted and (
+                obj in session.new or inspect(obj).attrs.identified_by.history.has_changes()
+            ):
+                series_ids.add(obj.id)
+        elif isinstance(obj, (Episode, Season, SeriesTask)):
+            series_ids.add(obj.series_id)
+        elif isinstance(obj, EpisodeRelease):
+            episode_ids.add(obj.episode_id)
+        elif isinstance(obj, SeasonRelease):
+            season_ids.add(obj.season_id)
+    # Entities deleted in this flush are not found anymore, but their own deletion was collected above
+    for table, ids in ((Episode, episode_ids), (Season, season_ids)):
+        for chunk in chunked(list(ids)):
+            series_ids.update(
+                row.series_id
+                for row in session.query(table.series_id).filter(table.id.in_(chunk)).distinct()
+            )
+    series_ids.discard(None)
+    if series_ids:
+        outdate_summaries(session, series_ids)
+
+
+@sqlalchemy_event.listens_for(Session, 'before_commit')
+def update_outdated_summaries(session):
+    # Pending changes are only flushed after this event, do it now to get all of them collected
+    session.flush()
+    series_ids = session.info.pop('outdated_series', None)
+    if series_ids:
+        update_series_summary(session, series_ids)
+
+
+@sqlalchemy_event.listens_for(Session, 'after_soft_rollback')
+def discard_outdated_summaries(session, previous_transaction):
+    session.info.pop('outdated_series', None)
 
 
 def auto_identified_by(series):
@@ -1434,10 +1610,7 @@ def store_parser(session, parser, series=None, quality=None):
             )
             if not season:
                 log.debug('adding season `%s` into series `%s`', identifier, parser.name)
-                season = Season()
-                season.identifier = identifier
-                season.identified_by = parser.id_type
-                season.season = parser.season
+                season = _new_season(parser, identifier)
                 series.seasons.append(season)
                 log.debug('-> added season `%s`', season)
             session.flush()
@@ -1459,16 +1632,7 @@ def store_parser(session, parser, series=None, quality=None):
             )
             if not episode:
                 log.debug('adding episode `%s` into series `%s`', identifier, parser.name)
-                episode = Episode()
-                episode.identifier = identifier
-                episode.identified_by = parser.id_type
-                # if episodic format
-                if parser.id_type == 'ep':
-                    episode.season = parser.season
-                    episode.number = parser.episode + ix
-                elif parser.id_type == 'sequence':
-                    episode.season = 0
-                    episode.number = parser.id + ix
+                episode = _new_episode(parser, identifier, ix)
                 series.episodes.append(episode)  # pylint:disable=E1103
                 log.debug('-> added `%s`', episode)
             session.flush()
@@ -1497,10 +1661,7 @@ def store_parser(session, parser, series=None, quality=None):
         )
         if not release:
             log.debug('adding release `%s`', parser)
-            release = table()
-            release.quality = quality
-            release.proper_count = parser.proper_count
-            release.title = parser.data
+            release = _new_release(table, parser, quality)
             entity.releases.append(release)  # pylint:disable=E1103
             log.debug('-> added `%s`', release)
         releases.append(release)
@@ -1508,6 +1669,153 @@ def store_parser(session, parser, series=None, quality=None):
     return releases
 
 
+def _new_season(parser, identifier):
+    season = Season()
+    season.identifier = identifier
+    season.identified_by = parser.id_type
+    season.season = parser.season
+    return season
+
+
+def _new_episode(parser, identifier, ix):
+    episode = Episode()
+    episode.identifier = identifier
+    episode.identified_by = parser.id_type
+    # if episodic format
+    if parser.id_type == 'ep':
+        episode.season = parser.season
+        episode.number = parser.episode + ix
+    elif parser.id_type == 'sequence':
+        episode.season = 0
+        episode.number = parser.id + ix
+    return episode
+
+
+def _new_release(table, parser, quality):
+    release = table()
+    release.quality = quality
+    release.proper_count = parser.proper_count
+    release.title = parser.data
+    return release
+
+
+def _query_chunked(query, column, values, other_column, other_values):
+    """Yields results of `query` filtered by both `column` and `other_column` having one of the given values."""
+    values, other_values = list(values), list(other_values)
+    for chunk in chunked(values, 400):
+        for other_chunk in chunked(other_values, 400):
+            for result in query.filter(column.in_(chunk)).filter(other_column.in_(other_chunk)):
+                yield result
+
+
+def store_parsers(session, items):
+    """
+    Push series information of many parsers into database at once. This does the same as calling
+    :func:`store_parser` for each of them, but looks up the existing episodes, seasons and releases with a few set
+    based queries, and adds the missing ones in one go.
+
+    :param session: Database session to use
+    :param items: List of (series, parser, quality) tuples. Series must already be in the database. If quality is
+        not None, it overrides the quality from the series parser.
+    :return: List containing the list of releases for each item
+    """
+    # entity keys of each item, (is_season, series_id, season, identifier, ix)
+    item_keys = []
+    for series, parser, quality in items:
+        is_season = bool(parser.season_pack)
+        season = parser.season if is_season else None
+        item_keys.append(
+            [
+                (is_season, series.id, season, identifier, ix)
+                for ix, identifier in enumerate(parser.identifiers)
+            ]
+        )
+    all_keys = [key for keys in item_keys for key in keys]
+
+    # (is_season, series_id, season, identifier) -> Season or Episode
+    entities = {}
+    for is_season, table in ((False, Episode), (True, Season)):
+        keys = [key for key in all_keys if key[0] == is_season]
+        if not keys:
+            continue
+        for entity in _query_chunked(
+            session.query(table),
+            table.series_id,
+            set(key[1] for key in keys),
+            table.identifier,
+            set(key[3] for key in keys),
+        ):
+            season = entity.season if is_season else None
+            entities.setdefault((is_season, entity.series_id, season, entity.identifier), entity)
+
+    # add missing episodes and seasons
+    for (series, parser, quality), keys in zip(items, item_keys):
+        for is_season, series_id, season, identifier, ix in keys:
+            if (is_season, series_id, season, identifier) in entities:
+                continue
+            if is_season:
+                log.debug('adding season `%s` into series `%s`', identifier, parser.name)
+                entity = _new_season(parser, identifier)
+            else:
+                log.debug('adding episode `%s` into series `%s`', identifier, parser.name)
+                entity = _new_episode(parser, identifier, ix)
+            entity.series = series
+            session.add(entity)
+            log.debug('-> added `%s`', entity)
+            entities[(is_season, series_id, season, identifier)] = entity
+    session.flush()
+
+    # (is_season, entity_id, title, quality, proper_count) -> Release
+    releases = {}
+    for is_season, table, entity_column in (
+        (False, EpisodeRelease, EpisodeRelease.episode_id),
+        (True, SeasonRelease, SeasonRelease.season_id),
+    ):
+        entity_ids = set(entity.id for key, entity in entities.items() if key[0] == is_season)
+        titles = set(
+            parser.data for series, parser, quality in items if bool(parser.season_pack) == is_season
+        )
+        if not entity_ids or not titles:
+            continue
+        for release in _query_chunked(
+            session.query(table), entity_column, entity_ids, table.title, titles
+        ):
+            key = (
+                is_season,
+                getattr(release, entity_column.key),
+                release.title,
+                release._quality,
+                release.proper_count,
+            )
+            releases.setdefault(key, release)
+
+    # add missing releases
+    result = []
+    for (series, parser, quality), keys in zip(items, item_keys):
+        if quality is None:
+            quality = parser.quality
+        item_releases = []
+        for is_season, series_id, season, identifier, ix in keys:
+            entity = entities[(is_season, series_id, season, identifier)]
+            key = (is_season, entity.id, parser.data, quality.name, parser.proper_count)
+            release = releases.get(key)
+            if not release:
+                log.debug('adding release `%s`', parser)
+                if is_season:
+                    release = _new_release(SeasonRelease, parser, quality)
+                    release.season = entity
+                else:
+                    release = _new_release(EpisodeRelease, parser, quality)
+                    release.episode = entity
+                session.add(release)
+                log.debug('-> added `%s`', release)
+                releases[key] = release
+            item_releases.append(release)
+        result.append(item_releases)
+    session.flush()  # Make sure autonumber ids are populated
+    return result
+
+
 def add_series_entity(session, series, identifier, quality=None):
     """
     Adds entity identified by `identifier` to series `name` in database.
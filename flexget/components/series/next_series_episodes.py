@@ -39,7 +39,9 @@ class NextSeriesEpisodes(object):
     }
 
     def __init__(self):
-        self.rerun_entries = []
+        # Entries to search for on the next rerun, and the config, of each running task by name
+        self.rerun_entries = {}
+        self.configs = {}
 
     def ep_identifiers(self, season, episode):
         return ['S%02dE%02d' % (season, episode), '%dx%02d' % (season, episode)]
@@ -91,19 +93,18 @@ class NextSeriesEpisodes(object):
             )
         return entry
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         if not config:
             return
         if isinstance(config, bool):
             config = {}
-        self.config = config
+        self.configs[task.name] = config
         if task.is_rerun:
             # Just return calculated next eps on reruns
-            entries = self.rerun_entries
-            self.rerun_entries = []
-            return entries
+            return self.rerun_entries.pop(task.name, [])
         else:
-            self.rerun_entries = []
+            self.rerun_entries[task.name] = []
 
         entries = []
         impossible = {}
@@ -264,7 +265,7 @@ class NextSeriesEpisodes(object):
                     '%s %s was accepted, rerunning to look for next ep.'
                     % (entry['series_name'], entry['series_id'])
                 )
-                self.rerun_entries.append(
+                self.rerun_entries.setdefault(task.name, []).append(
                     self.search_entry(
                         series, entry['series_season'], entry['series_episode'] + 1, task
                     )
@@ -282,7 +283,7 @@ class NextSeriesEpisodes(object):
                     # A season pack was picked up in the task, no need to look for more episodes
                     return
                 elif (
-                    not self.config.get('only_same_season')
+                    not self.configs[task.name].get('only_same_season')
                     and identified_by == 'ep'
                     and (
                         entry['series_season'] == latest.season
@@ -290,7 +291,7 @@ class NextSeriesEpisodes(object):
                     )
                 ):
                     # We searched for next predicted episode of this season unsuccessfully, try the next season
-                    self.rerun_entries.append(
+                    self.rerun_entries.setdefault(task.name, []).append(
                         self.search_entry(series, latest.season + 1, 1, task)
                     )
                     log.debug(
@@ -41,7 +41,8 @@ class NextSeriesSeasons(object):
     }
 
     def __init__(self):
-        self.rerun_entries = []
+        # Entries to search for on the next rerun of each running task, by task name
+        self.rerun_entries = {}
 
     def season_identifiers(self, season):
         return ['S%02d' % season]
@@ -74,6 +75,7 @@ class NextSeriesSeasons(object):
             )
         return entry
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         if not config:
             return
@@ -82,11 +84,9 @@ class NextSeriesSeasons(object):
 
         if task.is_rerun:
             # Just return calculated next eps on reruns
-            entries = self.rerun_entries
-            self.rerun_entries = []
-            return entries
+            return self.rerun_entries.pop(task.name, [])
         else:
-            self.rerun_entries = []
+            self.rerun_entries[task.name] = []
 
         threshold = config.get('threshold')
 
@@ -235,12 +235,11 @@ class NextSeriesSeasons(object):
                         entry['series_name'],
                         entry['series_id'],
                     )
+                    rerun_entries = self.rerun_entries.setdefault(task.name, [])
                     if not any(
-                        e.get('series_season') == latest.season + 1 for e in self.rerun_entries
+                        e.get('series_season') == latest.season + 1 for e in rerun_entries
                     ):
-                        self.rerun_entries.append(
-                            self.search_entry(series, latest.season + 1, task)
-                        )
+                        rerun_entries.append(self.search_entry(series, latest.season + 1, task))
                     # Increase rerun limit by one if we have matches, this way
                     # we keep searching as long as matches are found!
                     # TODO: this should ideally be in discover so it would be more generic
@@ -6,7 +6,7 @@ import logging
 import sys
 import time
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from copy import copy
 from datetime import datetime
 
@@ -15,7 +15,7 @@ from sqlalchemy.orm import object_session, joinedload
 
 from flexget import options
 from flexget import plugin
-from .utils import normalize_series_name
+from .utils import normalize_series_name, SeriesNameIndex
 from flexget.config_schema import one_or_more
 from flexget.event import event
 from flexget.manager import Session
@@ -69,6 +69,8 @@ def clean_series(manager):
         removed_tasks = session.query(db.SeriesTask)
         if manager.tasks:
             removed_tasks = removed_tasks.filter(not_(db.SeriesTask.name.in_(manager.tasks)))
+        changed = removed_tasks.with_entities(db.SeriesTask.series_id).distinct()
+        db.outdate_summaries(session, [row.series_id for row in changed])
         deleted = removed_tasks.delete(synchronize_session=False)
         if deleted:
             session.commit()
@@ -396,21 +398,21 @@ class FilterSeries(FilterSeriesBase):
         config = self.prepare_config(config)
         self.auto_exact(config)
 
-        parser = plugin.get('parsing', self)
-
         start_time = preferred_clock()
 
-        # Sort Entries into data model similar to https://en.wikipedia.org/wiki/Trie
-        # Only process series if both the entry title and series title first letter match
+        # Only parse entries with the series their title could belong to
+        index = SeriesNameIndex()
+        for position, series_item in enumerate(config):
+            series_name, series_config = list(series_item.items())[0]
+            index.add(
+                position,
+                [series_name] + get_config_as_array(series_config, 'alternate_name'),
+                get_config_as_array(series_config, 'name_regexp'),
+            )
         entries_map = defaultdict(list)
         for entry in task.entries:
-            parsed = parser.parse_series(entry['title'])
-            if parsed.name:
-                entries_map[parsed.name[:1].lower()].append(entry)
-            else:
-                # If parsing failed, use first char of each word in the entry title
-                for word in entry['title'].replace(' ', '.').split('.'):
-                    entries_map[word[:1].lower()].append(entry)
+            for position in index.candidates(entry['title']):
+                entries_map[position].append(entry)
 
         with Session() as session:
             # Preload series
@@ -435,21 +437,14 @@ class FilterSeries(FilterSeriesBase):
 
             existing_db_series = {s.name_normalized: s for s in existing_db_series}
 
-            for series_item in config:
+            for position, series_item in enumerate(config):
+                entries = entries_map.get(position)
+                if not entries:
+                    continue
                 series_name, series_config = list(series_item.items())[0]
-                alt_names = get_config_as_array(series_config, 'alternate_name')
                 db_series = existing_db_series.get(normalize_series_name(series_name))
                 db_identified_by = db_series.identified_by if db_series else None
-                letters = set(
-                    [series_name[:1].lower()]
-                    + [normalize_series_name(series_name)[:1].lower()]
-                    + [alt[:1].lower() for alt in alt_names]
-                )
-                entries = set(
-                    [entry for letter in letters for entry in entries_map.get(letter, [])]
-                )
-                if entries:
-                    self.parse_series(entries, series_name, series_config, db_identified_by)
+                self.parse_series(entries, series_name, series_config, db_identified_by)
 
         log.debug('series on_task_metainfo took %s to parse', preferred_clock() - start_time)
 
@@ -469,7 +464,9 @@ class FilterSeries(FilterSeriesBase):
             ):
                 found_series.setdefault(entry['series_name'], []).append(entry)
 
-        # Prefetch series
+        start_time = preferred_clock()
+        # series name -> (series id, series config) of the series which are processed
+        process = OrderedDict()
         with Session() as session:
             # str() added to make sure number shows (e.g. 24) are turned into strings
             series_names = [str(list(s.keys())[0]) for s in config]
@@ -480,12 +477,9 @@ class FilterSeries(FilterSeriesBase):
                 .all()
             )
             existing_series_map = dict([(s.name_normalized, s) for s in existing_series])
-            # Expunge so we can work on de-attached while processing the series to minimize db locks
-            session.expunge_all()
 
-        start_time = preferred_clock()
-        for series_item in config:
-            with Session() as session:
+            store_items = []
+            for series_item in config:
                 series_name, series_config = list(series_item.items())[0]
 
                 if series_config.get('parse_only'):
@@ -511,35 +505,49 @@ class FilterSeries(FilterSeriesBase):
                     for alt in alts:
                         db._add_alt_name(alt, db_series, series_name, session)
                     existing_series_map[db_series.name_normalized] = db_series
-                else:
-                    # Add existing series back to session
-                    session.add(db_series)
 
                 # Skip if series not within entries
-                if series_name not in found_series:
+                if series_name not in found_series or series_name in process:
                     continue
+                process[series_name] = (db_series.id, series_config)
+                for entry in found_series[series_name]:
+                    store_items.append((db_series, entry['series_parser'], entry.get('quality')))
+
+            # store found episodes of all series into database at once, and save reference for later use
+            entries = [entry for series_name in process for entry in found_series[series_name]]
+            for entry, releases in zip(entries, db.store_parsers(session, store_items)):
+                entry['series_releases'] = [r.id for r in releases]
+        log.debug('storing series releases took %s', preferred_clock() - start_time)
 
+        for series_name, (series_id, series_config) in process.items():
+            # Separate session for each series to minimize db locks
+            with Session() as session:
+                db_series = session.query(db.Series).get(series_id)
+                # Load the episodes and seasons of all the entries, with their first releases
+                entities = {}
+                for is_season, table, entity in (
+                    (False, db.EpisodeRelease, 'episode'),
+                    (True, db.SeasonRelease, 'season'),
+                ):
+                    release_ids = [
+                        entry['series_releases'][0]
+                        for entry in found_series[series_name]
+                        if bool(entry['series_parser'].season_pack) == is_season
+                    ]
+                    if not release_ids:
+                        continue
+                    for release in (
+                        session.query(table)
+                        .filter(table.id.in_(release_ids))
+                        .options(joinedload(entity))
+                    ):
+                        entities[(is_season, release.id)] = getattr(release, entity)
                 series_entries = {}
                 for entry in found_series[series_name]:
-                    # store found episodes into database and save reference for later use
-                    releases = db.store_parser(
-                        session,
-                        entry['series_parser'],
-                        series=db_series,
-                        quality=entry.get('quality'),
-                    )
-                    entry['series_releases'] = [r.id for r in releases]
-                    if hasattr(releases[0], 'episode'):
-                        entity = releases[0].episode
-                    else:
-                        entity = releases[0].season
+                    is_season = bool(entry['series_parser'].season_pack)
+                    entity = entities[(is_season, entry['series_releases'][0])]
                     series_entries.setdefault(entity, []).append(entry)
 
-                # If we didn't find any episodes for this series, continue
-                if not series_entries:
-                    log.trace('No entries found for `%s` this run.', series_name)
-                    continue
-
                 # configuration always overrides everything
                 if series_config.get('identified_by', 'auto') != 'auto':
                     db_series.identified_by = series_config['identified_by']
@@ -586,18 +594,22 @@ class FilterSeries(FilterSeriesBase):
         for id_type in plugin_parser_common.SERIES_ID_TYPES:
             params[id_type + '_regexps'] = get_config_as_array(config, id_type + '_regexp')
 
-        parser = plugin.get('parsing', self)
-        for entry in entries:
-            # skip processed entries
-            if (
+        # skip processed entries
+        entries = [
+            entry
+            for entry in entries
+            if not (
                 entry.get('series_parser')
                 and entry['series_parser'].valid
                 and entry['series_parser'].name.lower() != series_name.lower()
-            ):
-                continue
-
-            # Quality field may have been manipulated by e.g. assume_quality. Use quality field from entry if available.
-            parsed = parser.parse_series(entry['title'], name=series_name, **params)
+            )
+        ]
+        # Quality field may have been manipulated by e.g. assume_quality.
+        # Use quality field from entry if available.
+        results = plugin.get('parsing', self).parse_series_many(
+            [entry['title'] for entry in entries], name=series_name, **params
+        )
+        for entry, parsed in zip(entries, results):
             if not parsed.valid:
                 continue
             parsed.field = 'title'
@@ -1063,12 +1075,17 @@ class FilterSeries(FilterSeriesBase):
                             .filter(db.SeasonRelease.id.in_(entry['series_releases']))
                             .update({'downloaded': True}, synchronize_session=False)
                         )
+                        changed = session.query(db.Season.series_id).join(db.Season.releases)
+                        changed = changed.filter(db.SeasonRelease.id.in_(entry['series_releases']))
                     else:
                         ep_num = (
                             session.query(db.EpisodeRelease)
                             .filter(db.EpisodeRelease.id.in_(entry['series_releases']))
                             .update({'downloaded': True}, synchronize_session=False)
                         )
+                        changed = session.query(db.Episode.series_id).join(db.Episode.releases)
+                        changed = changed.filter(db.EpisodeRelease.id.in_(entry['series_releases']))
+                    db.outdate_summaries(session, [row.series_id for row in changed.distinct()])
 
                 log.debug(
                     'marking %s episode releases and %s season releases as downloaded for `%s`',
@@ -1093,7 +1110,9 @@ class SeriesDBManager(FilterSeriesBase):
         with Session() as session:
             add_series_tasks = {}
 
-            session.query(db.SeriesTask).filter(db.SeriesTask.name == task.name).delete()
+            task_series = session.query(db.SeriesTask).filter(db.SeriesTask.name == task.name)
+            db.outdate_summaries(session, [series_task.series_id for series_task in task_series])
+            task_series.delete()
             if not task.config.get('series'):
                 return
             config = self.prepare_config(task.config['series'])
@@ -1159,6 +1178,7 @@ class SeriesDBManager(FilterSeriesBase):
 
             if add_series_tasks:
                 session.bulk_save_objects(add_series_tasks.values())
+                db.outdate_summaries(session, add_series_tasks)
 
 
 @event('plugin.register')
@@ -1,5 +1,7 @@
 from __future__ import unicode_literals
 
+import re
+from collections import defaultdict
 
 TRANSLATE_MAP = {ord(u'&'): u' and '}
 for char in u'\'\\':
@@ -15,3 +17,46 @@ def normalize_series_name(name):
     name = name.translate(TRANSLATE_MAP)  # Replaced some symbols with spaces
     name = u' '.join(name.split())
     return name
+
+
+class SeriesNameIndex(object):
+    """
+    Index of series names, finding the series a title could belong to without running the parser.
+
+    The series parser only matches titles starting with the series name, after an optional ignored
+    prefix. So the first word of the name is always found at the start of a word in the title.
+    The index returns every such series. Series with custom name regexps are always returned.
+    """
+
+    # Same blanks as the regexps generated from series names
+    blank_re = re.compile(r'(?:[^\w&]|_)+', re.UNICODE)
+
+    def __init__(self):
+        self._by_word = defaultdict(set)
+        self._always = set()
+        self._longest = 0
+
+    def words(self, text):
+        return [word for word in self.blank_re.split(text.lower()) if word]
+
+    def add(self, key, names, name_regexps=None):
+        """
+        :param key: Returned by :meth:`candidates` for titles that could belong to the series
+        :param names: Name and alternate names of the series
+        :param name_regexps: Custom name regexps of the series, if any
+        """
+        first_words = [(self.words(name) or [''])[0] for name in names]
+        if name_regexps or not all(first_words):
+            self._always.add(key)
+            return
+        for word in first_words:
+            self._by_word[word].add(key)
+            self._longest = max(self._longest, len(word))
+
+    def candidates(self, title):
+        """:return: Set of keys of the series `title` could belong to"""
+        keys = set(self._always)
+        for word in self.words(title):
+            for end in range(1, min(len(word), self._longest) + 1):
+                keys.update(self._by_word.get(word[:end], ()))
+        return keys
@@ -7,6 +7,7 @@ from datetime import timedelta
 from flexget import plugin
 from flexget.event import event
 from flexget.manager import Session
+from flexget.utils import db_writer
 from . import db
 
 log = logging.getLogger('status')
@@ -18,7 +19,8 @@ class Status(object):
     schema = {'type': 'boolean'}
 
     def __init__(self):
-        self.execution = None
+        # Executions of the running tasks by task name, tasks may run concurrently
+        self.executions = {}
 
     def on_task_start(self, task, config):
         with Session() as session:
@@ -29,33 +31,39 @@ class Status(object):
                 st.name = task.name
                 session.add(st)
 
-        self.execution = db.TaskExecution()
-        self.execution.start = datetime.datetime.now()
-        self.execution.task = st
+        execution = self.executions[task.name] = db.TaskExecution()
+        execution.start = datetime.datetime.now()
+        execution.task = st
 
     @plugin.priority(plugin.PRIORITY_LAST)
     def on_task_input(self, task, config):
-        self.execution.produced = len(task.entries)
+        self.executions[task.name].produced = len(task.entries)
 
     @plugin.priority(plugin.PRIORITY_LAST)
     def on_task_output(self, task, config):
-        self.execution.accepted = len(task.accepted)
-        self.execution.rejected = len(task.rejected)
-        self.execution.failed = len(task.failed)
+        execution = self.executions[task.name]
+        execution.accepted = len(task.accepted)
+        execution.rejected = len(task.rejected)
+        execution.failed = len(task.failed)
 
     def on_task_exit(self, task, config):
-        with Session() as session:
-            if self.execution is None:
-                return
-            if task.aborted:
-                self.execution.succeeded = False
-                self.execution.abort_reason = task.abort_reason
-            self.execution.end = datetime.datetime.now()
-            session.merge(self.execution)
+        # Kept for reruns, which do not run the start phase again
+        execution = self.executions.get(task.name)
+        if execution is None:
+            return
+        if task.aborted:
+            execution.succeeded = False
+            execution.abort_reason = task.abort_reason
+        execution.end = datetime.datetime.now()
+        db_writer.write(task, save_execution, (execution,))
 
     on_task_abort = on_task_exit
 
 
+def save_execution(session, execution):
+    session.merge(execution)
+
+
 @event('manager.db_cleanup')
 def db_cleanup(manager, session):
     # Purge all status data for non existing tasks
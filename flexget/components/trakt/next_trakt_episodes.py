@@ -54,6 +54,7 @@ class NextTraktEpisodes(object):
         'additionalProperties': False,
     }
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         if config.get('account') and not config.get('username'):
             config['username'] = 'me'
@@ -47,6 +47,16 @@ def set_flexget_db_version(manager=None):
             log.debug('current flexget version already exist in db %s', db_version.version)
 
 
+@event('plugin.lazy_loaded')
+def create_lazy_loaded_tables(module_names):
+    """Plugins loaded on demand after the database was initialized may define new tables."""
+    from flexget.manager import manager
+
+    if manager and manager.engine:
+        # doesn't do anything to existing tables
+        Base.metadata.create_all(bind=manager.engine)
+
+
 def get_flexget_db_version():
     with Session() as session:
         version = session.query(FlexgetVersion).first()
@@ -5,12 +5,50 @@ from future.utils import PY2, native_str, text_type
 import copy
 import functools
 import logging
+import weakref
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 
+from flexget.logger import Tracer
 from flexget.plugin import PluginError
 from flexget.utils.lazy_dict import LazyDict, LazyLookup
 from flexget.utils.template import render_from_entry, FlexGetTemplate
 
 log = logging.getLogger('entry')
+tracer = Tracer('entry', log)
+
+# Field values of these types can be shared between an entry and its copies and snapshots
+IMMUTABLE_TYPES = frozenset(
+    [
+        text_type,
+        native_str,
+        bytes,
+        bool,
+        type(0),
+        type(2 ** 64),
+        float,
+        complex,
+        type(None),
+        datetime,
+        date,
+        time,
+        timedelta,
+        Decimal,
+    ]
+)
+
+
+def is_immutable(value):
+    """
+    :return: True if `value` can never change, so it does not need to be copied.
+    :rtype: bool
+    """
+    value_type = type(value)
+    if value_type in IMMUTABLE_TYPES:
+        return True
+    if value_type in (tuple, frozenset):
+        return all(is_immutable(item) for item in value)
+    return False
 
 
 class EntryUnicodeError(Exception):
@@ -40,8 +78,12 @@ class Entry(LazyDict):
 
     def __init__(self, *args, **kwargs):
         super(Entry, self).__init__()
+        # Fields which were last set to an immutable value, these are shared with copies and snapshots
+        self._immutable_fields = set()
         self.traces = []
         self.snapshots = {}
+        # Weak references to the containers indexing this entry by state
+        self._containers = []
         self._state = 'undecided'
         self._hooks = {'accept': [], 'reject': [], 'fail': [], 'complete': []}
         self.task = None
@@ -164,6 +206,46 @@ class Entry(LazyDict):
         # Run entry on_complete hooks
         self.run_hooks('complete', **kwargs)
 
+    @property
+    def _state(self):
+        return self._current_state
+
+    @_state.setter
+    def _state(self, state):
+        old_state = getattr(self, '_current_state', None)
+        self._current_state = state
+        for ref in self._containers:
+            container = ref()
+            if container is not None:
+                container._entry_state_changed(self, old_state, state)
+
+    def _add_container(self, container):
+        """Registers an :class:`~flexget.task.EntryContainer` to be notified when the state of this entry changes."""
+        for ref in self._containers:
+            if ref() is container:
+                return
+        self._containers = [ref for ref in self._containers if ref() is not None]
+        self._containers.append(weakref.ref(container))
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Copies of this entry are not members of our containers
+        state['_containers'] = []
+        return state
+
+    def __deepcopy__(self, memo):
+        """Copies the entry, sharing immutable field values instead of copying them."""
+        new = type(self).__new__(type(self))
+        memo[id(self)] = new
+        state = self.__getstate__()
+        store = state.pop('store')
+        new.__dict__.update(copy.deepcopy(state, memo))
+        new.store = dict(store)
+        for key, value in store.items():
+            if key not in self._immutable_fields:
+                new.store[key] = copy.deepcopy(value, memo)
+        return new
+
     @property
     def state(self):
         return self._state
@@ -214,13 +296,23 @@ class Entry(LazyDict):
                 raise PluginError('Tried to set title to %r' % value)
             self.setdefault('original_title', value)
 
-        try:
-            log.trace('ENTRY SET: %s = %r' % (key, value))
-        except Exception as e:
-            log.debug('trying to debug key `%s` value threw exception: %s' % (key, e))
+        if tracer.enabled:
+            try:
+                tracer('ENTRY SET: %s = %r' % (key, value))
+            except Exception as e:
+                log.debug('trying to debug key `%s` value threw exception: %s' % (key, e))
+
+        if is_immutable(value):
+            self._immutable_fields.add(key)
+        else:
+            self._immutable_fields.discard(key)
 
         super(Entry, self).__setitem__(key, value)
 
+    def __delitem__(self, key):
+        self._immutable_fields.discard(key)
+        super(Entry, self).__delitem__(key)
+
     def safe_str(self):
         return '%s | %s' % (self['title'], self['url'])
 
@@ -244,10 +336,15 @@ class Entry(LazyDict):
     def take_snapshot(self, name):
         """
         Takes a snapshot of the entry under *name*. Snapshots can be accessed via :attr:`.snapshots`.
+        Immutable field values are shared with the entry, only mutable ones are copied.
+
         :param string name: Snapshot name
         """
         snapshot = {}
         for field, value in self.items():
+            if field in self._immutable_fields:
+                snapshot[field] = value
+                continue
             try:
                 snapshot[field] = copy.deepcopy(value)
             except TypeError:
@@ -260,6 +357,32 @@ class Entry(LazyDict):
                 log.warning('Snapshot `%s` is being overwritten for `%s`' % (name, self['title']))
             self.snapshots[name] = snapshot
 
+    def copy_hooks(self):
+        """
+        :return: Copy of the hooks registered for the entry, for :meth:`copy_from_snapshot`. None if there are none.
+        """
+        if not any(self._hooks.values()):
+            return None
+        return dict((action, list(funcs)) for action, funcs in self._hooks.items())
+
+    def copy_from_snapshot(self, name, hooks=None):
+        """
+        Creates a new, undecided entry with the field values of snapshot *name*, or the current field values of
+        the entry if it has no such snapshot.
+
+        :param string name: Snapshot name
+        :param dict hooks: Hooks to register for the new entry, as returned by :meth:`copy_hooks`.
+        """
+        fields = self.snapshots.get(name)
+        if fields is None:
+            fields = self.store
+        new = type(self)()
+        for field, value in fields.items():
+            new[field] = copy.deepcopy(value)
+        if hooks:
+            new._hooks.update((action, list(funcs)) for action, funcs in hooks.items())
+        return new
+
     def update_using_map(self, field_map, source_item, ignore_none=False):
         """
         Populates entry fields from a source object using a dictionary that maps from entry field names to
@@ -299,7 +422,7 @@ class Entry(LazyDict):
                 'Trying to render non string template or unrecognized template format, got %s'
                 % repr(template)
             )
-        log.trace('rendering: %s', template)
+        tracer('rendering: %s', template)
         return render_from_entry(template, self, native=native)
 
     def __eq__(self, other):
@@ -9,6 +9,8 @@ import logging
 log = logging.getLogger('event')
 
 _events = {}
+# Names of events which have had handlers added since their handler list was last sorted
+_unsorted_events = set()
 
 
 class Event(object):
@@ -61,10 +63,19 @@ def get_events(name):
     """
     if name not in _events:
         raise KeyError('No such event %s' % name)
-    _events[name].sort(reverse=True)
+    if name in _unsorted_events:
+        _events[name].sort(reverse=True)
+        _unsorted_events.discard(name)
     return _events[name]
 
 
+def get_event_names():
+    """
+    :return: List of names of all events which have handlers registered
+    """
+    return list(_events)
+
+
 def add_event_handler(name, func, priority=128):
     """
     :param string name: Event name
@@ -84,6 +95,7 @@ def add_event_handler(name, func, priority=128):
     log.trace('registered function %s to event %s' % (func.__name__, name))
     event = Event(name, func, priority)
     events.append(event)
+    _unsorted_events.add(name)
     return event
 
 
@@ -22,6 +22,8 @@ VERBOSE = 15
 # environment variables to modify rotating log parameters from defaults of 1 MB and 9 files
 ENV_MAXBYTES = 'FLEXGET_LOG_MAXBYTES'
 ENV_MAXCOUNT = 'FLEXGET_LOG_MAXCOUNT'
+# environment variable to limit trace logging of hot code paths to some subsystems, eg. `entry,seriesparser`
+ENV_TRACE = 'FLEXGET_TRACE'
 
 # Stores `task`, logging `session_id`, and redirected `output` stream in a thread local context
 local_context = threading.local()
@@ -52,6 +54,23 @@ def task_logging(task):
         local_context.task = old_task
 
 
+def get_context():
+    """Returns a copy of the logging context of the current thread, which can be applied to other threads."""
+    return dict(local_context.__dict__)
+
+
+@contextlib.contextmanager
+def use_context(context):
+    """Context manager which applies a logging context from :func:`get_context` to the current thread."""
+    old_context = dict(local_context.__dict__)
+    local_context.__dict__.update(context)
+    try:
+        yield
+    finally:
+        local_context.__dict__.clear()
+        local_context.__dict__.update(old_context)
+
+
 class SessionFilter(logging.Filter):
     def __init__(self, session_id):
         self.session_id = session_id
@@ -83,6 +102,7 @@ def capture_output(stream, loglevel=None):
     local_context.output = stream
     local_context.loglevel = loglevel
     root_logger.addHandler(streamhandler)
+    refresh_tracers()
     try:
         yield
     finally:
@@ -91,6 +111,7 @@ def capture_output(stream, loglevel=None):
         local_context.session_id = old_id
         local_context.output = old_output
         local_context.loglevel = old_loglevel
+        refresh_tracers()
 
 
 def get_capture_stream():
@@ -136,6 +157,51 @@ class FlexGetLogger(logging.Logger):
         self.log(VERBOSE, msg, *args, **kwargs)
 
 
+class Tracer(object):
+    """
+    TRACE logging for hot code paths, which costs nothing when tracing is off. Callers check :attr:`enabled` before
+    building any log message or arguments::
+
+        tracer = Tracer('entry', log)
+
+        if tracer.enabled:
+            tracer('ENTRY SET: %s = %r', key, value)
+
+    :attr:`enabled` is only updated by :func:`refresh_tracers`, which runs when logging is started or redirected
+    and before each task is executed.
+    """
+
+    def __init__(self, subsystem, logger=None):
+        """
+        :param subsystem: Name used to enable this tracer with the FLEXGET_TRACE environment variable.
+        :param logger: Logger to write to, defaults to the logger named `subsystem`.
+        """
+        self.subsystem = subsystem
+        self.logger = logger or logging.getLogger(subsystem)
+        self.enabled = False
+        _tracers.append(self)
+        self.refresh()
+
+    def refresh(self):
+        subsystems = os.environ.get(ENV_TRACE)
+        self.enabled = self.logger.isEnabledFor(TRACE) and (
+            not subsystems or self.subsystem in [s.strip() for s in subsystems.split(',')]
+        )
+
+    def __call__(self, msg, *args, **kwargs):
+        if self.enabled:
+            self.logger.log(TRACE, msg, *args, **kwargs)
+
+
+_tracers = []
+
+
+def refresh_tracers():
+    """Updates whether each :class:`Tracer` is enabled, after log levels may have changed."""
+    for tracer in _tracers:
+        tracer.refresh()
+
+
 class FlexGetFormatter(logging.Formatter):
     """Custom formatter that can handle both regular log records and those created by FlexGetLogger"""
 
@@ -236,6 +302,7 @@ def start(filename=None, level=logging.INFO, to_console=True, to_file=True):
                 logger.handle(record)
         _buff_handler.flush()
     _logging_started = True
+    refresh_tracers()
 
 
 # Set our custom logger class as default
@@ -25,6 +25,7 @@ import io  # noqa
 import sqlalchemy  # noqa
 import yaml  # noqa
 from sqlalchemy.exc import OperationalError  # noqa
+from sqlalchemy.pool import QueuePool  # noqa
 from sqlalchemy.ext.declarative import declarative_base  # noqa
 from sqlalchemy.orm import sessionmaker  # noqa
 
@@ -35,9 +36,10 @@ Base = declarative_base()
 Session = sessionmaker(class_=ContextSession)
 
 from flexget import config_schema, db_schema, logger, plugin  # noqa
-from flexget.event import fire_event  # noqa
+from flexget.event import event, fire_event  # noqa
 from flexget.ipc import IPCClient, IPCServer  # noqa
 from flexget.options import (
+    command_modules,
     CoreArgumentParser,
     get_parser,
     manager_parser,
@@ -48,11 +50,144 @@ from flexget.task import Task  # noqa
 from flexget.task_queue import TaskQueue  # noqa
 from flexget.utils.tools import pid_exists, get_current_flexget_version, io_encoding  # noqa
 from flexget.terminal import console  # noqa
+from flexget.utils import db_writer  # noqa
 
 log = logging.getLogger('manager')
 
 manager = None
 DB_CLEANUP_INTERVAL = timedelta(days=7)
+# File in the config directory caching which modules provide which plugins, see :func:`flexget.plugin.load_plugins`
+MANIFEST_FILENAME = '.plugin_manifest.json'
+
+database_config_schema = {
+    'oneOf': [
+        {'type': 'boolean'},
+        {
+            'type': 'object',
+            'properties': {
+                'journal_mode': {
+                    'type': 'string',
+                    'enum': ['delete', 'truncate', 'persist', 'memory', 'wal', 'off'],
+                },
+                'synchronous': {'type': 'string', 'enum': ['off', 'normal', 'full', 'extra']},
+                'mmap_size': {'type': ['integer', 'string'], 'format': 'size'},
+                'cache_size': {'type': ['integer', 'string'], 'format': 'size'},
+                'temp_store': {'type': 'string', 'enum': ['default', 'file', 'memory']},
+                'busy_timeout': {'type': 'integer', 'minimum': 0},
+                'pool_size': {'type': 'integer', 'minimum': 1},
+                'write_behind': {'type': 'boolean'},
+            },
+            'additionalProperties': False,
+        },
+    ]
+}
+
+
+@event('config.register')
+def register_config():
+    config_schema.register_config_key('database', database_config_schema)
+
+
+def prepare_database_config(config):
+    """
+    :param config: The `database` section of the config
+    :return: Dict of database settings, or None when the SQLite defaults should be used
+    """
+    if not config:
+        return None
+    if isinstance(config, bool):
+        config = {}
+    config = dict(config)
+    config.setdefault('journal_mode', 'wal')
+    config.setdefault('synchronous', 'normal')
+    config.setdefault('mmap_size', '256 MiB')
+    config.setdefault('cache_size', '64 MiB')
+    config.setdefault('temp_store', 'memory')
+    config.setdefault('busy_timeout', 10)
+    config.setdefault('pool_size', 5)
+    config.setdefault('write_behind', False)
+    for key in ('mmap_size', 'cache_size'):
+        config[key] = config_schema.parse_size(config[key])
+    return config
+
+
+def sqlite_pragmas(config):
+    """
+    :return: List of PRAGMA statements which apply database `config` to a connection
+    """
+    return [
+        'PRAGMA journal_mode = %s' % config['journal_mode'].upper(),
+        'PRAGMA synchronous = %s' % config['synchronous'].upper(),
+        'PRAGMA mmap_size = %d' % config['mmap_size'],
+        # negative cache size is in KiB rather than pages
+        'PRAGMA cache_size = -%d' % (config['cache_size'] // 1024),
+        'PRAGMA temp_store = %s' % config['temp_store'].upper(),
+        'PRAGMA busy_timeout = %d' % (config['busy_timeout'] * 1000),
+    ]
+
+
+def create_engine(database_uri, config=None, echo=False):
+    """
+    Create the SQLAlchemy engine for `database_uri`, tuned according to database `config` when given.
+
+    With a config, connections are pooled so each thread reuses an open connection (and its page cache) rather
+    than reopening the database file every time, and the PRAGMAs are applied to every new connection.
+    """
+    if not config:
+        return sqlalchemy.create_engine(
+            database_uri, echo=echo, connect_args={'check_same_thread': False, 'timeout': 10}
+        )
+    engine = sqlalchemy.create_engine(
+        database_uri,
+        echo=echo,
+        connect_args={'check_same_thread': False, 'timeout': config['busy_timeout']},
+        poolclass=QueuePool,
+        pool_size=config['pool_size'],
+        max_overflow=config['pool_size'] * 2,
+    )
+    pragmas = sqlite_pragmas(config)
+
+    @sqlalchemy.event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def database_status(engine):
+    """
+    :return: List of (setting, value) tuples describing the database settings currently in effect
+    """
+    # SQLite reports these as numbers
+    names = {
+        'synchronous': ['off', 'normal', 'full', 'extra'],
+        'temp_store': ['default', 'file', 'memory'],
+    }
+    status = []
+    with engine.connect() as conn:
+        for pragma in (
+            'journal_mode',
+            'synchronous',
+            'mmap_size',
+            'cache_size',
+            'temp_store',
+            'busy_timeout',
+        ):
+            value = conn.execute('PRAGMA %s' % pragma).scalar()
+            if pragma in names and value < len(names[pragma]):
+                value = names[pragma][value]
+            status.append((pragma, value))
+        status.append(('sqlite_version', conn.execute('SELECT sqlite_version()').scalar()))
+    pool = engine.pool
+    status.append(('pool', type(pool).__name__))
+    if isinstance(pool, QueuePool):
+        status.append(('pool_size', pool.size()))
+    return status
 
 
 class Manager(object):
@@ -135,6 +270,7 @@ class Manager(object):
         self.engine = None
         self.lockfile = None
         self.database_uri = None
+        self.database_config = None
         self.db_upgraded = False
         self._has_lock = False
         self.is_daemon = False
@@ -231,15 +367,21 @@ class Manager(object):
         if self.initialized:
             raise RuntimeError('Cannot call initialize on an already initialized manager.')
 
+        # The manifest lets plugin CLI commands load only the plugins they need, it is not used by unit tests
+        manifest_path = None if self.unit_test else os.path.join(self.config_base, MANIFEST_FILENAME)
         plugin.load_plugins(
             extra_plugins=[os.path.join(self.config_base, 'plugins')],
             extra_components=[os.path.join(self.config_base, 'components')],
+            manifest_path=manifest_path,
+            command=self._cli_command_name(),
         )
 
         # Reparse CLI options now that plugins are loaded
         if not self.args:
             self.args = ['--help']
         self.options = get_parser().parse_args(self.args)
+        if manifest_path:
+            plugin.write_manifest(manifest_path, command_modules)
 
         self.task_queue = TaskQueue()
         self.ipc_server = IPCServer(self, self.options.ipc_port)
@@ -266,6 +408,18 @@ class Manager(object):
         fire_event('manager.startup', self)
         self.initialized = True
 
+    def _cli_command_name(self):
+        """
+        :returns: Name of the CLI command given in the arguments, or None if it cannot be determined.
+        """
+        if not self.args or '--help' in self.args or '-h' in self.args:
+            return None
+        try:
+            remaining = manager_parser.parse_known_args(self.args)[1]
+        except ParserError:
+            return None
+        return remaining[0] if remaining else None
+
     @property
     def tasks(self):
         """A list of tasks in the config"""
@@ -737,6 +891,8 @@ class Manager(object):
             raise
         log.debug('New config data loaded.')
         self.user_config = copy.deepcopy(new_user_config)
+        # Database settings are part of the config, so they can only be applied once it is loaded
+        self.configure_database()
         fire_event('manager.config_updated', self)
 
     def backup_config(self):
@@ -817,11 +973,7 @@ class Manager(object):
         # fire up the engine
         log.debug('Connecting to: %s' % self.database_uri)
         try:
-            self.engine = sqlalchemy.create_engine(
-                self.database_uri,
-                echo=self.options.debug_sql,
-                connect_args={'check_same_thread': False, 'timeout': 10},
-            )
+            self.engine = create_engine(self.database_uri, echo=self.options.debug_sql)
         except ImportError as e:
             print(
                 'FATAL: Unable to use SQLite. Are you running Python 2.7, 3.3 or newer ?\n'
@@ -852,6 +1004,29 @@ class Manager(object):
                 )
             raise
 
+    def configure_database(self):
+        """
+        Apply the `database` section of the config by recreating the engine. This only happens on startup, changes
+        made while the daemon is running need a restart.
+        """
+        config = prepare_database_config(self.config.get('database'))
+        if config == self.database_config:
+            return
+        if self.initialized:
+            log.warning('Database settings have changed, restart FlexGet to apply them.')
+            return
+        uri = self.database_uri or ''
+        if not uri.startswith('sqlite:///') or uri == 'sqlite:///:memory:':
+            log.debug('Database settings only apply to SQLite database files')
+            return
+        log.debug('Applying database settings: %s', config)
+        self.database_config = config
+        self.engine.dispose()
+        self.engine = create_engine(self.database_uri, config, echo=self.options.debug_sql)
+        Session.configure(bind=self.engine)
+        if config['write_behind']:
+            db_writer.start()
+
     def _read_lock(self):
         """
         Read the values from the lock file. Returns None if there is no current lock file.
@@ -1050,6 +1225,7 @@ class Manager(object):
         fire_event('manager.shutdown', self)
         if not self.unit_test:  # don't scroll "nosetests" summary results when logging is enabled
             log.debug('Shutting down')
+        db_writer.stop()
         self.engine.dispose()
         # remove temporary database used in test mode
         if self.options.test:
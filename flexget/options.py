@@ -28,6 +28,9 @@ _UNSET = object()
 
 core_parser = None
 
+# Module which registered each plugin CLI command which can run with plugins loaded lazily
+command_modules = {}
+
 
 def unicode_argv():
     """Like sys.argv, but decodes all arguments."""
@@ -50,16 +53,20 @@ def get_parser(command=None):
     return core_parser
 
 
-def register_command(command, callback, **kwargs):
+def register_command(command, callback, lazy_plugins=True, **kwargs):
     """
     Register a callback function to be executed when flexget is launched with the given `command`.
 
     :param command: The command being defined.
     :param callback: Callback function executed when this command is invoked from the CLI. Should take manager instance
         and parsed argparse namespace as parameters.
+    :param lazy_plugins: If False, all plugins are always loaded before this command runs, rather than only the ones
+        it needs. Commands which run tasks should set this to False.
     :param kwargs: Other keyword arguments will be passed to the :class:`arparse.ArgumentParser` constructor
     :returns: An :class:`argparse.ArgumentParser` instance ready to be configured with the options for this command.
     """
+    if lazy_plugins:
+        command_modules[command] = callback.__module__
     return get_parser().add_subparser(
         command, parent_defaults={'cli_command_callback': callback}, **kwargs
     )
@@ -3,12 +3,16 @@ from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 from future.moves.urllib.error import HTTPError, URLError
 from future.utils import python_2_unicode_compatible
 
+import io
+import json
 import logging
 import os
 import re
+import sys
+import threading
 import time
 import pkg_resources
-from functools import total_ordering
+from functools import partial, total_ordering
 from http.client import BadStatusLine
 from importlib import import_module
 
@@ -19,7 +23,8 @@ from flexget import plugins as plugins_pkg
 from flexget import components as components_pkg
 from flexget import config_schema
 from flexget.event import add_event_handler as add_phase_handler
-from flexget.event import fire_event, remove_event_handlers
+from flexget.event import fire_event, get_event_names, get_events, remove_event_handlers
+from flexget.utils.tools import get_current_flexget_version
 
 log = logging.getLogger('plugin')
 
@@ -162,6 +167,16 @@ def priority(value):
     return decorator
 
 
+def rerun_input(target):
+    """
+    Decorator for input phase methods producing different entries when a task is rerun.
+
+    On reruns, entries produced by other inputs on the first run are re-injected instead of running them again.
+    """
+    target.rerun_input = True
+    return target
+
+
 # task phases, in order of their execution; note that this can be extended by
 # registering new phases at runtime
 task_phases = [
@@ -194,6 +209,38 @@ _loaded_plugins = {}
 _plugin_options = []
 _new_phase_queue = {}
 
+# Bump when the layout of the plugin manifest changes
+MANIFEST_VERSION = 1
+
+# Stamps (path, mtime, size) of all plugin modules found by the last load, keyed by module name
+_module_stamps = {}
+# Whether the plugin manifest on disk matches _module_stamps
+_manifest_current = False
+# Module which registered each plugin
+_plugin_modules = {}
+# Modules which must always be imported, because they failed to import or registered task phases
+_eager_modules = set()
+# Manifest info of modules which were not imported by a lazy load, keyed by module name
+_lazy_modules = {}
+# Manifest info of plugins in those modules, keyed by plugin name
+_lazy_plugins = {}
+_lazy_lock = threading.RLock()
+
+# Changes whenever plugins, their phase handlers or builtin status change, so that cached execution plans are rebuilt
+_registry_version = 0
+
+
+def _registry_changed():
+    global _registry_version
+    _registry_version += 1
+
+
+def get_registry_version():
+    """
+    :return: Number which changes whenever the plugin registry changes.
+    """
+    return _registry_version
+
 
 def register_task_phase(name, before=None, after=None):
     """
@@ -215,6 +262,7 @@ def register_task_phase(name, before=None, after=None):
             return False
         # add method name to phase -> method lookup table
         phase_methods[phase_name] = 'on_task_' + phase_name
+        _registry_changed()
         # place phase in phase list
         if before is None:
             task_phases.insert(task_phases.index(after) + 1, phase_name)
@@ -303,6 +351,7 @@ class PluginInfo(dict):
             )
         else:
             plugins[self.name] = self
+            _registry_changed()
 
     def initialize(self):
         if self.instance is not None:
@@ -357,6 +406,7 @@ class PluginInfo(dict):
                 # provides backwards compatibility
                 event.plugin = self
                 self.phase_handlers[phase] = event
+                _registry_changed()
 
     def __getattr__(self, attr):
         if attr in self:
@@ -365,6 +415,8 @@ class PluginInfo(dict):
 
     def __setattr__(self, attr, value):
         self[attr] = value
+        if attr == 'builtin':
+            _registry_changed()
 
     def __str__(self):
         return '<PluginInfo(name=%s)>' % self.name
@@ -430,6 +482,9 @@ def _check_phase_queue():
 
 
 def _import_plugin(module_name, plugin_path):
+    """
+    :returns: True if the module was imported successfully.
+    """
     try:
         import_module(module_name)
     except DependencyError as e:
@@ -456,52 +511,48 @@ def _import_plugin(module_name, plugin_path):
         raise
     else:
         log.trace('Loaded module %s from %s', module_name, plugin_path)
+        return True
+    return False
 
 
-def _load_plugins_from_dirs(dirs):
+def _find_modules(dirs, package):
     """
-    :param list dirs: Directories from where plugins are loaded from
+    :param list dirs: Directories containing modules of `package`
+    :param package: Package the modules are imported under
+    :returns: List of (module name, path) tuples of all modules found in `dirs`
     """
+    modules = []
+    for base_dir in dirs:
+        for module_path in base_dir.walkfiles('*.py'):
+            if module_path.name == '__init__.py':
+                continue
+            # Split the relative path from the plugins dir to current file's parent dir to find subpackage names
+            subpackages = [_f for _f in module_path.relpath(base_dir).parent.splitall() if _f]
+            module_name = '.'.join([package.__name__] + subpackages + [module_path.stem])
+            modules.append((module_name, module_path))
+    return modules
+
 
+def _find_plugin_modules(dirs):
+    """
+    :param list dirs: Directories from where plugins are loaded from
+    :returns: List of (module name, path) tuples
+    """
     log.debug('Trying to load plugins from: %s', dirs)
     dirs = [Path(d) for d in dirs if os.path.isdir(d)]
     # add all dirs to plugins_pkg load path so that imports work properly from any of the plugin dirs
     plugins_pkg.__path__ = list(map(_strip_trailing_sep, dirs))
-    for plugins_dir in dirs:
-        for plugin_path in plugins_dir.walkfiles('*.py'):
-            if plugin_path.name == '__init__.py':
-                continue
-            # Split the relative path from the plugins dir to current file's parent dir to find subpackage names
-            plugin_subpackages = [
-                _f for _f in plugin_path.relpath(plugins_dir).parent.splitall() if _f
-            ]
-            module_name = '.'.join(
-                [plugins_pkg.__name__] + plugin_subpackages + [plugin_path.stem]
-            )
-            _import_plugin(module_name, plugin_path)
-    _check_phase_queue()
+    return _find_modules(dirs, plugins_pkg)
 
 
-# TODO: this is now identical to _load_plugins_from_dirs, REMOVE
-def _load_components_from_dirs(dirs):
+def _find_component_modules(dirs):
     """
     :param list dirs: Directories where plugin components are loaded from
+    :returns: List of (module name, path) tuples
     """
     log.debug('Trying to load components from: %s', dirs)
     dirs = [Path(d) for d in dirs if os.path.isdir(d)]
-    for component_dir in dirs:
-        for component_path in component_dir.walkfiles('*.py'):
-            if component_path.name == '__init__.py':
-                continue
-            # Split the relative path from the plugins dir to current file's parent dir to find subpackage names
-            plugin_subpackages = [
-                _f for _f in component_path.relpath(component_dir).parent.splitall() if _f
-            ]
-            package_name = '.'.join(
-                [components_pkg.__name__] + plugin_subpackages + [component_path.stem]
-            )
-            _import_plugin(package_name, component_path)
-    _check_phase_queue()
+    return _find_modules(dirs, components_pkg)
 
 
 def _load_plugins_from_packages():
@@ -538,14 +589,106 @@ def _load_plugins_from_packages():
     _check_phase_queue()
 
 
-def load_plugins(extra_plugins=None, extra_components=None):
+def _register_plugins():
+    """
+    Fire the `plugin.register` handlers of newly imported modules, recording which module registers which plugins,
+    and instantiate the new plugins.
+    """
+    if 'plugin.register' in get_event_names():
+        for handler in list(get_events('plugin.register')):
+            known = set(plugins)
+            phase_count = len(task_phases) + len(_new_phase_queue)
+            handler()
+            module_name = handler.func.__module__
+            for name in set(plugins) - known:
+                _plugin_modules[name] = module_name
+            if len(task_phases) + len(_new_phase_queue) != phase_count:
+                _eager_modules.add(module_name)
+    # Plugins should only be registered once, remove their handlers after
+    remove_event_handlers('plugin.register')
+    for plugin in list(plugins.values()):
+        plugin.initialize()
+
+
+def _read_manifest(path):
+    """
+    :returns: The plugin manifest stored at `path`, or None if it is missing or does not match the plugin modules
+        found on disk.
+    """
+    try:
+        with io.open(path, encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)
+    except (IOError, OSError, ValueError):
+        return None
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get('version') != MANIFEST_VERSION
+        or manifest.get('flexget_version') != get_current_flexget_version()
+        or manifest.get('stamps') != _module_stamps
+    ):
+        log.debug('Plugin manifest %s is out of date', path)
+        return None
+    return manifest
+
+
+def _defer_modules(manifest):
+    """Record manifest info for all plugin modules which have not been imported, so they can be imported on demand."""
+    for module_name, module_info in manifest['modules'].items():
+        if module_name in sys.modules:
+            continue
+        _lazy_modules[module_name] = module_info
+        for name, plugin_info in module_info['plugins'].items():
+            if name in plugins:
+                continue
+            _lazy_plugins[name] = dict(plugin_info, name=name, module=module_name)
+            # The real schema replaces this once the plugin is loaded
+            config_schema.register_schema('/schema/plugin/%s' % name, partial(_lazy_schema, name))
+
+
+def _lazy_schema(name, **kwargs):
+    return get_plugin_by_name(name).schema
+
+
+def _load_lazy_modules(module_names):
+    """Import modules which were skipped by a lazy load, and register their plugins."""
+    with _lazy_lock:
+        module_names = sorted(m for m in set(module_names) if _lazy_modules.pop(m, None) is not None)
+        if not module_names:
+            return
+        log.debug('Loading plugin modules on demand: %s', ', '.join(module_names))
+        for module_name in module_names:
+            _import_plugin(module_name, _module_stamps[module_name][0])
+        _register_plugins()
+        _check_phase_queue()
+        # Modules may have been imported as dependencies of the ones requested
+        for module_name in [m for m in _lazy_modules if m in sys.modules]:
+            del _lazy_modules[module_name]
+        for name, info in list(_lazy_plugins.items()):
+            if name in plugins or info['module'] not in _lazy_modules:
+                del _lazy_plugins[name]
+        fire_event('plugin.lazy_loaded', module_names)
+
+
+def _load_lazy_plugin(name):
+    info = _lazy_plugins.get(name)
+    if info:
+        _load_lazy_modules([info['module']])
+
+
+def load_plugins(extra_plugins=None, extra_components=None, manifest_path=None, command=None):
     """
     Load plugins from the standard plugin and component paths.
 
+    When `manifest_path` points to an up to date manifest, and `command` is a CLI command registered by a plugin,
+    only the modules which provide that command or hook into FlexGet events are imported. Other modules are imported
+    when one of their plugins is requested from the registry.
+
     :param list extra_plugins: Extra directories from where plugins are loaded.
     :param list extra_components: Extra directories from where components are loaded.
+    :param str manifest_path: Path of the plugin manifest, see :func:`write_manifest`.
+    :param str command: Name of the CLI command which is about to be run.
     """
-    global plugins_loaded
+    global plugins_loaded, _manifest_current
 
     if extra_plugins is None:
         extra_plugins = []
@@ -557,17 +700,36 @@ def load_plugins(extra_plugins=None, extra_components=None):
     extra_components.extend(_get_standard_components_path())
 
     start_time = time.time()
+    modules = _find_plugin_modules(extra_plugins) + _find_component_modules(extra_components)
+    _module_stamps.clear()
+    for module_name, module_path in modules:
+        stat = os.stat(module_path)
+        _module_stamps[module_name] = [str(module_path), stat.st_mtime, stat.st_size]
+
+    manifest = _read_manifest(manifest_path) if manifest_path else None
+    _manifest_current = manifest is not None
+    lazy = manifest is not None and command in manifest['commands']
+    if lazy:
+        required = set(m for m, info in manifest['modules'].items() if info['eager'])
+        required.add(manifest['commands'][command])
+        required.update(_eager_modules)
+        log.debug('Loading plugins required by command `%s`', command)
+    else:
+        required = set(_module_stamps)
+
     # Import all the plugins
-    _load_plugins_from_dirs(extra_plugins)
-    _load_components_from_dirs(extra_components)
-    _load_plugins_from_packages()
-    # Register them
-    fire_event('plugin.register')
-    # Plugins should only be registered once, remove their handlers after
-    remove_event_handlers('plugin.register')
-    # After they have all been registered, instantiate them
-    for plugin in list(plugins.values()):
-        plugin.initialize()
+    with _lazy_lock:
+        for module_name, module_path in modules:
+            if module_name in required and not _import_plugin(module_name, module_path):
+                _eager_modules.add(module_name)
+        _check_phase_queue()
+        _load_plugins_from_packages()
+        _lazy_modules.clear()
+        _lazy_plugins.clear()
+        if lazy:
+            _defer_modules(manifest)
+        # Register them
+        _register_plugins()
     took = time.time() - start_time
     plugins_loaded = True
     log.debug(
@@ -575,6 +737,79 @@ def load_plugins(extra_plugins=None, extra_components=None):
     )
 
 
+def write_manifest(path, commands):
+    """
+    Write the manifest used by :func:`load_plugins` to load plugins lazily. Does nothing if plugins were not fully
+    loaded, or the manifest is already up to date.
+
+    :param str path: Path of the manifest file.
+    :param dict commands: Mapping of CLI command names to the module which registered them.
+    """
+    global _manifest_current
+
+    if _manifest_current or _lazy_modules or not _module_stamps:
+        return
+    modules = {}
+    for module_name in _module_stamps:
+        modules[module_name] = {'eager': module_name in _eager_modules, 'plugins': {}}
+    for name, module_name in _plugin_modules.items():
+        if module_name in modules and name in plugins:
+            info = plugins[name]
+            modules[module_name]['plugins'][name] = {
+                'api_ver': info.api_ver,
+                'interfaces': info.interfaces,
+                'builtin': info.builtin,
+                'debug': info.debug,
+                'category': info.category,
+                'phase_handlers': sorted(info.phase_handlers),
+            }
+    commands = dict((c, m) for c, m in commands.items() if m in modules)
+    # Modules hooking into events (other than registering plugins and commands) must always be imported
+    command_modules = set(commands.values())
+    for event_name in get_event_names():
+        if event_name.startswith('plugin.'):
+            continue
+        for handler in get_events(event_name):
+            module_name = handler.func.__module__
+            if module_name not in modules:
+                continue
+            if event_name == 'options.register' and module_name in command_modules:
+                continue
+            modules[module_name]['eager'] = True
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'flexget_version': get_current_flexget_version(),
+        'stamps': _module_stamps,
+        'modules': modules,
+        'commands': commands,
+    }
+    try:
+        with io.open(path, 'w', encoding='utf-8') as manifest_file:
+            manifest_file.write(str(json.dumps(manifest)))
+    except (IOError, OSError) as e:
+        log.debug('Unable to write plugin manifest %s: %s', path, e)
+    else:
+        _manifest_current = True
+        log.debug('Wrote plugin manifest %s', path)
+
+
+def _plugin_matches(plugin, phase=None, interface=None, category=None, name=None, min_api=None):
+    """Check a :class:`PluginInfo`, or the manifest info of a plugin not loaded yet, against query arguments."""
+    if phase is not None and phase not in phase_methods:
+        raise ValueError('Unknown phase %s' % phase)
+    if phase and phase not in plugin['phase_handlers']:
+        return False
+    if interface and interface not in plugin['interfaces']:
+        return False
+    if category and not category == plugin['category']:
+        return False
+    if name is not None and name != plugin['name']:
+        return False
+    if min_api is not None and plugin['api_ver'] < min_api:
+        return False
+    return True
+
+
 def get_plugins(phase=None, interface=None, category=None, name=None, min_api=None):
     """
     Query other plugins characteristics.
@@ -589,28 +824,27 @@ def get_plugins(phase=None, interface=None, category=None, name=None, min_api=No
     """
 
     def matches(plugin):
-        if phase is not None and phase not in phase_methods:
-            raise ValueError('Unknown phase %s' % phase)
-        if phase and phase not in plugin.phase_handlers:
-            return False
-        if interface and interface not in plugin.interfaces:
-            return False
-        if category and not category == plugin.category:
-            return False
-        if name is not None and name != plugin.name:
-            return False
-        if min_api is not None and plugin.api_ver < min_api:
-            return False
-        return True
+        return _plugin_matches(plugin, phase, interface, category, name, min_api)
 
+    if _lazy_plugins:
+        _load_lazy_modules(info['module'] for info in list(_lazy_plugins.values()) if matches(info))
     return filter(matches, iter(plugins.values()))
 
 
 def plugin_schemas(**kwargs):
     """Create a dict schema that matches plugins specified by `kwargs`"""
+    properties = dict(
+        (p.name, {'$ref': p.schema['id']})
+        for p in list(plugins.values())
+        if _plugin_matches(p, **kwargs)
+    )
+    # Plugins which are not loaded yet are referenced by name, their module is imported when the schema is used
+    for info in list(_lazy_plugins.values()):
+        if _plugin_matches(info, **kwargs):
+            properties[info['name']] = {'$ref': '/schema/plugin/%s' % info['name']}
     return {
         'type': 'object',
-        'properties': dict((p.name, {'$ref': p.schema['id']}) for p in get_plugins(**kwargs)),
+        'properties': properties,
         'additionalProperties': False,
         'error_additionalProperties': '{{message}} Only known plugin names are valid keys.',
         'patternProperties': {'^_': {'title': 'Disabled Plugin'}},
@@ -643,6 +877,8 @@ def get_plugin_by_name(name, issued_by='???'):
 
     :returns PluginInfo instance
     """
+    if name not in plugins:
+        _load_lazy_plugin(name)
     if name not in plugins:
         raise DependencyError(issued_by=issued_by, missing=name)
     return plugins[name]
@@ -655,6 +891,8 @@ def get(name, requested_by):
     :param requested_by: Plugin class instance OR string value who is making the request.
     :return: Instance of Plugin class
     """
+    if name not in plugins:
+        _load_lazy_plugin(name)
     if name not in plugins:
         if hasattr(requested_by, 'plugin_info'):
             who = requested_by.plugin_info.name
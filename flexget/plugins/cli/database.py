@@ -6,8 +6,9 @@ from argparse import ArgumentParser
 from flexget import options
 from flexget.db_schema import reset_schema, plugin_schemas
 from flexget.event import event
-from flexget.terminal import console
-from flexget.manager import Base, Session
+from flexget.terminal import TerminalTable, TerminalTableError, table_parser, console
+from flexget.manager import Base, Session, database_status
+from flexget.utils import db_writer
 
 
 def do_cli(manager, options):
@@ -20,6 +21,8 @@ def do_cli(manager, options):
             reset(manager)
         elif options.db_action == 'reset-plugin':
             reset_plugin(options)
+        elif options.db_action == 'status':
+            status(manager, options)
 
 
 def cleanup(manager):
@@ -53,6 +56,24 @@ def reset_plugin(options):
         console('Unable to reset %s: %s' % (plugin, e.message))
 
 
+def status(manager, options):
+    table_data = [['Setting', 'Value']]
+    for setting, value in database_status(manager.engine):
+        table_data.append([setting, str(value)])
+    queue_depth = db_writer.queue_depth()
+    table_data.append(['write_behind', str(queue_depth is not None)])
+    if queue_depth is not None:
+        table_data.append(['write_queue', str(queue_depth)])
+    try:
+        table = TerminalTable(options.table_type, table_data)
+    except TerminalTableError as e:
+        console('ERROR: %s' % str(e))
+        return
+    if not manager.database_config:
+        console('No `database` settings configured, SQLite defaults are used.')
+    console(table.output)
+
+
 @event('options.register')
 def register_parser_arguments():
     plugins_parser = ArgumentParser(add_help=False)
@@ -82,3 +103,6 @@ def register_parser_arguments():
     subparsers.add_parser(
         'reset-plugin', help='Reset the database for a specific plugin', parents=[plugins_parser]
     )
+    subparsers.add_parser(
+        'status', help='Show the database settings currently in effect', parents=[table_parser]
+    )
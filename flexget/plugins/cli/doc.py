@@ -7,7 +7,7 @@ import sys
 from flexget import options
 from flexget.event import event
 from flexget.terminal import console
-from flexget.plugin import plugins
+from flexget.plugin import get_plugin_by_name, DependencyError
 
 log = logging.getLogger('doc')
 
@@ -40,16 +40,17 @@ def trim(docstring):
 
 def print_doc(manager, options):
     plugin_name = options.doc
-    plugin = plugins.get(plugin_name, None)
-    if plugin:
+    try:
+        plugin = get_plugin_by_name(plugin_name)
+    except DependencyError:
+        console('Could not find plugin %s' % plugin_name)
+    else:
         if not plugin.instance.__doc__:
             console('Plugin %s does not have documentation' % plugin_name)
         else:
             console('')
             console(trim(plugin.instance.__doc__))
             console('')
-    else:
-        console('Could not find plugin %s' % plugin_name)
 
 
 @event('options.register')
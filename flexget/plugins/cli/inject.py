@@ -67,6 +67,7 @@ def register_parser_arguments():
     inject_parser = options.register_command(
         'inject',
         do_cli,
+        lazy_plugins=False,
         add_help=False,
         parents=[exec_parser],
         help='inject an entry from command line into tasks',
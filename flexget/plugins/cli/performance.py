@@ -1,23 +1,67 @@
 from __future__ import unicode_literals, division, absolute_import
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
+import io
+import json
 import logging
+import os
+import threading
 import time
+from collections import OrderedDict
+from datetime import datetime
 
 from argparse import SUPPRESS
 
-from flexget import options
+import requests
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy.engine import Engine
+
+from flexget import options, plugin
 from flexget.event import event, add_event_handler, remove_event_handler
+from flexget.utils.pathscrub import pathscrub
+from flexget.utils.template import template_cache
+from flexget.utils.tools import get_current_flexget_version
+
+try:
+    import cProfile as profile
+except ImportError:
+    import profile
 
-from sqlalchemy.engine import Connection
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2
+    tracemalloc = None
 
 log = logging.getLogger('performance')
 
-performance = {}
+# CPU time of the current thread where supported, otherwise of the whole process
+cpu_time = getattr(time, 'thread_time', None) or getattr(time, 'process_time', None) or time.clock
 
-_start = {}
+# Directory in the config dir where profiling results are written
+PERF_DIR = 'perf'
+
+STAT_KEYS = [
+    'took',
+    'cpu',
+    'queries',
+    'query_time',
+    'requests',
+    'request_bytes',
+    'request_time',
+    'memory',
+]
 
 query_count = 0
-orig_execute = None
+
+# TaskProfile of each task being profiled, keyed by id of the task
+_runs = {}
+_runs_lock = threading.Lock()
+# Plugin frames being measured in the current thread
+_local = threading.local()
+# Number of task runs which need our hooks installed
+_hook_users = 0
+_orig_send = None
+_started_tracemalloc = False
 
 
 def log_query_count(name_point):
@@ -25,67 +69,261 @@ def log_query_count(name_point):
     log.info('At point named `%s` total of %s queries were ran' % (name_point, query_count))
 
 
+def new_stats():
+    return OrderedDict((key, 0) for key in STAT_KEYS)
+
+
+def add_stats(stats, other):
+    for key in STAT_KEYS:
+        stats[key] += other[key]
+
+
+def traced_memory():
+    if tracemalloc and tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return 0
+
+
+class PluginFrame(object):
+    """Measurements of a single plugin phase handler call."""
+
+    def __init__(self, task, phase, plugin_name, profiler=None):
+        self.task = task
+        self.phase = phase
+        self.plugin_name = plugin_name
+        self.stats = new_stats()
+        self.profiler = profiler
+        self.start = time.time()
+        self.start_cpu = cpu_time()
+        self.start_memory = traced_memory()
+        if self.profiler:
+            self.profiler.enable()
+
+    def finish(self):
+        if self.profiler:
+            self.profiler.disable()
+        self.stats['took'] = time.time() - self.start
+        self.stats['cpu'] = cpu_time() - self.start_cpu
+        self.stats['memory'] = traced_memory() - self.start_memory
+        return self.stats
+
+
+class TaskProfile(object):
+    """Collects the measurements of all plugins run during one task execution."""
+
+    def __init__(self, task):
+        self.task = task
+        self.started = datetime.now()
+        self.start = time.time()
+        self.profile_plugins = getattr(task.options, 'debug_perf_profile', False)
+        # phase -> plugin name -> stats
+        self.phases = OrderedDict()
+        self.calls = {}
+        self.profilers = {}
+        self.lock = threading.Lock()
+
+    def profiler(self, phase, plugin_name):
+        if not self.profile_plugins:
+            return None
+        with self.lock:
+            return self.profilers.setdefault((phase, plugin_name), profile.Profile())
+
+    def add(self, frame, stats):
+        with self.lock:
+            plugins = self.phases.setdefault(frame.phase, OrderedDict())
+            add_stats(plugins.setdefault(frame.plugin_name, new_stats()), stats)
+            key = (frame.phase, frame.plugin_name)
+            self.calls[key] = self.calls.get(key, 0) + 1
+
+    def results(self, completed):
+        phases = OrderedDict()
+        for phase in sorted(self.phases, key=self._phase_order):
+            totals = new_stats()
+            plugins = OrderedDict()
+            for plugin_name, stats in self.phases[phase].items():
+                add_stats(totals, stats)
+                plugins[plugin_name] = dict(stats, calls=self.calls[(phase, plugin_name)])
+            phases[phase] = OrderedDict([('totals', totals), ('plugins', plugins)])
+        return OrderedDict(
+            [
+                ('task', self.task.name),
+                ('flexget_version', get_current_flexget_version()),
+                ('started', self.started.isoformat()),
+                ('took', time.time() - self.start),
+                ('completed', completed),
+                ('reruns', self.task._rerun_count),
+                (
+                    'entries',
+                    OrderedDict(
+                        [
+                            ('total', len(self.task.all_entries)),
+                            ('accepted', len(self.task.accepted)),
+                            ('rejected', len(self.task.rejected)),
+                            ('failed', len(self.task.failed)),
+                        ]
+                    ),
+                ),
+                ('template_cache', template_cache.info()),
+                ('phases', phases),
+            ]
+        )
+
+    @staticmethod
+    def _phase_order(phase):
+        if phase in plugin.task_phases:
+            return plugin.task_phases.index(phase)
+        return len(plugin.task_phases)
+
+    def write(self, completed=True):
+        """Logs a summary, and writes the results as JSON (and cProfile dumps) to the perf dir."""
+        results = self.results(completed)
+        log.info('Performance results for task %s:' % self.task.name)
+        for phase, phase_results in results['phases'].items():
+            for plugin_name, stats in phase_results['plugins'].items():
+                if stats['took'] > 0.1 or stats['queries'] > 10:
+                    log.info(
+                        '%-15s took %0.2f sec (%0.2f cpu, %s queries, %s requests)'
+                        % (plugin_name, stats['took'], stats['cpu'], stats['queries'], stats['requests'])
+                    )
+
+        perf_dir = os.path.join(self.task.manager.config_base, PERF_DIR)
+        if not os.path.isdir(perf_dir):
+            os.makedirs(perf_dir)
+        base_name = '%s-%s' % (
+            pathscrub(self.task.name, filename=True),
+            self.started.strftime('%Y%m%d-%H%M%S-%f'),
+        )
+        path = os.path.join(perf_dir, base_name + '.json')
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(str(json.dumps(results, indent=2)))
+        for (phase, plugin_name), profiler in self.profilers.items():
+            profiler.dump_stats(
+                os.path.join(perf_dir, '%s-%s-%s.prof' % (base_name, phase, plugin_name))
+            )
+        log.info('Performance results for task %s written to %s' % (self.task.name, path))
+
+
+def current_frame():
+    frames = getattr(_local, 'frames', None)
+    return frames[-1] if frames else None
+
+
 def before_plugin(task, keyword):
-    fd = _start.setdefault(task.name, {})
-    fd.setdefault('time', {})[keyword] = time.time()
-    fd.setdefault('queries', {})[keyword] = query_count
+    run = _runs.get(id(task))
+    if not run:
+        return
+    frame = PluginFrame(task, task.current_phase, keyword, run.profiler(task.current_phase, keyword))
+    if not hasattr(_local, 'frames'):
+        _local.frames = []
+    _local.frames.append(frame)
 
 
 def after_plugin(task, keyword):
-    took = time.time() - _start[task.name]['time'][keyword]
-    queries = query_count - _start[task.name]['queries'][keyword]
-    # Store results, increases previous values
-    pd = performance.setdefault(task.name, {})
-    data = pd.setdefault(keyword, {})
-    data['took'] = data.get('took', 0) + took
-    data['queries'] = data.get('queries', 0) + queries
+    frame = current_frame()
+    if not frame or frame.task is not task or frame.plugin_name != keyword:
+        return
+    _local.frames.pop()
+    run = _runs.get(id(task))
+    if run:
+        run.add(frame, frame.finish())
 
 
-@event('manager.execute.started')
-def startup(manager, options):
-    if not options.debug_perf:
-        return
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('perf_query_start', []).append(time.time())
 
-    log.info('Enabling plugin and SQLAlchemy performance debugging')
-    global query_count, orig_execute
-    query_count = 0
 
-    # Monkeypatch query counter for SQLAlchemy
-    if hasattr(Connection, 'execute'):
-        orig_execute = Connection.execute
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    global query_count
+    query_count += 1
+    took = time.time() - conn.info['perf_query_start'].pop()
+    frame = current_frame()
+    if frame:
+        frame.stats['queries'] += 1
+        frame.stats['query_time'] += took
 
-        def monkeypatched(*args, **kwargs):
-            global query_count
-            query_count += 1
-            return orig_execute(*args, **kwargs)
 
-        Connection.execute = monkeypatched
-    else:
-        log.critical('Unable to monkeypatch sqlalchemy')
+def send(self, request, **kwargs):
+    start = time.time()
+    response = _orig_send(self, request, **kwargs)
+    frame = current_frame()
+    if frame:
+        frame.stats['requests'] += 1
+        frame.stats['request_time'] += time.time() - start
+        frame.stats['request_bytes'] += int(response.headers.get('Content-Length') or 0)
+    return response
 
+
+def install_hooks():
+    """Start counting SQL queries, HTTP requests and allocations, if not already done for another task."""
+    global _hook_users, _orig_send, _started_tracemalloc
+
+    _hook_users += 1
+    if _hook_users > 1:
+        return
+    log.info('Enabling plugin, SQLAlchemy and HTTP performance debugging')
+    sqlalchemy_event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+    sqlalchemy_event.listen(Engine, 'after_cursor_execute', after_cursor_execute)
+    _orig_send = requests.Session.send
+    requests.Session.send = send
+    if tracemalloc and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
     add_event_handler('task.execute.before_plugin', before_plugin)
     add_event_handler('task.execute.after_plugin', after_plugin)
 
 
+def uninstall_hooks():
+    global _hook_users, _started_tracemalloc
+
+    _hook_users -= 1
+    if _hook_users > 0:
+        return
+    sqlalchemy_event.remove(Engine, 'before_cursor_execute', before_cursor_execute)
+    sqlalchemy_event.remove(Engine, 'after_cursor_execute', after_cursor_execute)
+    requests.Session.send = _orig_send
+    if _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+    remove_event_handler('task.execute.before_plugin', before_plugin)
+    remove_event_handler('task.execute.after_plugin', after_plugin)
+
+
+@event('task.execute.started')
+def task_started(task):
+    if not getattr(task.options, 'debug_perf', False):
+        return
+    with _runs_lock:
+        if id(task) in _runs:
+            return
+        install_hooks()
+        _runs[id(task)] = TaskProfile(task)
+
+
+def finish_run(task, completed):
+    with _runs_lock:
+        run = _runs.pop(id(task), None)
+        if not run:
+            return
+        uninstall_hooks()
+    try:
+        run.write(completed)
+    except (IOError, OSError) as e:
+        log.error('Unable to write performance results for task %s: %s', task.name, e)
+
+
+@event('task.execute.completed')
+def task_completed(task):
+    finish_run(task, True)
+
+
 @event('manager.execute.completed')
 def cleanup(manager, options):
     if not options.debug_perf:
         return
-
-    # Print summary
-    for name, data in performance.items():
-        log.info('Performance results for task %s:' % name)
-        for keyword, results in data.items():
-            took = results['took']
-            queries = results['queries']
-            if took > 0.1 or queries > 10:
-                log.info('%-15s took %0.2f sec (%s queries)' % (keyword, took, queries))
-
-    # Deregister our hooks
-    if hasattr(Connection, 'execute') and orig_execute:
-        Connection.execute = orig_execute
-    remove_event_handler('task.execute.before_plugin', before_plugin)
-    remove_event_handler('task.execute.after_plugin', after_plugin)
+    # Tasks which aborted never completed, write what was measured for them
+    for run in list(_runs.values()):
+        if run.task.finished_event.is_set():
+            finish_run(run.task, False)
 
 
 @event('options.register')
@@ -93,3 +331,10 @@ def register_parser_arguments():
     options.get_parser('execute').add_argument(
         '--debug-perf', action='store_true', dest='debug_perf', default=False, help=SUPPRESS
     )
+    options.get_parser('execute').add_argument(
+        '--debug-perf-profile',
+        action='store_true',
+        dest='debug_perf_profile',
+        default=False,
+        help=SUPPRESS,
+    )
@@ -145,6 +145,7 @@ class InputDeluge(DelugePlugin):
         super(InputDeluge, self).prepare_config(config)
         return config
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         """Generates and returns a list of entries from the deluge daemon."""
         config = self.prepare_config(config)
@@ -684,6 +684,7 @@ class RTorrentInputPlugin(RTorrentPluginBase):
         'additionalProperties': False,
     }
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         client = RTorrent(
             os.path.expanduser(config['uri']),
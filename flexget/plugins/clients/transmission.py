@@ -180,6 +180,7 @@ class PluginTransmissionInput(TransmissionBase):
         config.setdefault('only_complete', False)
         return config
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         config = self.prepare_config(config)
         if not config['enabled']:
@@ -10,7 +10,7 @@ from sqlalchemy import Column, Integer, String, Unicode, DateTime, Index, select
 from flexget import db_schema, plugin
 from flexget.event import event
 from flexget.utils import json
-from flexget.utils.database import entry_synonym
+from flexget.utils.database import bulk_key_lookup, entry_synonym
 from flexget.utils.tools import parse_timedelta
 from flexget.utils.sqlalchemy_utils import table_schema, table_add_column
 
@@ -90,6 +90,7 @@ class FilterDelay(object):
             raise plugin.PluginError('Invalid time format', log)
 
     @plugin.priority(-1)
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         """Captures the current input then replaces it with entries that have passed the delay."""
         if task.entries:
@@ -98,15 +99,16 @@ class FilterDelay(object):
             task.no_entries_ok = True
         # First learn the current entries in the task to the database
         expire_time = datetime.now() + self.get_delay(config)
+        queued = bulk_key_lookup(
+            task.session.query(DelayedEntry).filter(DelayedEntry.task == task.name),
+            [DelayedEntry.title],
+            [(entry['title'],) for entry in task.entries],
+        )
         for entry in task.entries:
             log.debug('Delaying %s' % entry['title'])
             # check if already in queue
-            if (
-                not task.session.query(DelayedEntry)
-                .filter(DelayedEntry.title == entry['title'])
-                .filter(DelayedEntry.task == task.name)
-                .first()
-            ):
+            if (entry['title'],) not in queued:
+                queued[(entry['title'],)] = entry
                 delay_entry = DelayedEntry()
                 delay_entry.title = entry['title']
                 delay_entry.entry = entry
@@ -9,10 +9,12 @@ from flexget import plugin
 from flexget.config_schema import one_or_more
 from flexget.entry import Entry
 from flexget.event import event
+from flexget.logger import Tracer
 
 from future.moves.urllib.parse import unquote
 
 log = logging.getLogger('regexp')
+tracer = Tracer('regexp', log)
 
 
 class FilterRegexp(object):
@@ -163,7 +165,7 @@ class FilterRegexp(object):
         if 'rest' in config:
             rest_method = Entry.accept if config['rest'] == 'accept' else Entry.reject
             for entry in rest:
-                log.debug('Rest method %s for %s' % (config['rest'], entry['title']))
+                log.debug('Rest method %s for %s', config['rest'], entry['title'])
                 rest_method(entry, 'regexp `rest`')
 
     def matches(self, entry, regexp, find_from=None, not_regexps=None):
@@ -213,7 +215,7 @@ class FilterRegexp(object):
         method = Entry.accept if 'accept' in operation else Entry.reject
         match_mode = 'excluding' not in operation
         for entry in task.entries:
-            log.trace('testing %i regexps to %s' % (len(regexps), entry['title']))
+            tracer('testing %i regexps to %s', len(regexps), entry['title'])
             for regexp_opts in regexps:
                 regexp, opts = list(regexp_opts.items())[0]
 
@@ -226,15 +228,13 @@ class FilterRegexp(object):
                     matchtext = 'regexp \'%s\' ' % regexp.pattern + (
                         'matched field \'%s\'' % field if match_mode else 'didn\'t match'
                     )
-                    log.debug('%s for %s' % (matchtext, entry['title']))
+                    log.debug('%s for %s', matchtext, entry['title'])
                     # apply settings to entry and run the method on it
                     if opts.get('path'):
                         entry['path'] = opts['path']
                     if opts.get('set'):
                         # invoke set plugin with given configuration
-                        log.debug(
-                            'adding set: info to entry:"%s" %s' % (entry['title'], opts['set'])
-                        )
+                        log.debug('adding set: info to entry:"%s" %s', entry['title'], opts['set'])
                         plugin.get('set', self).modify(entry, opts['set'])
                     method(entry, matchtext)
                     # We had a match so break out of the regexp loop.
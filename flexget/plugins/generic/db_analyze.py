@@ -13,3 +13,5 @@ log = logging.getLogger('db_analyze')
 def on_cleanup(manager, session):
     log.info('Running ANALYZE on database to improve performance.')
     session.execute('ANALYZE')
+    # Lets SQLite decide whether any of the query planner statistics are worth updating, no-op before 3.18
+    session.execute('PRAGMA optimize')
@@ -269,6 +269,7 @@ class Discover(object):
             )
         return result
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         config.setdefault('release_estimations', {})
         if not isinstance(config['release_estimations'], dict):
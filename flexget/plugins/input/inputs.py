@@ -5,6 +5,7 @@ import logging
 
 from flexget import plugin
 from flexget.event import event
+from flexget.utils.tools import fetch_inputs
 
 log = logging.getLogger('inputs')
 
@@ -18,6 +19,8 @@ class PluginInputs(object):
       inputs:
         - rss: http://feeda.com
         - rss: http://feedb.com
+
+    The inputs are run concurrently when the `parallel_inputs` plugin is enabled for the task.
     """
 
     schema = {
@@ -35,36 +38,31 @@ class PluginInputs(object):
         },
     }
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         entry_titles = set()
         entry_urls = set()
-        for item in config:
-            for input_name, input_config in item.items():
-                input = plugin.get_plugin_by_name(input_name)
-                method = input.phase_handlers['input']
-                try:
-                    result = method(task, input_config)
-                except plugin.PluginError as e:
-                    log.warning('Error during input plugin %s: %s' % (input_name, e))
+        for input_name, result in fetch_inputs(task, config):
+            if result is None:
+                continue
+            if not result:
+                msg = 'Input %s did not return anything' % input_name
+                if getattr(task, 'no_entries_ok', False):
+                    log.verbose(msg)
+                else:
+                    log.warning(msg)
+                continue
+            for entry in result:
+                if entry['title'] in entry_titles:
+                    log.debug('Title `%s` already in entry list, skipping.' % entry['title'])
                     continue
-                if not result:
-                    msg = 'Input %s did not return anything' % input_name
-                    if getattr(task, 'no_entries_ok', False):
-                        log.verbose(msg)
-                    else:
-                        log.warning(msg)
+                urls = ([entry['url']] if entry.get('url') else []) + entry.get('urls', [])
+                if any(url in entry_urls for url in urls):
+                    log.debug('URL for `%s` already in entry list, skipping.' % entry['title'])
                     continue
-                for entry in result:
-                    if entry['title'] in entry_titles:
-                        log.debug('Title `%s` already in entry list, skipping.' % entry['title'])
-                        continue
-                    urls = ([entry['url']] if entry.get('url') else []) + entry.get('urls', [])
-                    if any(url in entry_urls for url in urls):
-                        log.debug('URL for `%s` already in entry list, skipping.' % entry['title'])
-                        continue
-                    yield entry
-                    entry_titles.add(entry['title'])
-                    entry_urls.update(urls)
+                yield entry
+                entry_titles.add(entry['title'])
+                entry_urls.update(urls)
 
 
 @event('plugin.register')
@@ -35,6 +35,7 @@ class PluginLimit(object):
         'additionalProperties': False,
     }
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         for input_name, input_config in config['from'].items():
             input = plugin.get_plugin_by_name(input_name)
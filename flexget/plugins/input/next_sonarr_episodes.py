@@ -99,6 +99,7 @@ class NextSonarrEpisodes(object):
             )
         return json
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         json = self.get_page(task, config, 1)
         pages = int(
@@ -77,6 +77,7 @@ class InputTail(object):
         for k, v in d.items():
             entry[k] = v % entry
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
 
         # Let details plugin know that it is ok if this task doesn't produce any entries
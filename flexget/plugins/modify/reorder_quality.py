@@ -34,10 +34,11 @@ class ReorderQuality(object):
     }
 
     def __init__(self):
+        # Original values of the changed qualities, by task name
         self.quality_priorities = {}
 
     def on_task_start(self, task, config):
-        self.quality_priorities = {}
+        quality_priorities = self.quality_priorities[task.name] = {}
         for quality, _config in config.items():
             action, other_quality = list(_config.items())[0]
 
@@ -58,7 +59,7 @@ class ReorderQuality(object):
                     )
                 )
 
-            self.quality_priorities[quality] = quality_component.value
+            quality_priorities[quality] = quality_component.value
             log.debug('stored %s original value %s' % (quality, quality_component.value))
 
             new_value = other_quality_component.value
@@ -72,13 +73,13 @@ class ReorderQuality(object):
         log.debug('Changed priority for: %s' % ', '.join(list(config.keys())))
 
     def on_task_exit(self, task, config):
-        if not self.quality_priorities:
+        quality_priorities = self.quality_priorities.pop(task.name, None)
+        if not quality_priorities:
             log.debug('nothing changed, aborting restore')
             return
-        for name, value in self.quality_priorities.items():
+        for name, value in quality_priorities.items():
             qualities._registry[name].value = value
-        log.debug('Restored priority for: %s' % ', '.join(list(self.quality_priorities.keys())))
-        self.quality_priorities = {}
+        log.debug('Restored priority for: %s' % ', '.join(list(quality_priorities.keys())))
 
     on_task_abort = on_task_exit
 
@@ -13,7 +13,7 @@ from flexget.config_schema import one_or_more
 from flexget.db_schema import versioned_base
 from flexget.event import event
 from flexget.manager import Session
-from flexget.utils import json
+from flexget.utils import db_writer, json
 from flexget.utils.database import entry_synonym
 from flexget.utils.tools import parse_timedelta
 from flexget.utils.sqlalchemy_utils import table_schema, table_add_column
@@ -83,13 +83,15 @@ class OutputDigest(object):
 
     def on_task_learn(self, task, config):
         config = self.prepare_config(config)
-        with Session() as session:
-            for entry in task.all_entries:
-                if entry.state not in config['state']:
-                    continue
-                entry['digest_task'] = task.name
-                entry['digest_state'] = entry.state
-                session.add(DigestEntry(list=config['list'], entry=entry))
+        digest_entries = []
+        for entry in task.all_entries:
+            if entry.state not in config['state']:
+                continue
+            entry['digest_task'] = task.name
+            entry['digest_state'] = entry.state
+            digest_entries.append(DigestEntry(list=config['list'], entry=entry))
+        if digest_entries:
+            db_writer.add(task, digest_entries)
 
 
 class FromDigest(object):
@@ -112,6 +114,7 @@ class FromDigest(object):
         'additionalProperties': False,
     }
 
+    @plugin.rerun_input
     def on_task_input(self, task, config):
         entries = []
         with Session() as session:
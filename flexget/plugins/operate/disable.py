@@ -41,11 +41,14 @@ class DisablePlugin(object):
     """
 
     schema = one_or_more({'type': 'string'})
-    disabled_builtins = None
+
+    def __init__(self):
+        # Builtins disabled by each running task, by task name
+        self.disabled_builtins = {}
 
     @plugin.priority(254)
     def on_task_start(self, task, config):
-        self.disabled_builtins = []
+        disabled_builtins = self.disabled_builtins[task.name] = []
         disabled = []
 
         if isinstance(config, basestring):
@@ -59,28 +62,28 @@ class DisablePlugin(object):
             # Disable built-in plugins.
             if p in plugin.plugins and plugin.plugins[p].builtin:
                 plugin.plugins[p].builtin = False
-                self.disabled_builtins.append(p)
+                disabled_builtins.append(p)
 
         # Disable all builtins mode.
         if 'builtins' in config:
             for p in all_builtins():
                 p.builtin = False
-                self.disabled_builtins.append(p.name)
+                disabled_builtins.append(p.name)
 
-        if self.disabled_builtins:
-            log.debug('Disabled built-in plugin(s): %s' % ', '.join(self.disabled_builtins))
+        if disabled_builtins:
+            log.debug('Disabled built-in plugin(s): %s' % ', '.join(disabled_builtins))
         if disabled:
             log.debug('Disabled plugin(s): %s' % ', '.join(disabled))
 
     @plugin.priority(plugin.PRIORITY_LAST)
     def on_task_exit(self, task, config):
-        if not self.disabled_builtins:
+        disabled_builtins = self.disabled_builtins.pop(task.name, None)
+        if not disabled_builtins:
             return
 
-        for name in self.disabled_builtins:
+        for name in disabled_builtins:
             plugin.plugins[name].builtin = True
-        log.debug('Re-enabled builtin plugin(s): %s' % ', '.join(self.disabled_builtins))
-        self.disabled_builtins = []
+        log.debug('Re-enabled builtin plugin(s): %s' % ', '.join(disabled_builtins))
 
     on_task_abort = on_task_exit
 
@@ -0,0 +1,31 @@
+from __future__ import unicode_literals, division, absolute_import
+from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
+
+import logging
+
+from flexget import plugin
+from flexget.event import event
+
+log = logging.getLogger('parallel_inputs')
+
+
+# The task reads this value directly out of the config when running the input phase, or when plugins such as
+# `inputs` and `discover` run their inputs. This plugin does nothing but make the config key valid.
+class ParallelInputs(object):
+    """
+    Run the input plugins of the task concurrently. Entries are still added in the order inputs are configured.
+
+    Example::
+
+      parallel_inputs: 4
+    """
+
+    schema = {'oneOf': [{'type': 'boolean'}, {'type': 'integer', 'minimum': 1}]}
+
+    def on_task_start(self, task, config):
+        pass
+
+
+@event('plugin.register')
+def register_plugin():
+    plugin.register(ParallelInputs, 'parallel_inputs', api_ver=2)
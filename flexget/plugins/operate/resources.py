@@ -0,0 +1,35 @@
+from __future__ import unicode_literals, division, absolute_import
+from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
+
+import logging
+
+from flexget import plugin
+from flexget.config_schema import one_or_more
+from flexget.event import event
+
+log = logging.getLogger('resources')
+
+
+# The task queue reads this value directly out of the config, and the templates of the task, when
+# deciding which tasks may run in parallel (see `task_concurrency`), this plugin does nothing but
+# make the config key valid.
+class TaskResources(object):
+    """
+    Declare resources the task needs exclusive access to. Tasks sharing a resource are never run at the same time.
+
+    Example::
+
+      resources:
+        - transmission
+        - seen
+    """
+
+    schema = one_or_more({'type': 'string'})
+
+    def on_task_start(self, task, config):
+        pass
+
+
+@event('plugin.register')
+def register_plugin():
+    plugin.register(TaskResources, 'resources', api_ver=2)
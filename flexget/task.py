@@ -7,26 +7,29 @@ import logging
 import threading
 import random
 import string
+from collections import defaultdict
 from functools import wraps, total_ordering
+from multiprocessing.pool import ThreadPool
 
 from sqlalchemy import Column, Integer, String, Unicode
 
 from flexget import config_schema, db_schema
 from flexget.entry import EntryUnicodeError
 from flexget.event import event, fire_event
-from flexget.logger import capture_output
+from flexget.logger import capture_output, refresh_tracers
 from flexget.manager import Session
 from flexget.plugin import plugins as all_plugins
 from flexget.plugin import (
     DependencyError,
     get_plugins,
+    get_registry_version,
     phase_methods,
     plugin_schemas,
     PluginError,
     PluginWarning,
     task_phases,
 )
-from flexget.utils import requests
+from flexget.utils import db_writer, requests
 from flexget.utils.database import with_session
 from flexget.utils.simple_persistence import SimpleTaskPersistence
 from flexget.utils.tools import get_config_hash, MergeException, merge_dict_from_to
@@ -89,16 +92,39 @@ class EntryIterator(object):
         self.all_entries = entries
         if isinstance(states, str):
             states = [states]
+        self.states = states
         self.filter = lambda e: e._state in states
 
+    def _state_index(self):
+        """The state index of the underlying container, or None if entries need to be scanned."""
+        get_index = getattr(self.all_entries, '_get_index', None)
+        if get_index is None:
+            return None
+        index = get_index()
+        if index.duplicates:
+            return None
+        return index
+
     def __iter__(self):
-        return filter(self.filter, self.all_entries)
+        index = self._state_index()
+        if index is None:
+            return filter(self.filter, self.all_entries)
+        entries = [entry for state in self.states for entry in index.buckets[state].values()]
+        entries.sort(key=lambda e: index.positions[id(e)])
+        # State may still change while iterating
+        return filter(self.filter, entries)
 
     def __bool__(self):
-        return any(e for e in self)
+        index = self._state_index()
+        if index is None:
+            return any(e for e in self)
+        return any(index.buckets[state] for state in self.states)
 
     def __len__(self):
-        return sum(1 for e in self)
+        index = self._state_index()
+        if index is None:
+            return sum(1 for e in self)
+        return sum(len(index.buckets[state]) for state in self.states)
 
     def __add__(self, other):
         return itertools.chain(self, other)
@@ -124,11 +150,43 @@ class EntryIterator(object):
         self.all_entries.sort(*args, **kwargs)
 
 
+class EntryStateIndex(object):
+    """Index of the entries in an :class:`EntryContainer` by state, along with their position in the container."""
+
+    def __init__(self, container):
+        self.buckets = defaultdict(dict)
+        self.positions = {}
+        # If an entry is in the container more than once views fall back to scanning the container
+        self.duplicates = False
+        for entry in container:
+            self.add(entry, container)
+
+    def add(self, entry, container):
+        key = id(entry)
+        if key in self.positions:
+            self.duplicates = True
+            return
+        self.positions[key] = len(self.positions)
+        self.buckets[entry._state][key] = entry
+        entry._add_container(container)
+
+    def state_changed(self, entry, old_state, new_state):
+        key = id(entry)
+        if self.buckets[old_state].pop(key, None) is not None:
+            self.buckets[new_state][key] = entry
+
+
 class EntryContainer(list):
-    """Container for a list of entries, also contains accepted, rejected failed iterators over them."""
+    """
+    Container for a list of entries, also contains accepted, rejected failed iterators over them.
+
+    Entries are indexed by state, so that the iterators can be sized and iterated without scanning all entries.
+    The index is built on demand, and rebuilt after any change to the container other than appending entries.
+    """
 
     def __init__(self, iterable=None):
         list.__init__(self, iterable or [])
+        self._index = None
 
         self._entries = EntryIterator(self, ['undecided', 'accepted'])
         self._accepted = EntryIterator(self, 'accepted')  # accepted entries, can still be rejected
@@ -143,10 +201,141 @@ class EntryContainer(list):
     failed = property(lambda self: self._failed)
     undecided = property(lambda self: self._undecided)
 
+    def _get_index(self):
+        if self._index is None:
+            self._index = EntryStateIndex(self)
+        return self._index
+
+    def _entry_state_changed(self, entry, old_state, new_state):
+        """Called by entries in this container when their state changes."""
+        if self._index is not None:
+            self._index.state_changed(entry, old_state, new_state)
+
+    def append(self, entry):
+        list.append(self, entry)
+        if self._index is not None:
+            self._index.add(entry, self)
+
+    def extend(self, iterable):
+        entries = list(iterable)
+        list.extend(self, entries)
+        if self._index is not None:
+            for entry in entries:
+                self._index.add(entry, self)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    # All other modifications can reorder or remove entries, they invalidate the index
+
+    def insert(self, index, entry):
+        list.insert(self, index, entry)
+        self._index = None
+
+    def remove(self, entry):
+        list.remove(self, entry)
+        self._index = None
+
+    def pop(self, *args):
+        self._index = None
+        return list.pop(self, *args)
+
+    def clear(self):
+        del self[:]
+
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self._index = None
+
+    def reverse(self):
+        list.reverse(self)
+        self._index = None
+
+    def __setitem__(self, key, value):
+        list.__setitem__(self, key, value)
+        self._index = None
+
+    def __delitem__(self, key):
+        list.__delitem__(self, key)
+        self._index = None
+
+    def __imul__(self, other):
+        list.__imul__(self, other)
+        self._index = None
+        return self
+
+    # Python 2 uses these for simple slices
+    def __setslice__(self, i, j, sequence):
+        self.__setitem__(slice(i, j), sequence)
+
+    def __delslice__(self, i, j):
+        self.__delitem__(slice(i, j))
+
+    def __copy__(self):
+        return type(self)(self)
+
+    def __deepcopy__(self, memo):
+        return type(self)(copy.deepcopy(list(self), memo))
+
     def __repr__(self):
         return '<EntryContainer(%s)>' % list.__repr__(self)
 
 
+class ExecutionPlan(object):
+    """
+    The plugins to run in each phase, in order, for tasks configuring a given set of plugins.
+
+    Plans are immutable, and shared between tasks and runs until the plugin registry changes (including builtin
+    plugins being disabled or enabled), or the priority of one of their phase handlers is changed (e.g. by the
+    `plugin_priority` plugin).
+    """
+
+    _cache = {}
+    _cache_version = None
+    _cache_lock = threading.Lock()
+
+    def __init__(self, configured):
+        """
+        :param frozenset configured: Names of the plugins configured for the task.
+        """
+        self.configured = configured
+        self.phases = {}
+        for phase in phase_methods:
+            plugins = sorted(
+                get_plugins(phase=phase), key=lambda p: p.phase_handlers[phase], reverse=True
+            )
+            self.phases[phase] = tuple(p for p in plugins if p.name in configured or p.builtin)
+        # Handler priorities the phases were sorted by
+        self._priorities = tuple(
+            (handler, handler.priority)
+            for phase, phase_plugins in self.phases.items()
+            for handler in (p.phase_handlers[phase] for p in phase_plugins)
+        )
+
+    @property
+    def is_current(self):
+        """False if the priority of a phase handler has changed since the plan was made."""
+        return all(handler.priority == priority for handler, priority in self._priorities)
+
+    @classmethod
+    def get(cls, config):
+        """
+        :param dict config: Task config.
+        :return: The :class:`ExecutionPlan` for `config`, reusing a cached one if possible.
+        """
+        configured = frozenset(config)
+        with cls._cache_lock:
+            version = get_registry_version()
+            if version != cls._cache_version:
+                cls._cache = {}
+                cls._cache_version = version
+            plan = cls._cache.get(configured)
+            if plan is None or not plan.is_current:
+                plan = cls._cache[configured] = cls(configured)
+        return plan
+
+
 class TaskAbort(Exception):
     def __init__(self, reason, silent=False):
         self.reason = reason
@@ -193,6 +382,8 @@ class Task(object):
 
     RERUN_DEFAULT = 5
     RERUN_MAX = 100
+    # Amount of input plugins run concurrently when `parallel_inputs` is enabled without a number
+    PARALLEL_INPUTS_DEFAULT = 4
 
     def __init__(
         self,
@@ -262,6 +453,8 @@ class Task(object):
         self.abort_reason = None
         self.silent_abort = False
 
+        # Holds plugin state which is local to worker threads, see :meth:`map_concurrent`
+        self._thread_state = threading.local()
         self.session = None
 
         self.requests = requests.Session()
@@ -269,13 +462,35 @@ class Task(object):
         # List of all entries in the task
         self._all_entries = EntryContainer()
         self._rerun = False
+        # Entries produced by inputs on the first run, re-injected on reruns
+        self._rerun_inputs = {}
 
         self.disabled_phases = []
+        # Name of the plugin which disabled each phase, if disabled while it ran
+        self._phase_disabled_by = {}
 
         # current state
         self.current_phase = None
         self.current_plugin = None
 
+    def _thread_local_attribute(name):
+        """Attribute which can be overridden inside threads started by :meth:`map_concurrent`."""
+
+        def getter(self):
+            return getattr(self._thread_state, name, self.__dict__.get(name))
+
+        def setter(self, value):
+            if getattr(self._thread_state, 'active', False):
+                setattr(self._thread_state, name, value)
+            else:
+                self.__dict__[name] = value
+
+        return property(getter, setter)
+
+    current_plugin = _thread_local_attribute('current_plugin')
+    session = _thread_local_attribute('session')
+    del _thread_local_attribute
+
     @property
     def max_reruns(self):
         """How many times task can be rerunned before stopping"""
@@ -303,6 +518,14 @@ class Task(object):
     def reruns_locked(self):
         return self._reruns_locked
 
+    @property
+    def input_concurrency(self):
+        """How many input plugins can be run concurrently, configured with the `parallel_inputs` plugin."""
+        value = self.config.get('parallel_inputs', False)
+        if value is True:
+            return Task.PARALLEL_INPUTS_DEFAULT
+        return value or 1
+
     @property
     def is_rerun(self):
         return bool(self._rerun_count)
@@ -385,6 +608,8 @@ class Task(object):
         if phase not in self.disabled_phases:
             log.debug('Disabling %s phase' % phase)
             self.disabled_phases.append(phase)
+            if self.current_phase == phase:
+                self._phase_disabled_by[phase] = self.current_plugin
 
     def abort(self, reason='Unknown', silent=False, traceback=None):
         """Abort this task execution, no more plugins will be executed except the abort handling ones."""
@@ -426,11 +651,8 @@ class Task(object):
           An iterator over configured :class:`flexget.plugin.PluginInfo` instances enabled on this task.
         """
         if phase:
-            plugins = sorted(
-                get_plugins(phase=phase), key=lambda p: p.phase_handlers[phase], reverse=True
-            )
-        else:
-            plugins = iter(all_plugins.values())
+            return iter(ExecutionPlan.get(self.config).phases[phase])
+        plugins = iter(all_plugins.values())
         return (p for p in plugins if p.name in self.config or p.builtin)
 
     def __run_task_phase(self, phase):
@@ -465,28 +687,19 @@ class Task(object):
                                 % phase
                             )
 
+        if phase == 'input' and self.input_concurrency > 1:
+            self.__run_input_phase_concurrently()
+            return
+
         for plugin in self.plugins(phase):
             # Abort this phase if one of the plugins disables it
             if phase in self.disabled_phases:
                 return
-            # store execute info, except during entry events
-            self.current_phase = phase
-            self.current_plugin = plugin.name
-
-            if plugin.api_ver == 1:
-                # backwards compatibility
-                # pass method only task (old behaviour)
-                args = (self,)
-            else:
-                # pass method task, copy of config (so plugin cannot modify it)
-                args = (self, copy.copy(self.config.get(plugin.name)))
-
             # Hack to make task.session only active for a single plugin
             with Session() as session:
                 self.session = session
                 try:
-                    fire_event('task.execute.before_plugin', self, plugin.name)
-                    response = self.__run_plugin(plugin, phase, args)
+                    response = self.__run_phase_plugin(plugin, phase)
                     if phase == 'input' and response:
                         # add entries returned by input to self.all_entries
                         for e in response:
@@ -499,6 +712,141 @@ class Task(object):
         if phase == 'prepare':
             self.check_config_hash()
 
+    def __run_phase_plugin(self, plugin, phase):
+        """Fires task.execute.before_plugin and runs the phase handler of `plugin` with its task config."""
+        # store execute info, except during entry events
+        self.current_phase = phase
+        self.current_plugin = plugin.name
+
+        if plugin.api_ver == 1:
+            # backwards compatibility
+            # pass method only task (old behaviour)
+            args = (self,)
+        else:
+            # pass method task, copy of config (so plugin cannot modify it)
+            args = (self, copy.copy(self.config.get(plugin.name)))
+
+        fire_event('task.execute.before_plugin', self, plugin.name)
+        if phase == 'input':
+            return self.rerun_cached_input(
+                plugin, self.config.get(plugin.name), lambda: self.__run_plugin(plugin, phase, args)
+            )
+        return self.__run_plugin(plugin, phase, args)
+
+    @staticmethod
+    def _input_reruns(plugin):
+        """Whether the input of `plugin` is run again on reruns, instead of re-injecting its entries."""
+        if plugin.builtin or 'list' in plugin.interfaces:
+            # Builtins have side effects, and lists can be modified by the task itself
+            return True
+        return getattr(plugin.phase_handlers['input'].func, 'rerun_input', False)
+
+    def rerun_cached_input(self, plugin, config, run_input):
+        """
+        Runs an input. On reruns, copies of the entries the input produced on an earlier run are returned instead,
+        unless the input has been marked with :func:`flexget.plugin.rerun_input`.
+
+        The entries are re-injected from the `after_input` snapshot the backlog builtin takes of the entries in the
+        task, so that they are only copied when the task is actually rerun.
+
+        :param PluginInfo plugin: The input plugin.
+        :param config: Config for the input.
+        :param run_input: Function which runs the input and returns its entries.
+        :return: Entries produced by the input.
+        """
+        if self._input_reruns(plugin):
+            return run_input()
+        key = (plugin.name, get_config_hash(config))
+        if key in self._rerun_inputs:
+            log.debug('Re-injecting entries produced by %s on the first run', plugin.name)
+            return [
+                entry.copy_from_snapshot('after_input', hooks)
+                for entry, hooks in self._rerun_inputs[key]
+            ]
+        result = run_input()
+        if result:
+            result = list(result)
+            if any(p.name == 'backlog' for p in self.plugins('input')):
+                kept = result
+            else:
+                # Nothing snapshots the entries before the task changes them
+                kept = copy.deepcopy(result)
+            self._rerun_inputs[key] = [(entry, entry.copy_hooks()) for entry in kept]
+        return result
+
+    def __run_input_phase_concurrently(self):
+        """
+        Runs the configured input plugins of the task on a pool of :attr:`input_concurrency` threads. Builtin inputs
+        are run in the task thread at their own position, after the inputs before them have finished and before the
+        ones after them start. Entries are added to the task in the same order as when run one by one.
+        """
+
+        def run_input(plugin):
+            try:
+                response = self.__run_phase_plugin(plugin, 'input')
+                # Generators need to be consumed while this thread still has the plugin session
+                return list(response) if response else response
+            finally:
+                fire_event('task.execute.after_plugin', self, plugin.name)
+
+        plugins = list(self.plugins('input'))
+        while plugins and 'input' not in self.disabled_phases:
+            # Builtins are run on their own, the configured inputs up to the next builtin concurrently
+            if plugins[0].builtin:
+                batch, max_workers = plugins[:1], 1
+            else:
+                batch = list(itertools.takewhile(lambda p: not p.builtin, plugins))
+                max_workers = self.input_concurrency
+            plugins = plugins[len(batch):]
+            for plugin, response in zip(batch, self.map_concurrent(run_input, batch, max_workers)):
+                if response:
+                    for e in response:
+                        e.task = self
+                        self.all_entries.append(e)
+                # Like when run one by one, inputs after the one disabling the phase don't count
+                if self._phase_disabled_by.get('input') == plugin.name:
+                    return
+
+    def map_concurrent(self, func, items, max_workers):
+        """
+        Calls `func` for each of `items` on a pool of at most `max_workers` threads.
+
+        Inside the calls :attr:`session` is a separate database session, and :attr:`current_plugin` and log output
+        are inherited from the calling thread. Exceptions are raised in the calling thread once all calls have finished.
+
+        :return: List of results in the same order as `items`.
+        """
+        from flexget import logger
+
+        items = list(items)
+        log_context = logger.get_context()
+        current_plugin = self.current_plugin
+
+        def call(item):
+            # Calls may be nested when run in the calling thread
+            previous = dict(self._thread_state.__dict__)
+            self._thread_state.active = True
+            self._thread_state.current_plugin = current_plugin
+            try:
+                with logger.use_context(log_context), Session() as session:
+                    self._thread_state.session = session
+                    return func(item)
+            finally:
+                self._thread_state.__dict__.clear()
+                self._thread_state.__dict__.update(previous)
+
+        if max_workers <= 1 or len(items) <= 1:
+            return [call(item) for item in items]
+
+        pool = ThreadPool(min(max_workers, len(items)))
+        try:
+            results = [pool.apply_async(call, (item,)) for item in items]
+            pool.close()
+            pool.join()
+        finally:
+            pool.terminate()
+        return [result.get() for result in results]
+
     def __run_plugin(self, plugin, phase, args=None, kwargs=None):
         """
         Execute given plugins phase method, with supplied args and kwargs.
@@ -686,10 +1034,14 @@ class Task(object):
 
         try:
             self.finished_event.clear()
+            # Log levels may have changed since the last task, check once which tracers are enabled for this one
+            refresh_tracers()
             if self.options.cron:
                 self.manager.db_cleanup()
             fire_event('task.execute.started', self)
             while True:
+                # Plugins need to see what was learned on previous runs of the task
+                db_writer.wait_for_task(self)
                 self._execute()
                 # rerun task
                 if (
@@ -699,8 +1051,7 @@ class Task(object):
                 ):
                     log.info('Rerunning the task in case better resolution can be achieved.')
                     self._rerun_count += 1
-                    # TODO: Potential optimization is to take snapshots (maybe make the ones backlog uses built in
-                    # instead of taking another one) after input and just inject the same entries for the rerun
+                    # Inputs are not run again unless they need to, see `rerun_cached_input`
                     self._all_entries = EntryContainer()
                     self._rerun = False
                     continue
@@ -710,6 +1061,8 @@ class Task(object):
                         % self._rerun_count
                     )
                 break
+            # Other tasks should see what this one has learned once it has completed
+            db_writer.wait_for_task(self)
             fire_event('task.execute.completed', self)
         finally:
             self.finished_event.set()
@@ -9,15 +9,84 @@ import time
 
 from sqlalchemy.exc import ProgrammingError, OperationalError
 
+from flexget import config_schema, plugin
+from flexget.event import event
 from flexget.task import TaskAbort
 
 log = logging.getLogger('task_queue')
 
 
+# Held by tasks which change process wide plugin state, these never run alongside any other task
+EXCLUSIVE = 'exclusive'
+
+
+def _task_configs(task):
+    """
+    Yields the config of `task` followed by the config of each template applied to it, in the order
+    the `template` plugin merges them. Templates are only merged once the task runs, but resources
+    may be declared in them.
+    """
+    yield task.config
+    names = task.config.get('template')
+    if names is False:
+        return
+    if names is None:
+        names = []
+    elif isinstance(names, str):
+        names = [names]
+    names = list(names)
+    if 'no_global' in names:
+        names = [name for name in names if name not in ('no_global', 'global')]
+    elif 'global' not in names:
+        names.append('global')
+    templates = task.manager.config.get('templates') or {}
+    for name in names:
+        template = templates.get(name)
+        if not template:
+            continue
+        nested = template.get('template') or []
+        if isinstance(nested, str):
+            nested = [nested]
+        names.extend(nested_name for nested_name in nested if nested_name not in names)
+        yield template
+
+
+def _as_list(value):
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def task_resources(task):
+    """
+    Returns the set of resources `task` needs exclusive access to while running.
+
+    A task always holds its own name, so that multiple executions of the same task are never run in
+    parallel. Additional resources can be declared with the `resources` plugin, in the task or in its
+    templates. Tasks which disable builtin plugins, or change plugin or quality priorities, hold
+    :data:`EXCLUSIVE`, as that affects every running task.
+    """
+    resources = {'task:%s' % task.name}
+    for config in _task_configs(task):
+        resources.update(_as_list(config.get('resources')))
+        if 'plugin_priority' in config or 'reorder_quality' in config:
+            resources.add(EXCLUSIVE)
+        for name in _as_list(config.get('disable')):
+            if name == 'builtins' or getattr(plugin.plugins.get(name), 'builtin', False):
+                resources.add(EXCLUSIVE)
+    return resources
+
+
 class TaskQueue(object):
     """
     Task processing thread.
-    Only executes one task at a time, if more are requested they are queued up and run in turn.
+    By default only executes one task at a time, if more are requested they are queued up and run in turn.
+
+    If `task_concurrency` is configured, up to that many tasks are run in parallel worker threads.
+    Tasks which share a resource are never run at the same time, and will always start in priority
+    order relative to each other. Tasks holding :data:`EXCLUSIVE` only run on their own.
     """
 
     def __init__(self):
@@ -26,6 +95,11 @@ class TaskQueue(object):
         self._shutdown_when_finished = False
 
         self.current_task = None
+        # Tasks taken from the run queue which are waiting on a resource, in priority order
+        self._waiting = []
+        # (task, resources) tuples of tasks currently executing
+        self._running = []
+        self._condition = threading.Condition()
 
         # We don't override `threading.Thread` because debugging this seems unsafe with pydevd.
         # Overriding __len__(self) seems to cause a debugger deadlock.
@@ -35,30 +109,42 @@ class TaskQueue(object):
     def start(self):
         self._thread.start()
 
+    @property
+    def running_tasks(self):
+        """A list of the tasks which are currently executing."""
+        with self._condition:
+            return [task for task, _ in self._running]
+
     def run(self):
         while not self._shutdown_now:
-            # Grab the first job from the run queue and do it
+            with self._condition:
+                if self._running and len(self._running) >= self._concurrency():
+                    # All workers are busy, wait for one of them to finish
+                    self._condition.wait(0.5)
+                    continue
+            # Grab the first job from the run queue
+            task = None
             try:
-                self.current_task = self.run_queue.get(timeout=0.5)
+                task = self.run_queue.get(timeout=0.1 if self._waiting else 0.5)
             except queue.Empty:
-                if self._shutdown_when_finished:
-                    self._shutdown_now = True
+                pass
+            else:
+                with self._condition:
+                    self._waiting.append(task)
+                    self._waiting.sort()
+            if self._start_ready() or task:
                 continue
-            try:
-                self.current_task.execute()
-            except TaskAbort as e:
-                log.debug('task %s aborted: %r' % (self.current_task.name, e))
-            except (ProgrammingError, OperationalError):
-                log.critical('Database error while running a task. Attempting to recover.')
-                self.current_task.manager.crash_report()
-            except Exception:
-                log.critical('BUG: Unhandled exception during task queue run loop.')
-                self.current_task.manager.crash_report()
-            finally:
-                self.run_queue.task_done()
-                self.current_task = None
-
-        remaining_jobs = self.run_queue.qsize()
+            with self._condition:
+                if self._waiting or self._running:
+                    # Nothing can start until a running task releases its resources
+                    self._condition.wait(0.5)
+                elif self._shutdown_when_finished:
+                    self._shutdown_now = True
+
+        with self._condition:
+            while self._running:
+                self._condition.wait(0.5)
+        remaining_jobs = self.run_queue.qsize() + len(self._waiting)
         if remaining_jobs:
             log.warning(
                 'task queue shut down with %s tasks remaining in the queue to run.'
@@ -67,6 +153,66 @@ class TaskQueue(object):
         else:
             log.debug('task queue shut down')
 
+    def _concurrency(self):
+        tasks = self._waiting or [task for task, _ in self._running]
+        if not tasks:
+            return 1
+        return max(1, tasks[0].manager.config.get('task_concurrency', 1))
+
+    def _start_ready(self):
+        """
+        Starts waiting tasks, in priority order, as long as there are free workers and their resources are available.
+
+        :return: True if any task was started
+        """
+        ready = []
+        with self._condition:
+            concurrency = self._concurrency()
+            held = set()
+            for _, resources in self._running:
+                held.update(resources)
+            for task in list(self._waiting):
+                if len(self._running) >= concurrency:
+                    break
+                resources = task_resources(task)
+                if resources & held or EXCLUSIVE in held or (EXCLUSIVE in resources and held):
+                    # Reserve the resources so lower priority tasks sharing them cannot jump ahead
+                    held.update(resources)
+                    continue
+                held.update(resources)
+                self._waiting.remove(task)
+                self._running.append((task, resources))
+                self.current_task = task
+                ready.append(task)
+        for task in ready:
+            if concurrency == 1:
+                self._execute(task)
+            else:
+                worker = threading.Thread(
+                    target=self._execute, args=(task,), name='task_queue_%s' % task.name
+                )
+                worker.daemon = True
+                worker.start()
+        return bool(ready)
+
+    def _execute(self, task):
+        try:
+            task.execute()
+        except TaskAbort as e:
+            log.debug('task %s aborted: %r' % (task.name, e))
+        except (ProgrammingError, OperationalError):
+            log.critical('Database error while running a task. Attempting to recover.')
+            task.manager.crash_report()
+        except Exception:
+            log.critical('BUG: Unhandled exception during task queue run loop.')
+            task.manager.crash_report()
+        finally:
+            with self._condition:
+                self._running = [running for running in self._running if running[0] is not task]
+                self.current_task = self._running[-1][0] if self._running else None
+                self._condition.notify_all()
+            self.run_queue.task_done()
+
     def is_alive(self):
         return self._thread.is_alive()
 
@@ -75,7 +221,7 @@ class TaskQueue(object):
         self.run_queue.put(task)
 
     def __len__(self):
-        return self.run_queue.qsize()
+        return self.run_queue.qsize() + len(self._waiting)
 
     def shutdown(self, finish_queue=True):
         """
@@ -86,10 +232,10 @@ class TaskQueue(object):
         log.debug('task queue shutdown requested')
         if finish_queue:
             self._shutdown_when_finished = True
-            if self.run_queue.qsize():
+            if len(self):
                 log.verbose(
                     'There are %s tasks to execute. Shutdown will commence when they have completed.'
-                    % self.run_queue.qsize()
+                    % len(self)
                 )
         else:
             self._shutdown_now = True
@@ -114,3 +260,8 @@ class TaskQueue(object):
             # We still wait to finish cleanly, pressing ctrl-c again will abort
             while self._thread.is_alive():
                 time.sleep(0.5)
+
+
+@event('config.register')
+def register_config():
+    config_schema.register_config_key('task_concurrency', {'type': 'integer', 'minimum': 1})
@@ -0,0 +1,32 @@
+from __future__ import unicode_literals, division, absolute_import
+from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
+
+import json
+
+from flexget import plugin
+from flexget.api.app import base_message
+from flexget.components.parsing.api import ObjectsContainer as OC
+
+
+class TestParsingCacheAPI(object):
+    config = 'tasks: {}'
+
+    def test_cache_stats(self, api_client, schema_match):
+        rsp = api_client.delete('/parsing/cache/')
+        assert rsp.status_code == 200
+        errors = schema_match(base_message, json.loads(rsp.get_data(as_text=True)))
+        assert not errors
+
+        parsing = plugin.get('parsing', 'tests')
+        for _ in range(4):
+            parsing.parse_movie('Some.Movie.2010.1080p')
+
+        rsp = api_client.get('/parsing/cache/')
+        assert rsp.status_code == 200
+        data = json.loads(rsp.get_data(as_text=True))
+        errors = schema_match(OC.cache_object, data)
+        assert not errors
+        assert data['hits'] == 3
+        assert data['misses'] == 1
+        assert data['hit_rate'] == 0.75
+        assert data['size'] == 1
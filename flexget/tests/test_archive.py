@@ -0,0 +1,84 @@
+from __future__ import unicode_literals, division, absolute_import
+from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
+
+from flexget.components.archive import db
+from flexget.manager import Session
+
+
+class TestArchive(object):
+    config = """
+        tasks:
+          archive:
+            mock:
+              - {title: 'Some.Show.S01E01.720p.HDTV-FlexGet', url: 'http://localhost/1'}
+              - {title: 'Some.Show.S01E02.720p.HDTV-FlexGet', url: 'http://localhost/2'}
+              - {title: 'Other.Show.S01E01.720p.HDTV-FlexGet', url: 'http://localhost/3'}
+              - {title: 'Some Show S01E01 1080p WEB-DL', url: 'http://localhost/4'}
+            archive:
+              - tv
+          archive_movies:
+            mock:
+              - {title: 'Some.Movie.2018.1080p.BluRay', url: 'http://localhost/5'}
+            archive: yes
+          search:
+            discover:
+              what:
+                - mock:
+                    - {title: 'Some Show S01E01'}
+              from:
+                - flexget_archive: yes
+              release_estimations: ignore
+    """
+
+    def titles(self, text, **kwargs):
+        with Session() as session:
+            return sorted(entry.title for entry in db.search(session, text, **kwargs))
+
+    def test_search(self, execute_task):
+        execute_task('archive')
+        execute_task('archive_movies')
+        with Session() as session:
+            assert db.has_fts_index(session)
+        assert self.titles('Some Show S01E01') == [
+            'Some Show S01E01 1080p WEB-DL',
+            'Some.Show.S01E01.720p.HDTV-FlexGet',
+        ]
+        assert self.titles('some.show') == [
+            'Some Show S01E01 1080p WEB-DL',
+            'Some.Show.S01E01.720p.HDTV-FlexGet',
+            'Some.Show.S01E02.720p.HDTV-FlexGet',
+        ]
+        # Matches have to start from the beginning of the title
+        assert self.titles('Show S01E01') == []
+        assert self.titles('Some', tags=['tv']) == [
+            'Some Show S01E01 1080p WEB-DL',
+            'Some.Show.S01E01.720p.HDTV-FlexGet',
+            'Some.Show.S01E02.720p.HDTV-FlexGet',
+        ]
+        assert self.titles('Some', sources=['archive_movies']) == ['Some.Movie.2018.1080p.BluRay']
+        assert len(self.titles('Some', limit=2)) == 2
+
+    def test_index_maintained(self, execute_task):
+        execute_task('archive')
+        with Session() as session:
+            entry = (
+                session.query(db.ArchiveEntry)
+                .filter(db.ArchiveEntry.title == 'Other.Show.S01E01.720p.HDTV-FlexGet')
+                .one()
+            )
+            entry.title = 'Renamed.Show.S01E01.720p.HDTV-FlexGet'
+        assert self.titles('Other Show') == []
+        assert self.titles('Renamed Show') == ['Renamed.Show.S01E01.720p.HDTV-FlexGet']
+        with Session() as session:
+            session.query(db.ArchiveEntry).filter(db.ArchiveEntry.title.like('Some%')).delete(
+                synchronize_session=False
+            )
+        assert self.titles('Some Show') == []
+
+    def test_discover(self, execute_task):
+        execute_task('archive')
+        task = execute_task('search')
+        assert sorted(entry['url'] for entry in task.entries) == [
+            'http://localhost/1',
+            'http://localhost/4',
+        ]
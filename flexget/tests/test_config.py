@@ -5,7 +5,7 @@ from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 import os
 import pytest
 
-from flexget.manager import Manager
+from flexget.manager import Manager, create_engine, database_status, prepare_database_config
 
 config_utf8 = os.path.join(os.path.dirname(__file__), 'config_utf8.yml')
 
@@ -27,3 +27,41 @@ class TestConfig(object):
         manager._init_config()
         manager.load_config()
         assert manager.config, 'Config didn\'t load'
+
+
+class TestDatabaseConfig(object):
+    config = """
+        database:
+          mmap_size: 1 MiB
+          pool_size: 2
+        tasks: {}
+    """
+
+    def test_prepare_config(self, manager):
+        assert prepare_database_config(None) is None
+        assert prepare_database_config(False) is None
+        config = prepare_database_config(manager.config['database'])
+        assert config['journal_mode'] == 'wal'
+        assert config['synchronous'] == 'normal'
+        assert config['mmap_size'] == 1024 * 1024
+        assert config['cache_size'] == 64 * 1024 * 1024
+        assert config['pool_size'] == 2
+
+    def test_engine(self, manager, tmpdir):
+        config = prepare_database_config(manager.config['database'])
+        uri = 'sqlite:///%s' % tmpdir.join('test.sqlite').strpath
+        engine = create_engine(uri, config)
+        try:
+            status = dict(database_status(engine))
+        finally:
+            engine.dispose()
+        assert status['journal_mode'] == 'wal'
+        assert status['synchronous'] == 'normal'
+        assert status['cache_size'] == -64 * 1024
+        assert status['temp_store'] == 'memory'
+        assert status['busy_timeout'] == 10000
+        assert status['pool'] == 'QueuePool'
+        assert status['pool_size'] == 2
+
+    def test_not_applied_to_memory_database(self, manager):
+        assert manager.database_config is None
@@ -1,6 +1,78 @@
 from __future__ import unicode_literals, division, absolute_import
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
+import time
+
+from flexget import plugin
+from flexget.entry import Entry
+from flexget.event import event
+
+
+class SessionInput(object):
+    """Fake input plugin, fails without a database session."""
+
+    def on_task_input(self, task, config):
+        assert task.session is not None, 'no session'
+        return [Entry(title='session', url='http://session')]
+
+
+class DisablingInput(object):
+    """Fake input plugin, disables the rest of the input phase."""
+
+    @plugin.priority(200)
+    def on_task_input(self, task, config):
+        task.disable_phase('input')
+        return [Entry(title='disabling', url='http://disabling')]
+
+
+# Inputs run by the ordered input plugins, in the order they ran
+ordered_calls = []
+
+
+class EarlyInput(object):
+    """Fake input plugin, slow and run before the builtin test input."""
+
+    @plugin.priority(200)
+    def on_task_input(self, task, config):
+        time.sleep(0.2)
+        ordered_calls.append('early')
+        return [Entry(title='early', url='http://early')]
+
+
+class BuiltinInput(object):
+    """Fake input plugin, enabled as builtin by tests. Records the entries produced before it."""
+
+    @plugin.priority(150)
+    def on_task_input(self, task, config):
+        ordered_calls.append(('builtin', [e['title'] for e in task.all_entries]))
+
+
+class FailingInput(object):
+    """Fake input plugin, enabled as builtin by tests."""
+
+    @plugin.priority(150)
+    def on_task_input(self, task, config):
+        raise plugin.PluginError('failing input')
+
+
+class LateInput(object):
+    """Fake input plugin, run after the builtin test input."""
+
+    @plugin.priority(100)
+    def on_task_input(self, task, config):
+        ordered_calls.append('late')
+        return [Entry(title='late', url='http://late')]
+
+
+@event('plugin.register')
+def register_plugin():
+    plugin.register(SessionInput, 'test_session_input', api_ver=2, debug=True)
+    plugin.register(DisablingInput, 'test_disabling_input', api_ver=2, debug=True)
+    plugin.register(EarlyInput, 'test_early_input', api_ver=2, debug=True)
+    plugin.register(BuiltinInput, 'test_builtin_input', api_ver=2, debug=True)
+    plugin.register(FailingInput, 'test_failing_input', api_ver=2, debug=True)
+    plugin.register(LateInput, 'test_late_input', api_ver=2, debug=True)
+
 
 class TestInputs(object):
     config = """
@@ -26,6 +98,38 @@ class TestInputs(object):
                   - title: title1
               - mock:
                   - title: title2
+          test_parallel_no_dupes:
+            parallel_inputs: 2
+            inputs:
+              - mock:
+                  - {title: 'title1a', url: 'http://url1'}
+                  - {title: 'title2', url: 'http://url2a'}
+              - mock:
+                  - {title: 'title1b', url: 'http://url1'}
+                  - {title: 'title1c', url: 'http://other', urls: ['http://url1']}
+                  - {title: 'title2', url: 'http://url2b'}
+                  - {title: 'title3', url: 'http://url3'}
+          test_parallel_phase:
+            parallel_inputs: yes
+            mock:
+              - {title: 'title1'}
+            inputs:
+              - mock:
+                  - {title: 'title2'}
+                  - {title: 'title3'}
+          test_parallel_single_input:
+            parallel_inputs: yes
+            test_session_input: yes
+          test_parallel_disabled_phase:
+            parallel_inputs: 2
+            test_disabling_input: yes
+            test_session_input: yes
+            mock:
+              - {title: 'title1'}
+          test_parallel_builtin_order:
+            parallel_inputs: 2
+            test_early_input: yes
+            test_late_input: yes
     """
 
     def test_inputs(self, execute_task):
@@ -37,3 +141,35 @@ class TestInputs(object):
         assert len(task.entries) == 2, 'Should only have created 2 entries'
         assert task.find_entry(title='title1a'), 'title1a should be in entries'
         assert task.find_entry(title='title2'), 'title2 should be in entries'
+
+    def test_parallel_no_dupes(self, execute_task):
+        task = execute_task('test_parallel_no_dupes')
+        assert [e['title'] for e in task.entries] == ['title1a', 'title2', 'title3']
+
+    def test_parallel_phase(self, execute_task):
+        task = execute_task('test_parallel_phase')
+        assert len(task.entries) == 3, 'Should have created 3 entries'
+        for entry in task.entries:
+            assert entry.task is task
+
+    def test_parallel_single_input(self, execute_task):
+        task = execute_task('test_parallel_single_input')
+        assert [e['title'] for e in task.entries] == ['session']
+
+    def test_parallel_disabled_phase(self, execute_task):
+        task = execute_task('test_parallel_disabled_phase')
+        assert [e['title'] for e in task.entries] == ['disabling']
+
+    def test_parallel_builtin_order(self, execute_task, monkeypatch):
+        monkeypatch.setattr(plugin.get_plugin_by_name('test_builtin_input'), 'builtin', True)
+        del ordered_calls[:]
+        task = execute_task('test_parallel_builtin_order')
+        assert ordered_calls == ['early', ('builtin', ['early']), 'late']
+        assert [e['title'] for e in task.entries] == ['early', 'late']
+
+    def test_parallel_failing_builtin(self, execute_task, monkeypatch):
+        del ordered_calls[:]
+        monkeypatch.setattr(plugin.get_plugin_by_name('test_failing_input'), 'builtin', True)
+        task = execute_task('test_parallel_builtin_order', abort=True)
+        assert task.abort_reason == 'failing input'
+        assert ordered_calls == ['early'], 'inputs after the failed builtin should not run'
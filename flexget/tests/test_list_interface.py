@@ -1,6 +1,10 @@
 from __future__ import unicode_literals, division, absolute_import
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
+from flexget.components.managed_lists.lists.entry_list.db import DBEntrySet
+from flexget.components.managed_lists.lists.movie_list.movie_list import MovieList
+from flexget.entry import Entry
+
 
 class TestListInterface(object):
     config = """
@@ -327,3 +331,48 @@ class TestListInterface(object):
         entry = task.find_entry(title="title 1")
         assert entry
         assert entry['attribute_name'] == 'some data'
+
+
+class TestListMatchers(object):
+    config = """
+        tasks: {}
+    """
+
+    def test_movie_list_matcher(self, manager):
+        movie_list = MovieList('matcher')
+        movie_list.add(Entry(title='Drumline (2002)', movie_name='Drumline', movie_year=2002))
+        movie_list.add(Entry(title='The 5th Wave', imdb_id='tt2304933'))
+        matcher = movie_list.matcher()
+
+        def lookup(entry):
+            raise AssertionError('lazy lookup should not be triggered')
+
+        entries = [
+            Entry(title='Drumline 2002 1080p BluRay x264-FuzerHD'),
+            Entry(title='Drumline 2003 1080p BluRay x264-FuzerHD'),
+            Entry(title='Something Else 2016 720p WEB-DL', imdb_id='tt2304933'),
+            Entry(title='Unrelated 2016 720p WEB-DL'),
+        ]
+        entries[3].register_lazy_func(lookup, ['imdb_id'])
+        matches = [matcher.get(entry) for entry in entries]
+        assert [m['title'] if m else None for m in matches] == [
+            'Drumline (2002)',
+            None,
+            'The 5th Wave',
+            None,
+        ]
+        assert matches[:3] == [movie_list.get(entry) for entry in entries[:3]]
+
+    def test_entry_list_matcher(self, manager):
+        entry_list = DBEntrySet('matcher')
+        entry_list.add(Entry(title='title 1', url='http://mock.url/file1.torrent'))
+        entry_list.add(Entry(title='title 2', url='http://mock.url/file2.torrent'))
+        matcher = entry_list.matcher()
+        entries = [
+            Entry(title='title 1', url='http://mock.url/other.torrent'),
+            Entry(title='title 2', url='http://mock.url/file2.torrent'),
+            Entry(title='title 3', url='http://mock.url/file3.torrent'),
+        ]
+        matches = [matcher.get(entry) for entry in entries]
+        assert [m['title'] if m else None for m in matches] == ['title 1', 'title 2', None]
+        assert matches == [entry_list.get(entry) for entry in entries]
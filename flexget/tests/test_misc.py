@@ -4,6 +4,8 @@ from __future__ import unicode_literals, division, absolute_import
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 from future.utils import text_type
 
+import json
+import logging
 import os
 import stat
 import sys
@@ -11,6 +13,7 @@ import sys
 import pytest
 
 from flexget.entry import EntryUnicodeError, Entry
+from flexget.logger import ENV_TRACE, TRACE, Tracer, refresh_tracers
 
 
 class TestDisableBuiltins(object):
@@ -304,3 +307,70 @@ class TestSetPlugin(object):
         entry = task.find_entry('entries', title='Entry 1')
         assert (isinstance(entry['int_field'], int)), 'should allow setting values as integers rather than strings'
         assert entry['int_field'] == 3
+
+
+class TestTracer(object):
+    class Unrepresentable(object):
+        def __repr__(self):
+            raise AssertionError('repr should not be called when tracing is off')
+
+    @pytest.yield_fixture()
+    def tracer_log(self):
+        log = logging.getLogger('test_tracer')
+        yield log
+        log.setLevel(logging.NOTSET)
+
+    def test_disabled(self, tracer_log):
+        tracer_log.setLevel(logging.DEBUG)
+        tracer = Tracer('test_tracer', tracer_log)
+        assert not tracer.enabled
+        tracer('value: %r', self.Unrepresentable())
+
+    def test_enabled(self, tracer_log, caplog):
+        tracer = Tracer('test_tracer', tracer_log)
+        tracer_log.setLevel(TRACE)
+        assert not tracer.enabled, 'should only be updated on refresh'
+        refresh_tracers()
+        assert tracer.enabled
+        with caplog.at_level(TRACE, logger='test_tracer'):
+            tracer('value: %s', 42)
+        assert 'value: 42' in caplog.text
+
+    def test_subsystems(self, tracer_log, monkeypatch):
+        tracer_log.setLevel(TRACE)
+        tracer = Tracer('test_tracer', tracer_log)
+        monkeypatch.setenv(ENV_TRACE, 'entry, test_tracer')
+        tracer.refresh()
+        assert tracer.enabled
+        monkeypatch.setenv(ENV_TRACE, 'entry')
+        tracer.refresh()
+        assert not tracer.enabled
+
+
+class TestPerformance(object):
+    config = """
+        tasks:
+          test:
+            mock:
+              - {title: 'Entry 1'}
+              - {title: 'Entry 2'}
+            accept_all: yes
+    """
+
+    def test_results_written(self, execute_task, manager, tmpdir):
+        manager.config_base = tmpdir.strpath
+        task = execute_task('test', options={'debug_perf': True})
+        assert len(task.accepted) == 2
+        results = tmpdir.join('perf').listdir(fil=lambda p: p.ext == '.json')
+        assert len(results) == 1, 'should write one result file per task run'
+        data = json.loads(results[0].read())
+        assert data['task'] == 'test'
+        assert data['completed']
+        assert data['entries']['accepted'] == 2
+        assert 'mock' in data['phases']['input']['plugins']
+        assert data['phases']['filter']['plugins']['accept_all']['calls'] == 1
+
+    def test_disabled(self, execute_task, manager, tmpdir):
+        manager.config_base = tmpdir.strpath
+        execute_task('test')
+        assert not tmpdir.join('perf').check()
@@ -4,7 +4,9 @@ from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 import pytest
 from jinja2 import Template
 
+from flexget import plugin
 from flexget.entry import Entry
+from flexget.task import Task
 
 
 class TestNextSeriesEpisodes(object):
@@ -242,6 +244,19 @@ class TestNextSeriesEpisodes(object):
         assert len(task.all_entries) == 1
         assert not task.find_entry(title='Test Series 8 S02E01')
 
+    def test_next_series_episodes_rerun_entries_per_task(self, manager):
+        # Tasks may run concurrently, the entries one queued for its rerun must not be lost
+        instance = plugin.get_plugin_by_name('next_series_episodes').instance
+        first = Task(manager, 'first', config={})
+        second = Task(manager, 'second', config={})
+        instance.on_task_input(first, True)
+        instance.rerun_entries['first'].append(Entry(title='Test Series 1 S01E02', url=''))
+        instance.on_task_input(second, True)
+        first._rerun_count = 1
+        assert [e['title'] for e in instance.on_task_input(first, True)] == [
+            'Test Series 1 S01E02'
+        ]
+
 
 class TestNextSeriesEpisodesSeasonPack(object):
     _config = """
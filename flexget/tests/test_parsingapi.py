@@ -1,15 +1,21 @@
 from __future__ import unicode_literals, division, absolute_import
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
+import pytest
+
 from flexget.components.parsing import plugin_parsing
 from flexget import plugin
+from flexget.utils import qualities
 
 
 class TestParsingAPI(object):
     def test_all_types_handled(self):
         declared_types = set(plugin_parsing.PARSER_TYPES)
+        # parse_<type>_many methods parse batches of the same type
         method_handlers = set(
-            m[6:] for m in dir(plugin.get('parsing', 'tests')) if m.startswith('parse_')
+            m[6:]
+            for m in dir(plugin.get('parsing', 'tests'))
+            if m.startswith('parse_') and not m.endswith('_many')
         )
         assert set(declared_types) == set(
             method_handlers
@@ -38,3 +44,75 @@ class TestTaskParsing(object):
         # make sure when a non-default parser is installed on a task, it doesn't affect other tasks
         execute_task('explicit_parser')
         assert not plugin_parsing.selected_parsers
+
+
+class TestParseCache(object):
+    config = 'tasks: {}'
+
+    def test_cached_results_are_copies(self, manager):
+        plugin_parsing.parse_cache.clear()
+        parsing = plugin.get('parsing', 'tests')
+        first = parsing.parse_series('Some.Show.S01E01.720p', name='Some Show')
+        first.field = 'title'
+        first.quality.resolution = first.quality.resolution - 1
+        second = parsing.parse_series('Some.Show.S01E01.720p', name='Some Show')
+        assert second is not first
+        assert second.quality.name == '720p'
+        assert not hasattr(second, 'field')
+        assert second.identifier == 'S01E01'
+        assert plugin_parsing.parse_cache.info()['hits'] == 1
+
+    def test_key_includes_kwargs(self, manager):
+        parsing = plugin.get('parsing', 'tests')
+        assert parsing.parse_series('Some.Show.S01E01', name='Some Show').valid
+        assert not parsing.parse_series('Some.Show.S01E01', name='Other Show').valid
+        assert parsing.parse_movie('Some.Movie.2010.1080p').name == 'Some Movie'
+
+
+class TestParseSeriesMany(object):
+    config = """
+        guessit_pool:
+          workers: 2
+          min_batch: 2
+        tasks: {}
+    """
+
+    titles = [
+        'Some.Show.S01E01.720p.HDTV',
+        'Some.Show.S01E02.1080p.WEB-DL.DD5.1',
+        'Other.Show.S01E01',
+        'Some.Show.2012.05.30',
+        'Some.Show.S01E01.720p.HDTV',
+    ]
+
+    @pytest.mark.parametrize('parser', ['internal', 'guessit'])
+    def test_same_as_single(self, manager, parser):
+        plugin_parsing.parse_cache.clear()
+        plugin_parsing.selected_parsers['series'] = parser
+        try:
+            parsing = plugin.get('parsing', 'tests')
+            results = parsing.parse_series_many(self.titles, name='Some Show')
+            plugin_parsing.parse_cache.clear()
+            expected = [parsing.parse_series(title, name='Some Show') for title in self.titles]
+        finally:
+            plugin_parsing.selected_parsers.clear()
+        assert [str(r) for r in results] == [str(r) for r in expected]
+        assert [r.quality for r in results] == [r.quality for r in expected]
+        assert results[0] is not results[-1]
+
+    def test_worker_processes(self, manager):
+        from flexget.components.parsing.parsers import parser_guessit
+
+        assert parser_guessit.pool_config == (2, 2)
+        results = parser_guessit.ParserGuessit().parse_series_many(self.titles, name='Some Show')
+        assert parser_guessit.pool is not None
+        assert [r.identifier if r.valid else None for r in results] == [
+            'S01E01',
+            'S01E02',
+            None,
+            '2012-05-30',
+            'S01E01',
+        ]
+        assert results[1].quality.name == '1080p webdl dd5.1'
+        # Quality components are not copied by unpickling
+        assert results[0].quality.resolution is qualities.get('720p').resolution
@@ -3,11 +3,12 @@ from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
 import os
 import glob
+import sys
 
 import pytest
 
 from flexget import plugin, plugins
-from flexget.event import event, fire_event
+from flexget.event import event, fire_event, remove_event_handlers
 
 
 @pytest.mark.chdir
@@ -89,3 +90,72 @@ class TestExternalPluginLoading(object):
         # TODO: This isn't working because calling load_plugins again doesn't cause the schema for tasks to regenerate
         task = execute_task('ext_plugin')
         assert task.find_entry(title='test entry'), 'External plugin did not create entry'
+
+
+class TestPluginManifest(object):
+    plugin_source = """
+from flexget import plugin
+from flexget.event import event
+
+
+class ManifestPlugin(object):
+    schema = {'type': 'boolean'}
+
+    def on_task_input(self, task, config):
+        return []
+
+
+@event('plugin.register')
+def register_plugin():
+    plugin.register(ManifestPlugin, 'manifest_plugin', api_ver=2)
+"""
+
+    @pytest.yield_fixture()
+    def plugin_dir(self, tmpdir):
+        tmpdir.join('manifest_plugin.py').write(self.plugin_source)
+        tmpdir.join('manifest_command.py').write('')
+        yield tmpdir.strpath
+        plugin.plugins.pop('manifest_plugin', None)
+        remove_event_handlers('plugin.manifest_plugin.input')
+        for module_name in ('flexget.plugins.manifest_plugin', 'flexget.plugins.manifest_command'):
+            sys.modules.pop(module_name, None)
+        # Restore the standard plugin path
+        plugin.load_plugins()
+
+    def test_lazy_load(self, plugin_dir):
+        manifest_path = os.path.join(plugin_dir, 'manifest.json')
+        plugin.load_plugins(extra_plugins=[plugin_dir], manifest_path=manifest_path)
+        plugin.write_manifest(manifest_path, {'manifest': 'flexget.plugins.manifest_command'})
+        assert os.path.exists(manifest_path)
+
+        # Pretend this is a new process, running a command which does not need the plugin
+        del plugin.plugins['manifest_plugin']
+        remove_event_handlers('plugin.manifest_plugin.input')
+        del sys.modules['flexget.plugins.manifest_plugin']
+        plugin.load_plugins(
+            extra_plugins=[plugin_dir], manifest_path=manifest_path, command='manifest'
+        )
+        assert 'flexget.plugins.manifest_command' in sys.modules
+        assert 'flexget.plugins.manifest_plugin' not in sys.modules
+        assert 'manifest_plugin' not in plugin.plugins
+        assert 'manifest_plugin' in plugin.plugin_schemas()['properties']
+
+        assert plugin.get_plugin_by_name('manifest_plugin').name == 'manifest_plugin'
+        assert 'flexget.plugins.manifest_plugin' in sys.modules
+        assert 'manifest_plugin' in [p.name for p in plugin.get_plugins(phase='input')]
+
+    def test_stale_manifest(self, plugin_dir):
+        manifest_path = os.path.join(plugin_dir, 'manifest.json')
+        plugin.load_plugins(extra_plugins=[plugin_dir], manifest_path=manifest_path)
+        plugin.write_manifest(manifest_path, {'manifest': 'flexget.plugins.manifest_command'})
+
+        del plugin.plugins['manifest_plugin']
+        remove_event_handlers('plugin.manifest_plugin.input')
+        del sys.modules['flexget.plugins.manifest_plugin']
+        # Changing a module invalidates the manifest, so everything is loaded
+        with open(os.path.join(plugin_dir, 'manifest_plugin.py'), 'a') as f:
+            f.write('\n# changed\n')
+        plugin.load_plugins(
+            extra_plugins=[plugin_dir], manifest_path=manifest_path, command='manifest'
+        )
+        assert 'manifest_plugin' in plugin.plugins
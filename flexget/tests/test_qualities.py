@@ -6,6 +6,7 @@ from jinja2 import Template
 
 from flexget.components.parsing.parsers.parser_guessit import ParserGuessit
 from flexget.components.parsing.parsers.parser_internal import ParserInternal
+from flexget.utils import qualities
 from flexget.utils.qualities import Quality
 
 
@@ -20,6 +21,91 @@ class TestQualityModule(object):
             assert got_val == '720p', got_val
 
 
+class TestQualityParseCache(object):
+    corpus = [
+        '',
+        'foobar',
+        'Test.File.dvdscr',
+        'Test.File 1080p.web.vp9',
+        'Test.File.1080.webrandom',
+        'Test.File.WebHD.720p',
+        'Test.File.720hd.bluray',
+        'A Movie 2011 TS 576P XviD-DTRG',
+        'Test.File.720p.bluray.r5',
+        'Test.File.1080p.bluray.rc',
+        'Test.File.1280x720_web dl',
+        'Test.File.REPACK.1080p.WEBRip.DDP5.1.x264',
+        'Test.File.dvd.rip.r5',
+        'Test.File.ts.dvdrip.avi',
+        'Test.File.HDCAM.bluray.lie',
+        'Test.File.[576p][00112233].mkv',
+        'Tsar.File.720p',
+        'Camera.1080p',
+        'Test.File.DTS.HDMA',
+        'Test.File.DTSHDMA5.1',
+        'Test.File.truehd.7.1',
+        'Test.File.DD2.0',
+        'Test.File.AC35.1',
+        'Test.File.FLAC1.0',
+        'Show.S01E01.720p.HDTV.x264-GRP',
+        'Show S01E01 1080i HDTV DD5.1 MPEG2',
+        'Show.S01E01.2160p.WEB-DL.HEVC.10bit.DDP5.1.Atmos',
+        'Show.S01E01.4K.HDR.BluRay.REMUX.TrueHD.7.1',
+        'Show.S01E01.720p.720p.web.webrip.hdtv',
+        'Movie.2010.PDTV.XviD.MP3',
+        'Movie.2010.DVB.Rip.DivX',
+        'Movie.2010.HDRip.AAC2.0.h.264',
+        'Movie.2010.TELECINE.PPV.Rip.WORKPRINT',
+        'Movie.2010.Web.Screener.Rip',
+        'Movie.2010.BDScreener.1080p',
+        'Movie.2010.HD-TS.HD-Rip',
+        'Movie_2010_1920x1080p60_Blu-Ray_DTS-HD_MA_5.1',
+        'Movie (2010) [720p] [BrRip] [YIFY]',
+        'Movie.2010.Hi10P.BD.Rip.FLAC',
+        'web hdtv rip',
+        'dts hd',
+        'Test.File.HR.tvrip.dsrip',
+    ]
+
+    @staticmethod
+    def reference_parse(text):
+        """Parse `text` one component at a time, without the pre-scan or cache"""
+        clean_text = text
+        found = []
+        for items, strip_all in (
+            (qualities._resolutions, False),
+            (qualities._sources, True),
+            (qualities._codecs, True),
+            (qualities._audios, True),
+        ):
+            result = None
+            search_in = clean_text
+            for item in items:
+                matches, remaining = item.matches(search_in)
+                if matches:
+                    result = item
+                    clean_text = remaining
+                    if strip_all:
+                        search_in = clean_text
+                    if item.modifier is not None:
+                        break
+            found.append(result or qualities._UNKNOWNS[items[0].type])
+        return tuple(found) + (clean_text,)
+
+    @pytest.mark.parametrize('text', corpus)
+    def test_unchanged(self, text):
+        expected = self.reference_parse(text)
+        for _ in range(2):
+            quality = Quality(text)
+            parsed = quality.components + [quality.clean_text]
+            assert tuple(parsed) == expected, 'quality of `%s` differs' % text
+
+    def test_instances_not_shared(self):
+        quality = Quality('Test.File.720p.hdtv')
+        quality.resolution = qualities.get('1080p').resolution
+        assert Quality('Test.File.720p.hdtv').name == '720p hdtv'
+
+
 class TestQualityParser(object):
     @pytest.fixture(
         scope='class', params=['internal', 'guessit'], ids=['internal', 'guessit'], autouse=True
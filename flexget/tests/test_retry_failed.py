@@ -0,0 +1,42 @@
+from __future__ import unicode_literals, division, absolute_import
+from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
+
+from datetime import datetime, timedelta
+
+from flexget.components.failed.db import FailedEntry
+from flexget.manager import Session
+
+
+class TestRetryFailed(object):
+    config = """
+        tasks:
+          test:
+            mock:
+              - {title: 'entry 1', url: 'http://localhost/1'}
+              - {title: 'entry 2', url: 'http://localhost/2'}
+              - {title: 'entry 3', url: 'http://localhost/3'}
+              - {title: 'entry 4', url: 'http://localhost/4'}
+            retry_failed:
+              max_retries: 2
+            accept_all: yes
+    """
+
+    def add_failed(self, title, url, count, retry_time):
+        with Session() as session:
+            item = FailedEntry(title, url, 'broken')
+            item.count = count
+            item.retry_time = retry_time
+            session.add(item)
+
+    def test_rejects_failed(self, execute_task):
+        now = datetime.now()
+        self.add_failed('entry 1', 'http://localhost/1', 3, now - timedelta(hours=1))
+        self.add_failed('entry 2', 'http://localhost/2', 1, now + timedelta(hours=1))
+        self.add_failed('entry 3', 'http://localhost/3', 1, now - timedelta(hours=1))
+        # Same title from another url is a different entry
+        self.add_failed('entry 4', 'http://localhost/other', 3, now - timedelta(hours=1))
+        task = execute_task('test')
+        assert sorted(entry['title'] for entry in task.rejected) == ['entry 1', 'entry 2']
+        assert 'failed 3 times' in task.find_entry('rejected', title='entry 1')['reason']
+        assert 'Waiting before retrying' in task.find_entry('rejected', title='entry 2')['reason']
+        assert sorted(entry['title'] for entry in task.accepted) == ['entry 3', 'entry 4']
@@ -1,6 +1,11 @@
 from __future__ import unicode_literals, division, absolute_import
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
+import pytest
+
+from flexget.components.seen.index import BloomFilter, seen_index
+from flexget.entry import Entry
+
 
 class TestFilterSeen(object):
     config = """
@@ -29,6 +34,9 @@ class TestFilterSeen(object):
             - title: learned entry
             accept_all: yes
             mock_output: yes
+
+          test_many:
+            generate: 1000
     """
 
     def test_seen(self, execute_task):
@@ -64,6 +72,16 @@ class TestFilterSeen(object):
         task = execute_task('test_learn')
         assert len(task.rejected) == 1, 'Seen plugin should have rejected on second run'
 
+    def test_seen_many(self, execute_task):
+        # more values than fit in a single query
+        task = execute_task('test_many')
+        assert len(task.accepted) == 1000
+        entries = [Entry(e) for e in task.accepted[:950]]
+        entries.append(Entry(title='New title', url='http://localhost/new'))
+        task = execute_task('test_many', options={'inject': entries})
+        assert len(task.rejected) == 950, 'all previously accepted entries should be seen'
+        assert task.find_entry('accepted', title='New title'), 'new entry should be accepted'
+
 
 class TestSeenLocal(object):
     config = """
@@ -199,3 +217,52 @@ class TestFilterSeenMovies(object):
         task = execute_task('test_2')
         msg = 'Changing scope should not have rejected Seen movie title 13'
         assert not task.find_entry('rejected', title='Seen movie title 13'), msg
+
+
+class TestSeenIndex(object):
+    config = """
+        tasks:
+          test:
+            mock:
+              - {title: 'Seen title 1', url: 'http://localhost/seen1'}
+              - {title: 'Seen title 2', url: 'http://localhost/seen2'}
+            accept_all: yes
+    """
+
+    @pytest.yield_fixture()
+    def index(self):
+        # The database is not shared with other threads in tests, load the index from a fixed list
+        seen_index.configure(1, lambda: (1, ['Seen title 2']))
+        seen_index.wait()
+        yield seen_index
+        seen_index.configure(None)
+
+    def test_bloom_filter(self):
+        bloom = BloomFilter(1000)
+        values = ['value %s' % i for i in range(1000)]
+        for value in values:
+            bloom.add(value)
+        assert all(value in bloom for value in values), 'should not have false negatives'
+        false_positives = sum('other %s' % i in bloom for i in range(1000))
+        assert false_positives < 50
+        assert not bloom.full
+
+    def test_index(self, execute_task, index):
+        assert index.ready
+        assert index.might_contain('Seen title 2')
+        assert not index.might_contain('Seen title 1')
+
+        task = execute_task('test')
+        assert len(task.accepted) == 2
+        assert index.might_contain('Seen title 1'), 'committed values should be added to the index'
+        assert index.might_contain('http://localhost/seen1')
+        task = execute_task('test')
+        assert len(task.rejected) == 2, 'entries should be rejected using the index'
+
+    def test_index_rebuild(self, index):
+        index.add(['value %s' % i for i in range(200000)])
+        assert not index.ready, 'should rebuild when over capacity'
+        index.wait()
+        assert index.ready
+        assert index.might_contain('Seen title 2')
+        assert not index.might_contain('Seen title 1')
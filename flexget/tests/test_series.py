@@ -6,6 +6,7 @@ from io import StringIO
 import pytest
 from jinja2 import Template
 
+from flexget import plugin
 from flexget.entry import Entry
 from flexget.logger import capture_output
 from flexget.manager import get_parser, Session
@@ -2141,6 +2142,51 @@ class TestAlternateNames(object):
             ), 'The alternate name in the database should be the new one, Good Show.'
 
 
+class TestSeriesNameIndex(object):
+    config = """
+        templates:
+          global:
+            parsing:
+              series: {{parser}}
+        tasks:
+          candidates:
+            mock:
+              - title: '[group] FooBar.S01E01.720p'
+              - title: 'HD 720p: Foo.Bar.S01E02'
+              - title: Other.Name.S01E01
+              - title: rs.S01E01
+              - title: Foo.S01E01
+            series:
+              - Foo Bar
+              - The Show:
+                  alternate_name: Other Name
+              - Regexp Show:
+                  name_regexp: '^rs'
+    """
+
+    def test_candidates(self):
+        from flexget.components.series.utils import SeriesNameIndex
+
+        index = SeriesNameIndex()
+        index.add(1, ['Foo Bar'])
+        index.add(2, ['The Show', 'Other (US)'])
+        index.add(3, ['Whatever'], ['^rs'])
+        assert index.candidates('[group] FooBar.S01E01') == {1, 3}
+        assert index.candidates('Other_US_S01E01') == {2, 3}
+        assert index.candidates('Something.Else.S01E01') == {3}
+
+    def test_entries_matched(self, execute_task):
+        task = execute_task('candidates')
+        for title in [
+            '[group] FooBar.S01E01.720p',
+            'HD 720p: Foo.Bar.S01E02',
+            'Other.Name.S01E01',
+            'rs.S01E01',
+        ]:
+            assert task.find_entry('accepted', title=title), '%s should be accepted' % title
+        assert not task.find_entry('accepted', title='Foo.S01E01')
+
+
 class TestCLI(object):
     config = """
         templates:
@@ -2543,3 +2589,103 @@ class TestSeriesDDAudio(object):
             title='Channels.S01E01.1080p.HDTV.DD+7.1-FlexGet'
         ), 'Channels.S01E01.1080p.HDTV.DD+7.1-FlexGet should have been accepted'
         assert len(task.accepted) == 1, 'should have accepted only one'
+
+
+class TestStoreParsers(object):
+    config = """
+        templates:
+          global:
+            parsing:
+              series: {{parser}}
+        tasks: {}
+    """
+
+    def parse(self, manager, title, name='Foo'):
+        return plugin.get('parsing', 'tests').parse_series(title, name=name)
+
+    def test_store_parsers(self, manager):
+        titles = [
+            'Foo.S01E01.720p.HDTV-FlexGet',
+            'Foo.S01E01.1080p.HDTV-FlexGet',
+            'Foo.S01E02.720p.HDTV-FlexGet',
+            'Foo.S01.720p.HDTV-FlexGet',
+            'Foo.S01E01.720p.HDTV-FlexGet',
+        ]
+        with Session() as session:
+            series = db.Series()
+            series.name = 'Foo'
+            session.add(series)
+            session.flush()
+            items = [(series, self.parse(manager, title), None) for title in titles]
+            releases = db.store_parsers(session, items)
+            assert [len(item_releases) for item_releases in releases] == [1] * 5
+            assert releases[0][0] is releases[4][0], 'duplicate release should only be added once'
+            assert releases[0][0].episode is releases[1][0].episode
+            assert releases[3][0].season.identifier == 'S01'
+            assert session.query(db.Episode).count() == 2
+            assert session.query(db.EpisodeRelease).count() == 3
+            assert session.query(db.SeasonRelease).count() == 1
+            release_ids = [r[0].id for r in releases]
+
+        with Session() as session:
+            series = session.query(db.Series).one()
+            items = [(series, self.parse(manager, title), None) for title in titles]
+            stored = db.store_parsers(session, items)
+            assert [r[0].id for r in stored] == release_ids
+            # Should match what storing them one by one does
+            single = [db.store_parser(session, parser, series=series) for _, parser, _ in items]
+            assert [r[0].id for r in single] == release_ids
+            assert session.query(db.EpisodeRelease).count() == 3
+
+
+class TestSeriesSummary(object):
+    config = """
+        templates:
+          global:
+            parsing:
+              series: {{parser}}
+        tasks:
+          test:
+            mock:
+              - {title: 'Foo.S01E01.720p.HDTV-FlexGet'}
+              - {title: 'Foo.S01E02.720p.HDTV-FlexGet'}
+              - {title: 'Bar.S02E05.720p.HDTV-FlexGet'}
+            series:
+              - foo
+              - bar
+              - baz
+    """
+
+    def test_summary_maintained(self, execute_task):
+        task = execute_task('test')
+        assert len(task.accepted) == 3
+        with Session() as session:
+            summaries = dict(
+                (s.name, s.summary)
+                for s in db.get_series_summary(configured='all', session=session)
+            )
+            assert set(summaries) == set(['foo', 'bar', 'baz'])
+            assert summaries['foo'].latest.identifier == 'S01E02'
+            assert summaries['foo'].episodes == 2
+            assert summaries['foo'].tasks == 1
+            assert summaries['bar'].latest.identifier == 'S02E05'
+            assert summaries['baz'].latest is None
+            assert summaries['baz'].episodes == 0
+            assert [s.name for s in db.get_series_summary(premieres=True, session=session)] == [
+                'foo'
+            ]
+
+        db.remove_series_entity('foo', 'S01E02')
+        with Session() as session:
+            series = session.query(db.Series).filter(db.Series.name == 'foo').one()
+            assert series.summary.latest.identifier == 'S01E01'
+            assert series.summary.episodes == 1
+
+    def test_summary_matches_queries(self, execute_task):
+        execute_task('test')
+        with Session() as session:
+            for series in session.query(db.Series):
+                latest = db.get_latest_release(series)
+                assert series.summary.latest == latest
+                if latest:
+                    assert series.summary.behind_entities == db.new_entities_after(latest)
@@ -649,3 +649,57 @@ class TestSeriesParser(object):
         assert not s.season_pack
         assert s.season == 1
         assert s.episode == 1
+
+
+class TestSeriesParserReuse(object):
+    titles = [
+        'Something.Interesting.S01E02.Proper-FlexGet',
+        'Something.Interesting.S01E02E03.720p',
+        'Something Interesting 2012-05-30',
+        'Something.Interesting.S01.1080p',
+        'Something Else S01E02',
+        'Something.Interesting.S02D1',
+        '',
+        'Something.Interesting.1x03.Episode.Title-Group',
+    ]
+
+    def result(self, parsed):
+        if not parsed.valid:
+            return None
+        return (
+            parsed.name,
+            parsed.id,
+            parsed.id_type,
+            parsed.episodes,
+            parsed.quality,
+            parsed.proper_count,
+            parsed.special,
+            parsed.group,
+            parsed.season_pack,
+            parsed.strict_name,
+            parsed.identified_by,
+        )
+
+    @pytest.mark.parametrize(
+        'kwargs',
+        [
+            {},
+            {'identified_by': 'ep', 'allow_groups': ['group']},
+            {'alternate_names': ['Something Else'], 'ep_regexps': [r'(\d)x(\d{2})']},
+        ],
+    )
+    def test_reused_parser_results(self, kwargs):
+        parser = ParserInternal()
+        for title in self.titles:
+            expected = self.result(
+                ParserInternal().parse_series(title, name='Something Interesting', **kwargs)
+            )
+            parsed = parser.parse_series(title, name='Something Interesting', **kwargs)
+            assert self.result(parsed) == expected, 'reused parser differs for `%s`' % title
+        assert len(parser.series_parsers._parsers) == 1
+
+    def test_guessed_names_not_reused(self):
+        parser = ParserInternal()
+        assert parser.parse_series('Foo.Bar.S01E01').name == 'Foo Bar'
+        assert parser.parse_series('Other.Show.S01E01').name == 'Other Show'
+        assert not parser.series_parsers._parsers
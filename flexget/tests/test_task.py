@@ -1,6 +1,51 @@
 from __future__ import unicode_literals, division, absolute_import
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
+import copy
+
+import pytest
+
+from flexget import plugin
+from flexget.entry import Entry
+from flexget.event import event
+from flexget.task import EntryContainer, ExecutionPlan
+
+# Names of the recorder plugins, in the order they ran
+recorded = []
+
+
+class RecorderA(object):
+    schema = {'type': 'boolean'}
+
+    @plugin.priority(200)
+    def on_task_filter(self, task, config):
+        recorded.append('a')
+
+
+class RecorderB(object):
+    schema = {'type': 'boolean'}
+
+    @plugin.priority(100)
+    def on_task_filter(self, task, config):
+        recorded.append('b')
+
+
+class CountRuns(object):
+    """Counts the runs each entry went through in the `runs` field."""
+
+    schema = {'type': 'boolean'}
+
+    def on_task_modify(self, task, config):
+        for entry in task.all_entries:
+            entry['runs'] = entry.get('runs', 0) + 1
+
+
+@event('plugin.register')
+def register_plugin():
+    plugin.register(RecorderA, 'test_recorder_a', api_ver=2, debug=True)
+    plugin.register(RecorderB, 'test_recorder_b', api_ver=2, debug=True)
+    plugin.register(CountRuns, 'test_count_runs', api_ver=2, debug=True)
+
 
 class TestTemplate(object):
     config = """
@@ -29,3 +74,210 @@ class TestTemplate(object):
 
         task = execute_task('test')
         assert len(task.entries) == 2, 'Should have emitted House S01E02 and Hawaii Five-O S01E01'
+
+
+class TestEntryContainer(object):
+    def test_state_views(self):
+        entries = EntryContainer([Entry(title='a%d' % i, url='') for i in range(5)])
+        assert len(entries.undecided) == 5
+        entries[1].accept()
+        entries[3].accept()
+        entries[4].reject()
+        assert len(entries.accepted) == 2
+        assert [e['title'] for e in entries.accepted] == ['a1', 'a3']
+        assert [e['title'] for e in entries.entries] == ['a0', 'a1', 'a2', 'a3']
+        assert entries.rejected[0]['title'] == 'a4'
+        assert not entries.failed
+        entries.append(Entry(title='a5', url=''))
+        entries[5].fail()
+        assert len(entries.failed) == 1
+
+    def test_order_follows_container(self):
+        entries = EntryContainer([Entry(title='a%d' % i, url='') for i in range(3)])
+        entries[2].accept()
+        entries[0].accept()
+        assert [e['title'] for e in entries.accepted] == ['a0', 'a2']
+        entries.sort(key=lambda e: e['title'], reverse=True)
+        assert [e['title'] for e in entries.accepted] == ['a2', 'a0']
+
+    def test_shared_entries(self):
+        entries = EntryContainer([Entry(title='a%d' % i, url='') for i in range(3)])
+        assert len(entries.accepted) == 0
+        other = EntryContainer()
+        other[:] = (e for e in entries if e['title'] != 'a1')
+        for entry in other.entries:
+            entry.accept()
+        assert len(other.accepted) == 2
+        assert [e['title'] for e in entries.accepted] == ['a0', 'a2']
+
+    def test_copies_not_indexed(self):
+        entries = EntryContainer([Entry(title='a', url='')])
+        assert len(entries.undecided) == 1
+        copy.deepcopy(entries[0]).accept()
+        copy.copy(entries[0]).accept()
+        assert len(entries.accepted) == 0
+
+    def test_state_change_while_iterating(self):
+        entries = EntryContainer([Entry(title='a%d' % i, url='') for i in range(3)])
+        for entry in entries.undecided:
+            entries[2].reject()
+            entry.accept()
+        assert [e['title'] for e in entries.accepted] == ['a0', 'a1']
+        assert len(entries.rejected) == 1
+
+
+class TestEntryCopy(object):
+    def test_deepcopy_shares_immutable_fields(self):
+        entry = Entry(title='a', url='http://a', urls=['http://a'], info={'size': 1})
+        entry.accept()
+        entry_copy = copy.deepcopy(entry)
+        assert entry_copy == entry
+        assert entry_copy.accepted
+        assert entry_copy.store['title'] is entry.store['title']
+        entry_copy['urls'].append('http://b')
+        entry_copy['info']['size'] = 2
+        assert entry['urls'] == ['http://a']
+        assert entry['info'] == {'size': 1}
+
+    def test_snapshot_isolated(self):
+        entry = Entry(title='a', url='http://a', urls=['http://a'])
+        entry.take_snapshot('test')
+        entry['title'] = 'b'
+        entry['urls'].append('http://b')
+        assert entry.snapshots['test']['title'] == 'a'
+        assert entry.snapshots['test']['urls'] == ['http://a']
+
+    def test_lazy_fields_copied(self):
+        def lazy_func(entry):
+            entry['lazy'] = 'value'
+
+        entry = Entry(title='a', url='http://a')
+        entry.register_lazy_func(lazy_func, ['lazy'])
+        entry_copy = copy.deepcopy(entry)
+        assert entry_copy['lazy'] == 'value'
+        assert entry.is_lazy('lazy')
+
+
+class TestRerunInput(object):
+    config = """
+        tasks:
+          test_rerun:
+            mock:
+              - {title: 'entry1'}
+            rerun: 2
+          test_inputs_rerun:
+            inputs:
+              - mock:
+                  - {title: 'entry1'}
+              - mock:
+                  - {title: 'entry2'}
+            rerun: 2
+          test_rerun_count:
+            mock:
+              - {title: 'entry1'}
+            test_count_runs: yes
+            rerun: 2
+          test_rerun_count_no_backlog:
+            mock:
+              - {title: 'entry1'}
+            test_count_runs: yes
+            disable: backlog
+            rerun: 2
+          test_no_rerun:
+            mock:
+              - {title: 'entry1'}
+    """
+
+    @staticmethod
+    def count_mock_calls(monkeypatch):
+        from flexget import plugin
+
+        calls = []
+        mock_plugin = plugin.get_plugin_by_name('mock')
+        original = mock_plugin.phase_handlers['input'].func
+
+        def counting_input(task, config):
+            calls.append(task.rerun_count)
+            return original(task, config)
+
+        monkeypatch.setattr(mock_plugin.phase_handlers['input'], 'func', counting_input)
+        return calls
+
+    def test_input_not_rerun(self, execute_task, monkeypatch):
+        calls = self.count_mock_calls(monkeypatch)
+        task = execute_task('test_rerun')
+        assert task.rerun_count == 2
+        assert calls == [0], 'input should only be run on the first run'
+        assert len(task.all_entries) == 1
+        assert task.all_entries[0].task is task
+
+    def test_inputs_plugin_not_rerun(self, execute_task, monkeypatch):
+        calls = self.count_mock_calls(monkeypatch)
+        task = execute_task('test_inputs_rerun')
+        assert task.rerun_count == 2
+        assert calls == [0, 0]
+        assert len(task.all_entries) == 2
+
+    def test_entries_not_copied_without_rerun(self, execute_task):
+        task = execute_task('test_no_rerun')
+        (kept,) = task._rerun_inputs.values()
+        assert [entry for entry, _ in kept][0] is task.all_entries[0]
+
+    @pytest.mark.parametrize('task_name', ['test_rerun_count', 'test_rerun_count_no_backlog'])
+    def test_rerun_entries_as_produced(self, execute_task, task_name):
+        task = execute_task(task_name)
+        assert task.rerun_count == 2
+        assert task.all_entries[0]['runs'] == 1, 'changes of earlier runs should not be re-injected'
+
+
+class TestExecutionPlan(object):
+    config = """
+        tasks:
+          test:
+            mock:
+              - {title: 'entry1'}
+            accept_all: yes
+          test_recorders:
+            test_recorder_a: yes
+            test_recorder_b: yes
+          test_plugin_priority:
+            test_recorder_a: yes
+            test_recorder_b: yes
+            plugin_priority:
+              test_recorder_a: 1
+              test_recorder_b: 250
+    """
+
+    def test_plan_reused(self, manager, execute_task):
+        task = execute_task('test')
+        assert task.accepted
+        plan = ExecutionPlan.get(task.config)
+        assert ExecutionPlan.get(dict(task.config)) is plan
+        assert [p.name for p in plan.phases['filter'] if not p.builtin] == ['accept_all']
+        assert execute_task('test').rejected, 'seen should still run with the cached plan'
+
+    def test_builtin_change_rebuilds_plan(self, manager):
+        from flexget import plugin
+
+        config = {'mock': []}
+        plan = ExecutionPlan.get(config)
+        backlog = plugin.get_plugin_by_name('backlog')
+        backlog.builtin = False
+        try:
+            new_plan = ExecutionPlan.get(config)
+            assert new_plan is not plan
+            assert backlog not in new_plan.phases['input']
+        finally:
+            backlog.builtin = True
+        assert backlog in ExecutionPlan.get(config).phases['input']
+
+    def test_plugin_priority_reorders_plan(self, manager, execute_task):
+        del recorded[:]
+        execute_task('test_recorders')
+        assert recorded == ['a', 'b']
+        del recorded[:]
+        execute_task('test_plugin_priority')
+        assert recorded == ['b', 'a'], 'plugin_priority should change the order of the cached plan'
+        del recorded[:]
+        execute_task('test_recorders')
+        assert recorded == ['a', 'b'], 'original priorities should be restored'
@@ -0,0 +1,206 @@
+from __future__ import unicode_literals, division, absolute_import
+from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
+
+import itertools
+import threading
+import time
+from functools import total_ordering
+
+from flexget import plugin
+from flexget.components.status import db
+from flexget.entry import Entry
+from flexget.event import event
+from flexget.manager import Session
+from flexget.task import Task
+from flexget.task_queue import EXCLUSIVE, TaskQueue, task_resources
+from .conftest import MockManager
+
+
+class FakeManager(object):
+    def __init__(self, concurrency, templates=None):
+        self.config = {'task_concurrency': concurrency, 'templates': templates or {}}
+
+
+@total_ordering
+class FakeTask(object):
+    _counter = itertools.count()
+
+    def __init__(
+        self, manager, name, log, resources=None, priority=0, duration=0.2, config=None
+    ):
+        self.manager = manager
+        self.name = name
+        self.config = dict(config or {})
+        if resources:
+            self.config['resources'] = resources
+        self.priority = priority
+        self._count = next(self._counter)
+        self.finished_event = threading.Event()
+        self.duration = duration
+        self.log = log
+
+    def execute(self):
+        self.log.append(('start', self.name))
+        time.sleep(self.duration)
+        self.log.append(('end', self.name))
+        self.finished_event.set()
+
+    def __lt__(self, other):
+        return (self.priority, self._count) < (other.priority, other._count)
+
+    def __eq__(self, other):
+        return (self.priority, self._count) == (other.priority, other._count)
+
+
+class SlowInput(object):
+    """Produces an entry after a while, so that tasks running concurrently overlap."""
+
+    schema = {'type': 'string'}
+
+    def on_task_input(self, task, config):
+        time.sleep(0.5)
+        return [Entry(title=config, url='mock://%s' % config)]
+
+
+@event('plugin.register')
+def register_plugin():
+    plugin.register(SlowInput, 'test_slow_input', api_ver=2, debug=True)
+
+
+def run_queue(tasks):
+    task_queue = TaskQueue()
+    for task in tasks:
+        task_queue.put(task)
+    task_queue.start()
+    task_queue.shutdown(finish_queue=True)
+    task_queue.wait()
+    for task in tasks:
+        assert task.finished_event.is_set(), '%s was not run' % task.name
+
+
+def overlapped(log, first, second):
+    """Whether `second` started before `first` ended."""
+    return log.index(('start', second)) < log.index(('end', first))
+
+
+class TestTaskQueue(object):
+    def test_task_resources(self):
+        task = FakeTask(FakeManager(1), 'a', [], resources='transmission')
+        assert task_resources(task) == {'task:a', 'transmission'}
+
+    def test_task_resources_from_templates(self):
+        manager = FakeManager(
+            1,
+            templates={
+                'global': {'resources': 'seen'},
+                'torrents': {'resources': ['transmission'], 'template': 'nested'},
+                'nested': {'resources': 'disk'},
+            },
+        )
+        task = FakeTask(manager, 'a', [], config={'template': 'torrents'})
+        assert task_resources(task) == {'task:a', 'seen', 'transmission', 'disk'}
+        task = FakeTask(manager, 'b', [], config={'template': ['torrents', 'no_global']})
+        assert task_resources(task) == {'task:b', 'transmission', 'disk'}
+        task = FakeTask(manager, 'c', [], config={'template': False})
+        assert task_resources(task) == {'task:c'}
+
+    def test_task_resources_exclusive(self):
+        manager = FakeManager(1, templates={'global': {'disable': 'builtins'}})
+        assert EXCLUSIVE in task_resources(FakeTask(manager, 'a', []))
+        manager = FakeManager(1)
+        task = FakeTask(manager, 'a', [], config={'plugin_priority': {'series': 100}})
+        assert EXCLUSIVE in task_resources(task)
+        task = FakeTask(manager, 'b', [], config={'reorder_quality': {'720p': {'above': '1080p'}}})
+        assert EXCLUSIVE in task_resources(task)
+        task = FakeTask(manager, 'c', [], config={'disable': ['not_a_builtin']})
+        assert EXCLUSIVE not in task_resources(task)
+
+    def test_serial_by_default(self):
+        log = []
+        manager = FakeManager(1)
+        run_queue([FakeTask(manager, name, log) for name in 'abc'])
+        assert [name for action, name in log if action == 'start'] == ['a', 'b', 'c']
+        assert not overlapped(log, 'a', 'b')
+        assert not overlapped(log, 'b', 'c')
+
+    def test_concurrent(self):
+        log = []
+        manager = FakeManager(3)
+        run_queue([FakeTask(manager, name, log) for name in 'abc'])
+        assert overlapped(log, 'a', 'b')
+        assert overlapped(log, 'a', 'c')
+
+    def test_shared_resource_serialized(self):
+        log = []
+        manager = FakeManager(3)
+        run_queue(
+            [
+                FakeTask(manager, 'a', log, resources=['deluge']),
+                FakeTask(manager, 'b', log, resources=['deluge', 'seen']),
+                FakeTask(manager, 'c', log, resources=['other']),
+            ]
+        )
+        assert not overlapped(log, 'a', 'b')
+        assert overlapped(log, 'a', 'c')
+
+    def test_priority_kept_for_shared_resource(self):
+        log = []
+        manager = FakeManager(2)
+        run_queue(
+            [
+                FakeTask(manager, 'low', log, resources='deluge', priority=5),
+                FakeTask(manager, 'high', log, resources='deluge', priority=1),
+            ]
+        )
+        assert log.index(('start', 'high')) < log.index(('start', 'low'))
+        assert not overlapped(log, 'high', 'low')
+
+    def test_exclusive_runs_alone(self):
+        log = []
+        manager = FakeManager(3)
+        run_queue(
+            [
+                FakeTask(manager, 'a', log),
+                FakeTask(manager, 'b', log, config={'disable': 'builtins'}),
+                FakeTask(manager, 'c', log),
+            ]
+        )
+        assert not overlapped(log, 'a', 'b')
+        assert not overlapped(log, 'b', 'c')
+
+
+class TestConcurrentTasks(object):
+    config = """
+        task_concurrency: 2
+        tasks:
+          first:
+            test_slow_input: first entry
+            accept_all: yes
+          second:
+            test_slow_input: second entry
+    """
+
+    def test_status_per_task(self, request, tmpdir):
+        # Tasks running concurrently use separate connections, which need to share the database
+        filename = tmpdir.join('concurrent.sqlite').strpath.replace('\\', '\\\\')
+        manager = MockManager(self.config, request.cls.__name__, db_uri='sqlite:///%s' % filename)
+        try:
+            tasks = [
+                Task(manager, name, config=manager.config['tasks'][name])
+                for name in ('first', 'second')
+            ]
+            task_queue = TaskQueue()
+            for task in tasks:
+                task_queue.put(task)
+            task_queue.start()
+            task_queue.shutdown(finish_queue=True)
+            task_queue.wait()
+
+            with Session() as session:
+                executions = {
+                    execution.task.name: (execution.produced, execution.accepted)
+                    for execution in session.query(db.TaskExecution).all()
+                }
+        finally:
+            manager.shutdown()
+        assert executions == {'first': (1, 1), 'second': (1, 0)}
@@ -3,11 +3,28 @@ from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
 from datetime import datetime
 import math
+import threading
+import time
 
+import mock
 import pytest
+import sqlalchemy
+from sqlalchemy import Column, Integer, Unicode
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
 
-from flexget.utils import json
-from flexget.utils.tools import parse_filesize, split_title_year
+from flexget.components.failed.db import FailedEntry
+from flexget.entry import Entry
+from flexget.manager import Session
+from flexget.task import Task
+from flexget.utils import db_writer, json, template
+from flexget.utils.database import bulk_key_lookup
+from flexget.utils.db_writer import DBWriter
+from flexget.utils.log import LogMessage, digest_cache, log_once
+from flexget.utils.sqlalchemy_utils import ContextSession
+from flexget.utils.template import TemplateCache
+from flexget.utils.tools import LRUCache, parse_filesize, split_title_year
+from .conftest import MockManager
 
 
 def compare_floats(float1, float2):
@@ -109,3 +126,178 @@ class TestSplitYearTitle(object):
     )
     def test_split_year_title(self, title, expected_title, expected_year):
         assert split_title_year(title) == (expected_title, expected_year)
+
+
+class TestTemplateCache(object):
+    config = 'tasks: {}'
+
+    def test_lru(self):
+        cache = TemplateCache(max_size=2)
+        assert cache.get('a', lambda: 1) == 1
+        assert cache.get('b', lambda: 2) == 2
+        # Hit makes `a` the most recently used, so `b` is evicted next
+        assert cache.get('a', lambda: 3) == 1
+        cache.get('c', lambda: 4)
+        assert cache.get('b', lambda: 5) == 5
+        assert cache.info() == {'hits': 1, 'misses': 4, 'size': 2, 'max_size': 2}
+
+    def test_ttl(self):
+        cache = LRUCache(10, ttl=60)
+        assert cache.get('a', lambda: 1) == 1
+        assert cache.get('a', lambda: 2) == 1
+        with mock.patch('flexget.utils.tools.time.time', return_value=time.time() + 61):
+            assert cache.get('a', lambda: 3) == 3
+
+    def test_render_reuses_compiled(self, manager):
+        template.template_cache.clear()
+        for i in range(3):
+            assert template.render('{{ a }}', {'a': i}) == str(i)
+        assert template.render('{{ a }}', {'a': 1}, native=True) == 1
+        assert template.template_cache.info()['misses'] == 2
+        assert template.template_cache.info()['hits'] == 2
+
+    def test_render_from_entries(self, manager):
+        entries = [Entry(title='a', url=''), Entry(title='b', url=''), Entry(url='')]
+        results = list(template.render_from_entries('{{ title }}', entries))
+        assert [r[1] for r in results[:2]] == ['a', 'b']
+        assert results[2][0] is entries[2]
+        assert isinstance(results[2][2], template.RenderError)
+
+
+class TestDBWriter(object):
+    @pytest.yield_fixture()
+    def writer(self, tmpdir):
+        engine = sqlalchemy.create_engine(
+            'sqlite:///%s' % tmpdir.join('writer.sqlite').strpath,
+            connect_args={'check_same_thread': False},
+        )
+        WriterBase.metadata.create_all(bind=engine)
+        writer = DBWriter(sessionmaker(class_=ContextSession, bind=engine))
+        writer.start()
+        yield writer
+        writer.stop()
+        engine.dispose()
+
+    def values(self, writer):
+        with writer.session_factory() as session:
+            return sorted(item.value for item in session.query(WriterItem).all())
+
+    def test_batches(self, writer):
+        for i in range(10):
+            writer.submit('task', add_item, ('value %s' % i,))
+        writer.wait('task')
+        assert writer.queue_depth == 0
+        assert self.values(writer) == sorted('value %s' % i for i in range(10))
+
+    def test_failed_write(self, writer):
+        writer.submit('task', add_item, ('value 1',))
+        writer.submit('task', fail, ())
+        writer.submit('other', add_item, ('value 2',))
+        writer.wait()
+        assert self.values(writer) == ['value 1', 'value 2'], 'should not lose the other writes'
+
+    def test_stop_flushes(self, writer):
+        writer.submit('task', add_item, ('value 1',))
+        writer.stop()
+        assert self.values(writer) == ['value 1']
+        # fixture stops it again
+        writer._thread = threading.Thread(target=writer.run)
+        writer.start()
+
+
+class TestWriteBehindTasks(object):
+    config = """
+        database:
+          write_behind: yes
+        tasks:
+          first:
+            mock:
+              - {title: 'foobar', url: 'http://localhost/foobar'}
+            accept_all: yes
+          second:
+            mock:
+              - {title: 'foobar', url: 'http://localhost/foobar'}
+            accept_all: yes
+    """
+
+    def test_completed_task_flushed(self, request, tmpdir, monkeypatch):
+        # Database settings only apply to database files
+        filename = tmpdir.join('write_behind.sqlite').strpath.replace('\\', '\\\\')
+        manager = MockManager(self.config, request.cls.__name__, db_uri='sqlite:///%s' % filename)
+        commit = DBWriter._commit
+
+        def slow_commit(writer, batch):
+            time.sleep(0.5)
+            commit(writer, batch)
+
+        monkeypatch.setattr(DBWriter, '_commit', slow_commit)
+        try:
+            assert db_writer.writer, 'write_behind should have been enabled'
+            first = Task(manager, 'first', config=manager.config['tasks']['first'])
+            first.execute()
+            assert db_writer.queue_depth() == 0
+            second = Task(manager, 'second', config=manager.config['tasks']['second'])
+            second.execute()
+            assert not second.accepted, 'should have seen the entry accepted by the first task'
+        finally:
+            manager.shutdown()
+            # The manager only stops the writer when its task queue shuts down, which tests don't run
+            db_writer.stop()
+
+
+WriterBase = declarative_base()
+
+
+class WriterItem(WriterBase):
+    __tablename__ = 'writer_item'
+    id = Column(Integer, primary_key=True)
+    value = Column(Unicode)
+
+
+def add_item(session, value):
+    session.add(WriterItem(value=value))
+
+
+def fail(session):
+    raise ValueError('broken write')
+
+
+class TestLogOnce(object):
+    config = 'tasks: {}'
+
+    def stored(self):
+        with Session() as session:
+            return session.query(LogMessage).count()
+
+    def test_log_once(self, manager):
+        digest_cache.clear()
+        assert log_once('test message') is True
+        assert log_once('test message') is False
+        assert log_once('other message') is True
+        assert self.stored() == 0, 'digests should be written in batches'
+        digest_cache.flush()
+        assert self.stored() == 2
+        # Reloaded from the database
+        digest_cache.clear()
+        assert log_once('test message') is False
+        assert log_once('new message') is True
+
+
+class TestBulkKeyLookup(object):
+    config = 'tasks: {}'
+
+    def test_lookup(self, manager):
+        with Session() as session:
+            for i in range(2000):
+                session.add(FailedEntry('title %s' % i, 'http://localhost/%s' % i))
+            session.add(FailedEntry('title 1', 'http://localhost/other'))
+        with Session() as session:
+            keys = [('title %s' % i, 'http://localhost/%s' % i) for i in range(0, 2000, 2)]
+            keys += [('title 1', 'http://localhost/other'), ('title 3', 'http://localhost/5')]
+            rows = bulk_key_lookup(
+                session.query(FailedEntry), [FailedEntry.title, FailedEntry.url], keys
+            )
+            assert len(rows) == 1001
+            assert ('title 3', 'http://localhost/5') not in rows
+            assert rows[('title 1', 'http://localhost/other')].url == 'http://localhost/other'
+            assert rows[('title 1998', 'http://localhost/1998')].title == 'title 1998'
@@ -189,6 +189,8 @@ class IterableCache(object):
     """
     Can cache any iterable (including generators) without immediately evaluating all entries.
     If `finished_hook` is supplied, it will be called the first time the iterable is run to the end.
+
+    Each iteration yields copies of the cached items. Copying entries is cheap, as they share immutable field values.
     """
     def __init__(self, iterable, finished_hook=None):
         self.iterable = iter(iterable)
@@ -12,6 +12,7 @@ from sqlalchemy.ext.hybrid import Comparator, hybrid_property
 
 from flexget.manager import Session
 from flexget.utils import qualities, json
+from flexget.utils.tools import chunked
 from flexget.entry import Entry
 
 
@@ -46,6 +47,27 @@ def with_session(*args, **kwargs):
         return decorator
 
 
+def bulk_key_lookup(query, columns, keys):
+    """
+    Look up the rows of `query` matching many keys at once, with chunked set queries.
+
+    :param query: Query selecting the rows to look up, eg. ``session.query(FailedEntry)``
+    :param list columns: Attributes the keys consist of, eg. ``[FailedEntry.title, FailedEntry.url]``
+    :param keys: Iterable of key tuples with values for `columns`
+    :return: Dict mapping the found keys to their first row
+    """
+    keys = set(tuple(key) for key in keys)
+    # Only the first column is filtered on, the rest of the key is compared in python
+    first_values = list(set(key[0] for key in keys))
+    rows = {}
+    for values in chunked(first_values):
+        for row in query.filter(columns[0].in_(values)):
+            key = tuple(getattr(row, column.key) for column in columns)
+            if key in keys:
+                rows.setdefault(key, row)
+    return rows
+
+
 def pipe_list_synonym(name):
     """Converts pipe separated text into a list"""
 
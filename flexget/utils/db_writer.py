@@ -0,0 +1,170 @@
+"""
+Write-behind database writer.
+
+Plugins persisting what a task has learned hand their writes to :func:`write`. When the writer is enabled with the
+`write_behind` database setting, the writes are queued and performed by a single thread, which batches everything
+queued into as few transactions as possible. Otherwise they are performed right away in the session of the task.
+
+Writes of a task are always committed before the next run of the same task starts (including reruns), when the
+task completes, and before FlexGet shuts down. Other tasks running at the same time may not see them for the short
+time they spend in the queue.
+"""
+from __future__ import unicode_literals, division, absolute_import
+from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
+
+import logging
+import queue
+import threading
+from collections import Counter
+
+from flexget.manager import Session
+
+log = logging.getLogger('db_writer')
+
+# Maximum number of writes committed in a single transaction
+BATCH_SIZE = 500
+
+_stop = object()
+
+
+class DBWriter(object):
+    """Thread performing queued database writes in batches."""
+
+    def __init__(self, session_factory=Session):
+        self.session_factory = session_factory
+        self._queue = queue.Queue()
+        # Number of queued, not yet committed writes per task name
+        self._pending = Counter()
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self.run, name='db_writer')
+        self._thread.daemon = True
+
+    @property
+    def queue_depth(self):
+        """Number of writes which have not been committed yet."""
+        with self._condition:
+            return sum(self._pending.values())
+
+    def start(self):
+        self._thread.start()
+
+    def submit(self, task_name, func, args):
+        with self._condition:
+            self._pending[task_name] += 1
+        self._queue.put((task_name, func, args))
+
+    def wait(self, task_name=None):
+        """Block until the queued writes of `task_name`, or all writes when not given, have been committed."""
+        with self._condition:
+            while (self._pending[task_name] if task_name else sum(self._pending.values())) > 0:
+                self._condition.wait(1)
+
+    def stop(self):
+        """Commit all queued writes and stop the thread."""
+        self._queue.put(_stop)
+        self._thread.join()
+
+    def run(self):
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if _stop in batch:
+                stopping = True
+                batch.remove(_stop)
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch):
+        log.debug('Committing %s queued writes', len(batch))
+        try:
+            self._commit(batch)
+        except Exception:
+            log.debug('Batch failed, committing writes one by one', exc_info=True)
+            # Make sure a single broken write doesn't lose the others
+            for job in batch:
+                try:
+                    self._commit([job])
+                except Exception as e:
+                    log.error('Failed to write data of task %s: %s', job[0], e)
+                    log.debug('Write failed', exc_info=True)
+        finally:
+            with self._condition:
+                for task_name, _, _ in batch:
+                    self._pending[task_name] -= 1
+                    if not self._pending[task_name]:
+                        del self._pending[task_name]
+                self._condition.notify_all()
+
+    def _commit(self, batch):
+        with self.session_factory() as session:
+            for _, func, args in batch:
+                func(session, *args)
+
+
+writer = None
+
+
+def start():
+    """Start performing writes in the background."""
+    global writer
+    if writer:
+        return
+    log.debug('Starting write-behind database writer')
+    writer = DBWriter()
+    writer.start()
+
+
+def stop():
+    """Commit all queued writes, and perform further writes right away."""
+    global writer
+    if not writer:
+        return
+    log.debug('Stopping write-behind database writer, %s writes queued', writer.queue_depth)
+    writer.stop()
+    writer = None
+
+
+def queue_depth():
+    """:return: Number of queued writes, or None when writes are not performed in the background."""
+    return writer.queue_depth if writer else None
+
+
+def write(task, func, args=(), session=None):
+    """
+    Persist data learned by `task`. `func` is called as ``func(session, *args)``, either right away or later from the
+    writer thread, so it must not use the task or its entries. Pass the data it needs in `args` instead.
+
+    :param session: Session used when the write is performed right away, defaults to the session of the task.
+    """
+    if writer:
+        writer.submit(task.name, func, args)
+        return
+    session = session or task.session
+    if session is not None:
+        func(session, *args)
+    else:
+        with Session() as session:
+            func(session, *args)
+
+
+def add(task, instances, session=None):
+    """Add new, not yet persisted database `instances` created by `task`."""
+    write(task, _add_all, (list(instances),), session=session)
+
+
+def _add_all(session, instances):
+    session.add_all(instances)
+
+
+def wait_for_task(task):
+    """
+    Make sure everything `task` has written is committed, so that it is seen by the next run of the task, and by
+    other tasks once it has completed.
+    """
+    if writer:
+        writer.wait(task.name)
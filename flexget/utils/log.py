@@ -4,11 +4,11 @@ from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
 import logging
 import hashlib
+import threading
 from datetime import datetime, timedelta
 
 from sqlalchemy import Column, Integer, String, DateTime, Index
 
-from flexget.utils.database import with_session
 from flexget import db_schema
 from flexget import logger as f_logger
 from flexget.utils.sqlalchemy_utils import table_schema
@@ -17,6 +17,9 @@ from flexget.event import event
 log = logging.getLogger('util.log')
 Base = db_schema.versioned_base('log_once', 0)
 
+# Number of new digests written to the database at once
+BATCH_SIZE = 100
+
 
 @db_schema.upgrade('log_once')
 def upgrade(ver, session):
@@ -44,17 +47,95 @@ class LogMessage(Base):
         return "<LogMessage('%s')>" % self.md5sum
 
 
+class DigestCache(object):
+    """
+    Process wide set of digests of the messages logged already. Loaded from the database on first use,
+    new digests are written in batches.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engine = None
+        self._digests = set()
+        self._pending = []
+
+    def _load(self, engine):
+        from flexget.manager import Session
+
+        with Session(bind=engine) as session:
+            self._digests = set(md5sum for md5sum, in session.query(LogMessage.md5sum))
+        self._engine = engine
+        self._pending = []
+        log.debug('Loaded %s log_once digests', len(self._digests))
+
+    def add(self, engine, md5sum):
+        """
+        Remember `md5sum`.
+
+        :return: False if it was known already.
+        """
+        with self._lock:
+            if engine is not self._engine:
+                self._load(engine)
+            if md5sum in self._digests:
+                return False
+            self._digests.add(md5sum)
+            self._pending.append(md5sum)
+            if len(self._pending) >= BATCH_SIZE:
+                self._flush()
+            return True
+
+    def flush(self):
+        """Write the new digests to the database."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        from flexget.manager import Session
+
+        pending, self._pending = self._pending, []
+        with Session(bind=self._engine) as session:
+            # Another process may have logged some of the messages meanwhile
+            existing = set(
+                md5sum
+                for md5sum, in session.query(LogMessage.md5sum).filter(
+                    LogMessage.md5sum.in_(pending)
+                )
+            )
+            session.add_all(LogMessage(md5sum) for md5sum in pending if md5sum not in existing)
+        log.debug('Stored %s log_once digests', len(pending) - len(existing))
+
+    def clear(self):
+        with self._lock:
+            self._engine = None
+            self._digests = set()
+            self._pending = []
+
+
+digest_cache = DigestCache()
+
+
+@event('task.execute.completed')
+@event('manager.shutdown')
+def flush_digests(task_or_manager):
+    digest_cache.flush()
+
+
 @event('manager.db_cleanup')
 def purge(manager, session):
     """Purge old messages from database"""
+    digest_cache.flush()
     old = datetime.now() - timedelta(days=365)
 
     result = session.query(LogMessage).filter(LogMessage.added < old).delete()
     if result:
         log.verbose('Purged %s entries from log_once table.' % result)
+        # Purged messages should be logged again
+        digest_cache.clear()
 
 
-@with_session
 def log_once(
     message,
     logger=logging.getLogger('log_once'),
@@ -65,6 +146,9 @@ def log_once(
     """
     Log message only once using given logger`. Returns False if suppressed logging.
     When suppressed, `suppressed_level` level is still logged.
+
+    Logged messages are remembered in memory, suppressing them again does not touch the database.
+    `session` is accepted for backwards compatibility but not used.
     """
     # If there is no active manager, don't access the db
     from flexget.manager import manager
@@ -79,12 +163,9 @@ def log_once(
     md5sum = digest.hexdigest()
 
     # abort if this has already been logged
-    if session.query(LogMessage).filter_by(md5sum=md5sum).first():
+    if not digest_cache.add(manager.engine, md5sum):
         logger.log(suppressed_level, message)
         return False
 
-    row = LogMessage(md5sum)
-    session.add(row)
-
     logger.log(once_level, message)
     return True
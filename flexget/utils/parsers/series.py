@@ -9,16 +9,15 @@ from string import capwords
 
 from dateutil.parser import parse as parsedate
 
+from flexget.logger import Tracer
 from flexget.utils import qualities
 from flexget.utils.parsers.generic import ParseWarning, default_ignore_prefixes, name_to_re
 from flexget.utils.parsers.parser import TitleParser
 from flexget.utils.tools import ReList
 
 log = logging.getLogger('seriesparser')
-
-# Forced to INFO !
-# switch to logging.DEBUG if you want to debug this class (produces quite a bit info ..)
-log.setLevel(logging.INFO)
+# Parsing produces quite a bit info, it is only logged when tracing is enabled for `seriesparser`
+tracer = Tracer('seriesparser', log)
 
 ID_TYPES = ['ep', 'date', 'sequence', 'id']  # may also be 'special'
 
@@ -249,11 +248,11 @@ class SeriesParser(TitleParser):
         if not self.data:
             raise ParseWarning(self, 'No data supplied to parse.')
         if not self.name:
-            log.debug('No name for series `%s` supplied, guessing name.', self.data)
+            tracer('No name for series `%s` supplied, guessing name.', self.data)
             if not self.guess_name():
-                log.debug('Could not determine a series name')
+                tracer('Could not determine a series name')
                 return
-            log.debug('Series name for %s guessed to be %s', self.data, self.name)
+            tracer('Series name for %s guessed to be %s', self.data, self.name)
 
         # check if data appears to be unwanted (abort)
         if self.parse_unwanted(self.remove_dirt(self.data)):
@@ -263,7 +262,7 @@ class SeriesParser(TitleParser):
 
         name = self.remove_dirt(self.name)
 
-        log.debug('name: %s data: %s', name, self.data)
+        tracer('name: %s data: %s', name, self.data)
 
         # name end position
         name_start = 0
@@ -286,20 +285,21 @@ class SeriesParser(TitleParser):
                 # Always pick the longest matching regex
                 if match_end > name_end:
                     name_start, name_end = match_start, match_end
-                log.debug('NAME SUCCESS: %s matched to %s', name_re.pattern, self.data)
+                tracer('NAME SUCCESS: %s matched to %s', name_re.pattern, self.data)
         if not name_end:
             # leave this invalid
-            log.debug(
-                'FAIL: name regexps %s do not match %s',
-                [regexp.pattern for regexp in self.name_regexps],
-                self.data,
-            )
+            if tracer.enabled:
+                tracer(
+                    'FAIL: name regexps %s do not match %s',
+                    [regexp.pattern for regexp in self.name_regexps],
+                    self.data,
+                )
             return
 
         # remove series name from raw data, move any prefix to end of string
         data_stripped = self.data[name_end:] + ' ' + self.data[:name_start]
         data_stripped = data_stripped.lower()
-        log.debug('data stripped: %s', data_stripped)
+        tracer('data stripped: %s', data_stripped)
 
         # allow group(s)
         if self.allow_groups:
@@ -307,22 +307,22 @@ class SeriesParser(TitleParser):
                 group = group.lower()
                 for fmt in ['[%s]', '-%s', '(%s)']:
                     if fmt % group in data_stripped:
-                        log.debug('%s is from group %s', self.data, group)
+                        tracer('%s is from group %s', self.data, group)
                         self.group = group
                         data_stripped = data_stripped.replace(fmt % group, '')
                         break
                 if self.group:
                     break
             else:
-                log.debug('%s is not from groups %s', self.data, self.allow_groups)
+                tracer('%s is not from groups %s', self.data, self.allow_groups)
                 return  # leave invalid
 
         # Find quality and clean from data
-        log.debug('parsing quality ->')
+        tracer('parsing quality ->')
         quality = qualities.Quality(data_stripped)
         if quality:
             # Remove quality string from data
-            log.debug('quality detected, using remaining data `%s`', quality.clean_text)
+            tracer('quality detected, using remaining data `%s`', quality.clean_text)
             data_stripped = quality.clean_text
         # Don't override passed in quality
         if not self.quality:
@@ -347,7 +347,7 @@ class SeriesParser(TitleParser):
 
         data_stripped = ' '.join(data_parts).strip()
 
-        log.debug("data for date/ep/id parsing '%s'", data_stripped)
+        tracer("data for date/ep/id parsing '%s'", data_stripped)
 
         # Try date mode before ep mode
         if self.identified_by in ['date', 'auto']:
@@ -363,7 +363,7 @@ class SeriesParser(TitleParser):
                 if not (self.special and self.prefer_specials):
                     return
             else:
-                log.debug('-> no luck with date_regexps')
+                tracer('-> no luck with date_regexps')
 
         if self.identified_by in ['ep', 'auto'] and not self.valid:
             ep_match = self.parse_episode(data_stripped)
@@ -375,7 +375,7 @@ class SeriesParser(TitleParser):
 
                 if ep_match['end_episode'] and ep_match['end_episode'] > ep_match['episode'] + 2:
                     # This is a pack of too many episodes, ignore it.
-                    log.debug(
+                    tracer(
                         'Series pack contains too many episodes (%d). Rejecting',
                         ep_match['end_episode'] - ep_match['episode'],
                     )
@@ -403,14 +403,14 @@ class SeriesParser(TitleParser):
                     self.id_type = 'ep'
                     self.valid = True
                 else:
-                    log.debug('-> no luck with ep_regexps')
+                    tracer('-> no luck with ep_regexps')
 
             if self.identified_by == 'ep' and not self.season_pack:
                 # we should be getting season, ep !
                 # try to look up idiotic numbering scheme 101,102,103,201,202
                 # ressu: Added matching for 0101, 0102... It will fail on
                 #        season 11 though
-                log.debug('ep identifier expected. Attempting SEE format parsing.')
+                tracer('ep identifier expected. Attempting SEE format parsing.')
                 match = re.search(
                     self.re_not_in_word(r'(\d?\d)(\d\d)'),
                     data_stripped,
@@ -425,12 +425,12 @@ class SeriesParser(TitleParser):
                     self.season = int(match.group(1))
                     self.episode = int(match.group(2))
                     self.id = (self.season, self.episode)
-                    log.debug(self)
+                    tracer(self)
                     self.id_type = 'ep'
                     self.valid = True
                     return
                 else:
-                    log.debug('-> no luck with SEE')
+                    tracer('-> no luck with SEE')
 
         # Check id regexps
         if self.identified_by in ['id', 'auto'] and not self.valid:
@@ -448,13 +448,13 @@ class SeriesParser(TitleParser):
                     self.id = found_id
                     self.id_type = 'id'
                     self.valid = True
-                    log.debug('found id \'%s\' with regexp \'%s\'', self.id, id_re.pattern)
+                    tracer('found id \'%s\' with regexp \'%s\'', self.id, id_re.pattern)
                     if not (self.special and self.prefer_specials):
                         return
                     else:
                         break
             else:
-                log.debug('-> no luck with id_regexps')
+                tracer('-> no luck with id_regexps')
 
         # Other modes are done, check for unwanted sequence ids
         if self.parse_unwanted_sequence(data_stripped):
@@ -482,13 +482,13 @@ class SeriesParser(TitleParser):
                             self.proper_count = int(match.group('version')) - 1
                     self.id_type = 'sequence'
                     self.valid = True
-                    log.debug('found id \'%s\' with regexp \'%s\'', self.id, sequence_re.pattern)
+                    tracer('found id \'%s\' with regexp \'%s\'', self.id, sequence_re.pattern)
                     if not (self.special and self.prefer_specials):
                         return
                     else:
                         break
             else:
-                log.debug('-> no luck with sequence_regexps')
+                tracer('-> no luck with sequence_regexps')
 
         # No id found, check if this is a special
         if self.special or self.assume_special:
@@ -496,7 +496,7 @@ class SeriesParser(TitleParser):
             self.id = data_stripped or 'special'
             self.id_type = 'special'
             self.valid = True
-            log.debug('found special, setting id to \'%s\'', self.id)
+            tracer('found special, setting id to \'%s\'', self.id)
             return
         if self.valid:
             return
@@ -513,7 +513,7 @@ class SeriesParser(TitleParser):
         for unwanted_re in self.unwanted_regexps:
             match = re.search(unwanted_re, data)
             if match:
-                log.debug('unwanted regexp %s matched %s', unwanted_re.pattern, match.groups())
+                tracer('unwanted regexp %s matched %s', unwanted_re.pattern, match.groups())
                 return True
 
     def parse_unwanted_sequence(self, data):
@@ -521,7 +521,7 @@ class SeriesParser(TitleParser):
         for seq_unwanted_re in self.unwanted_sequence_regexps:
             match = re.search(seq_unwanted_re, data)
             if match:
-                log.debug('unwanted id regexp %s matched %s', seq_unwanted_re, match.groups())
+                tracer('unwanted id regexp %s matched %s', seq_unwanted_re, match.groups())
                 return True
 
     def parse_date(self, data):
@@ -561,10 +561,10 @@ class SeriesParser(TitleParser):
                         if possdate not in possdates:
                             possdates.append(possdate)
                 except ValueError:
-                    log.debug('%s is not a valid date, skipping', match.group(0))
+                    tracer('%s is not a valid date, skipping', match.group(0))
                     continue
                 if not possdates:
-                    log.debug('All possible dates for %s were in the future', match.group(0))
+                    tracer('All possible dates for %s were in the future', match.group(0))
                     continue
                 possdates.sort()
                 # Pick the most recent date if there are ambiguities
@@ -585,7 +585,7 @@ class SeriesParser(TitleParser):
             match = re.search(ep_re, data)
 
             if match:
-                log.debug(
+                tracer(
                     'found episode number with regexp %s (%s)', ep_re.pattern, match.groups()
                 )
                 matches = match.groups()
@@ -639,7 +639,7 @@ class SeriesParser(TitleParser):
         for season_pack_re in self.season_pack_regexps:
             match = re.search(season_pack_re, data)
             if match:
-                log.debug('season pack regexp %s match %s', season_pack_re.pattern, match.groups())
+                tracer('season pack regexp %s match %s', season_pack_re.pattern, match.groups())
                 matches = match.groups()
                 if len(matches) == 1:
                     # Single season full pack, no parts etc
@@ -6,8 +6,13 @@ import re
 import copy
 import logging
 
+from flexget.utils.tools import LRUCache
+
 log = logging.getLogger('utils.qualities')
 
+# Number of parsed quality strings remembered
+PARSE_CACHE_SIZE = 5000
+
 
 class QualityComponent(object):
     """"""
@@ -33,6 +38,7 @@ class QualityComponent(object):
         # compile regexp
         if regexp is None:
             regexp = re.escape(name)
+        self.pattern = regexp
         self.regexp = re.compile('(?<![^\W_])(' + regexp + ')(?![^\W_])', re.IGNORECASE)
 
     def matches(self, text):
@@ -116,6 +122,10 @@ class QualityComponent(object):
         # No mutable attributes, return a regular copy
         return copy.copy(self)
 
+    def __reduce__(self):
+        # Unpickle as the registered component, e.g. results of parsers running in other processes
+        return _component, (self.type, self.name)
+
 
 _resolutions = [
     QualityComponent('resolution', 10, '360p'),
@@ -194,6 +204,25 @@ for items in (_resolutions, _sources, _codecs, _audios):
         _registry[item.name] = item
 
 
+# One regexp per component type, matching wherever any component of the type matches.
+# Types without a match in the text are skipped after a single search.
+_any_regexps = {}
+for items in (_resolutions, _sources, _codecs, _audios):
+    _any_regexps[items[0].type] = re.compile(
+        '(?<![^\W_])(?:' + '|'.join('(?:%s)' % item.pattern for item in items) + ')(?![^\W_])',
+        re.IGNORECASE,
+    )
+
+# Parsed components and remaining text, keyed by parsed text
+_parse_cache = LRUCache(PARSE_CACHE_SIZE)
+
+
+def _component(type, name):
+    if name == 'unknown':
+        return _UNKNOWNS[type]
+    return _registry[name]
+
+
 def all_components():
     return iter(_registry.values())
 
@@ -221,6 +250,15 @@ class Quality(object):
         :param text: The string to parse
         """
         self.text = text
+        (
+            self.resolution,
+            self.source,
+            self.codec,
+            self.audio,
+            self.clean_text,
+        ) = _parse_cache.get(text, lambda: self._parse(text))
+
+    def _parse(self, text):
         self.clean_text = text
         self.resolution = self._find_best(_resolutions, _UNKNOWNS['resolution'], False)
         self.source = self._find_best(_sources, _UNKNOWNS['source'])
@@ -232,9 +270,12 @@ class Quality(object):
                 default = _registry[default]
                 if not getattr(self, default.type):
                     setattr(self, default.type, default)
+        return self.resolution, self.source, self.codec, self.audio, self.clean_text
 
     def _find_best(self, qlist, default=None, strip_all=True):
         """Finds the highest matching quality component from `qlist`"""
+        if not _any_regexps[qlist[0].type].search(self.clean_text):
+            return default
         result = None
         search_in = self.clean_text
         for item in qlist:
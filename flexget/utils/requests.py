@@ -4,6 +4,7 @@ from future.moves.urllib.request import urlopen
 from future.moves.urllib.parse import urlparse
 from future.utils import text_to_native_str
 
+import threading
 import time
 import logging
 from datetime import timedelta, datetime
@@ -75,6 +76,8 @@ class TokenBucketLimiter(DomainLimiter):
     # This is just an in memory cache right now, it works for the daemon, and across tasks in a single execution
     # but not for multiple executions via cron. Do we need to store this to db?
     state_cache = {}
+    # Requests to a domain can be made from multiple threads (e.g. when inputs are run concurrently)
+    _state_lock = threading.Lock()
 
     def __init__(self, domain, tokens, rate, wait=True):
         """
@@ -87,9 +90,11 @@ class TokenBucketLimiter(DomainLimiter):
         self.rate = parse_timedelta(rate)
         self.wait = wait
         # Restore previous state for this domain, or establish new state cache
-        self.state = self.state_cache.setdefault(
-            domain, {'tokens': self.max_tokens, 'last_update': datetime.now()}
-        )
+        with self._state_lock:
+            self.state = self.state_cache.setdefault(
+                domain,
+                {'tokens': self.max_tokens, 'last_update': datetime.now(), 'lock': threading.Lock()},
+            )
 
     @property
     def tokens(self):
@@ -108,6 +113,11 @@ class TokenBucketLimiter(DomainLimiter):
         self.state['last_update'] = value
 
     def __call__(self):
+        # Hold the lock while waiting, so concurrent requests to the domain are spaced out as well
+        with self.state['lock']:
+            self._take_token()
+
+    def _take_token(self):
         if self.tokens < self.max_tokens:
             regen = timedelta_total_seconds(
                 datetime.now() - self.last_update
@@ -1,6 +1,6 @@
 from __future__ import unicode_literals, division, absolute_import
 from future.utils import text_to_native_str
-from flexget.utils.tools import native_str_to_text
+from flexget.utils.tools import native_str_to_text, LRUCache
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
 import logging
@@ -33,6 +33,9 @@ log = logging.getLogger('utils.template')
 # The environment will be created after the manager has started
 environment = None
 
+# Maximum number of compiled templates and expressions kept in the template cache
+TEMPLATE_CACHE_SIZE = 1000
+
 
 class RenderError(Exception):
     """Error raised when there is a problem with jinja rendering."""
@@ -154,6 +157,19 @@ class FlexGetNativeTemplate(FlexGetTemplate, NativeTemplate):
     pass
 
 
+class TemplateCache(LRUCache):
+    """
+    Bounded LRU cache of compiled templates and expressions, so rendering the same template string for many entries
+    only compiles it once.
+    """
+
+    def __init__(self, max_size=TEMPLATE_CACHE_SIZE):
+        super(TemplateCache, self).__init__(max_size)
+
+
+template_cache = TemplateCache()
+
+
 @event('manager.initialize')
 def make_environment(manager):
     """Create our environment and add our custom filters"""
@@ -172,6 +188,8 @@ def make_environment(manager):
     for name, filt in list(globals().items()):
         if name.startswith('filter_'):
             environment.filters[name.split('_', 1)[1]] = filt
+    # Templates compiled by a previous environment must not be reused
+    template_cache.clear()
 
 
 def list_templates(extensions=None):
@@ -214,6 +232,27 @@ def get_template(template_name, scope='task'):
         raise ValueError(err)
 
 
+def compile_template(template, native=False):
+    """
+    Compiles a template string, reusing the compiled template if the same string was compiled before.
+
+    :param template: Template string to compile.
+    :param native: If True, the template renders to native python types, not just strings.
+    :return: The compiled Template.
+    :raises RenderError: If the template has a syntax error.
+    """
+    template_class = None
+    if native:
+        template_class = FlexGetNativeTemplate
+    try:
+        return template_cache.get(
+            (template, native),
+            lambda: environment.from_string(template, template_class=template_class),
+        )
+    except TemplateSyntaxError as e:
+        raise RenderError('Error in template syntax: ' + e.message)
+
+
 def render(template, context, native=False):
     """
     Renders a Template with `context` as its context.
@@ -224,13 +263,7 @@ def render(template, context, native=False):
     :return: The rendered template text.
     """
     if isinstance(template, str):
-        template_class = None
-        if native:
-            template_class = FlexGetNativeTemplate
-        try:
-            template = environment.from_string(template, template_class=template_class)
-        except TemplateSyntaxError as e:
-            raise RenderError('Error in template syntax: ' + e.message)
+        template = compile_template(template, native=native)
     try:
         result = template.render(context)
     except Exception as e:
@@ -243,7 +276,29 @@ def render(template, context, native=False):
 
 def render_from_entry(template_string, entry, native=False):
     """Renders a Template or template string with an Entry as its context."""
+    return render(template_string, _entry_variables(entry), native=native)
+
+
+def render_from_entries(template_string, entries, native=False):
+    """
+    Renders a Template or template string with each of `entries` as its context, compiling it only once.
 
+    :param template_string: Template or template string to render.
+    :param entries: Iterable of Entries.
+    :param native: If True, and the rendering result can be all native python types, not just strings.
+    :return: Generator of (entry, result, error) tuples. `error` is a :class:`RenderError` if rendering failed for
+        that entry, in which case `result` is None.
+    """
+    if isinstance(template_string, str):
+        template_string = compile_template(template_string, native=native)
+    for entry in entries:
+        try:
+            yield entry, render(template_string, _entry_variables(entry)), None
+        except RenderError as e:
+            yield entry, None, e
+
+
+def _entry_variables(entry):
     # Make a copy of the Entry so we can add some more fields
     variables = copy(entry.store)
     variables['now'] = datetime.now()
@@ -254,7 +309,7 @@ def render_from_entry(template_string, entry, native=False):
         # Since `task` has different meaning between entry and task scope, the `task_name` field is create to be
         # consistent
         variables['task_name'] = entry.task.name
-    return render(template_string, variables, native=native)
+    return variables
 
 
 def render_from_task(template, task):
@@ -276,7 +331,9 @@ def evaluate_expression(expression, context):
     :param str expression:  A jinja expression to evaluate
     :param context: dictlike, supporting LazyDicts
     """
-    compiled_expr = environment.compile_expression(expression)
+    compiled_expr = template_cache.get(
+        ('expression', expression), lambda: environment.compile_expression(expression)
+    )
     # If we have a LazyDict, grab the underlying store. Our environment supports LazyFields directly
     if isinstance(context, LazyDict):
         context = context.store
@@ -13,7 +13,9 @@ import operator
 import os
 import re
 import sys
-from collections import MutableMapping, defaultdict
+import threading
+import time
+from collections import MutableMapping, OrderedDict, defaultdict
 from datetime import timedelta, datetime
 from pprint import pformat
 
@@ -196,6 +198,78 @@ class SmartRedirectHandler(request.HTTPRedirectHandler):
         return result
 
 
+_missing = object()
+
+
+class LRUCache(object):
+    """Thread safe, bounded cache evicting the least recently used values first."""
+
+    def __init__(self, max_size, ttl=None):
+        """
+        :param int max_size: Maximum number of cached values.
+        :param ttl: Seconds after which values are computed again, or None to keep them until evicted.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, compute_func):
+        """
+        :param key: Hashable key of the value, including anything which affects computing it.
+        :param compute_func: Function called to compute the value when it is not cached.
+        :return: The cached or computed value.
+        """
+        value = self.lookup(key, _missing)
+        if value is _missing:
+            # Compute outside the lock, other threads may use the cache meanwhile
+            value = compute_func()
+            self.put(key, value)
+        return value
+
+    def lookup(self, key, default=None):
+        """:return: The cached value of `key`, or `default` if there is none."""
+        now = time.time()
+        with self._lock:
+            try:
+                value, stored = self._cache.pop(key)
+            except KeyError:
+                pass
+            else:
+                if self.ttl is None or now - stored < self.ttl:
+                    self._cache[key] = value, stored
+                    self.hits += 1
+                    return value
+            self.misses += 1
+        return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._cache[key] = value, time.time()
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        :return: Dict with the cache `hits`, `misses`, current `size` and `max_size`.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._cache),
+                'max_size': self.max_size,
+            }
+
+
 class ReList(list):
     """
     A list that stores regexps.
@@ -572,51 +646,84 @@ def group_entries(entries, identifier):
     return grouped_entries
 
 
-def aggregate_inputs(task, inputs):
+def fetch_inputs(task, inputs, max_workers=None):
+    """
+    Runs the input plugins in a list of ``{plugin_name: config}`` dicts, as configured for plugins aggregating inputs.
+
+    :param task: Task the inputs are run for.
+    :param list inputs: Input plugin configs.
+    :param int max_workers: How many inputs can be run concurrently. Defaults to the `parallel_inputs` task setting.
+    :return: Iterator of ``(input_name, result)`` tuples in config order. Result is None if the input failed.
+    """
     from flexget import plugin
 
+    if max_workers is None:
+        max_workers = task.input_concurrency
+    jobs = [(input_name, input_config) for item in inputs for input_name, input_config in item.items()]
+
+    def run_input(job):
+        input_name, input_config = job
+        input = plugin.get_plugin_by_name(input_name)
+        method = input.phase_handlers['input']
+        try:
+            result = task.rerun_cached_input(input, input_config, lambda: method(task, input_config))
+            if max_workers > 1 and result:
+                # Consume generators inside the worker thread
+                result = list(result)
+            return result
+        except plugin.PluginError as e:
+            log.warning('Error during input plugin %s: %s', input_name, e)
+            return None
+
+    if max_workers > 1:
+        results = task.map_concurrent(run_input, jobs, max_workers)
+    else:
+        results = (run_input(job) for job in jobs)
+    for (input_name, _), result in zip(jobs, results):
+        yield input_name, result
+
+
+def aggregate_inputs(task, inputs, max_workers=None):
+    """
+    Runs input plugins and merges their entries in config order, skipping entries with a duplicate url, title or
+    location.
+
+    :param int max_workers: How many inputs can be run concurrently. Defaults to the `parallel_inputs` task setting.
+    """
     entries = []
     entry_titles = set()
     entry_urls = set()
     entry_locations = set()
-    for item in inputs:
-        for input_name, input_config in item.items():
-            input = plugin.get_plugin_by_name(input_name)
-            method = input.phase_handlers['input']
-            try:
-                result = method(task, input_config)
-            except plugin.PluginError as e:
-                log.warning('Error during input plugin %s: %s', input_name, e)
+    for input_name, result in fetch_inputs(task, inputs, max_workers=max_workers):
+        if result is None:
+            continue
+
+        if not result:
+            log.warning('Input %s did not return anything', input_name)
+            continue
+
+        for entry in result:
+            urls = ([entry['url']] if entry.get('url') else []) + entry.get('urls', [])
+
+            if any(url in entry_urls for url in urls):
+                log.debug('URL for `%s` already in entry list, skipping.', entry['title'])
+                continue
+
+            if entry['title'] in entry_titles:
+                log.debug('Ignored duplicate title `%s`', entry['title'])  # TODO: should combine?
                 continue
 
-            if not result:
-                log.warning('Input %s did not return anything', input_name)
+            if entry.get('location') and entry['location'] in entry_locations:
+                log.debug(
+                    'Ignored duplicate location `%s`', entry['location']
+                )  # TODO: should combine?
                 continue
 
-            for entry in result:
-                urls = ([entry['url']] if entry.get('url') else []) + entry.get('urls', [])
-
-                if any(url in entry_urls for url in urls):
-                    log.debug('URL for `%s` already in entry list, skipping.', entry['title'])
-                    continue
-
-                if entry['title'] in entry_titles:
-                    log.debug(
-                        'Ignored duplicate title `%s`', entry['title']
-                    )  # TODO: should combine?
-                    continue
-
-                if entry.get('location') and entry['location'] in entry_locations:
-                    log.debug(
-                        'Ignored duplicate location `%s`', entry['location']
-                    )  # TODO: should combine?
-                    continue
-
-                entries.append(entry)
-                entry_titles.add(entry['title'])
-                entry_urls.update(urls)
-                if entry.get('location'):
-                    entry_locations.add(entry['location'])
+            entries.append(entry)
+            entry_titles.add(entry['title'])
+            entry_urls.update(urls)
+            if entry.get('location'):
+                entry_locations.add(entry['location'])
 
     return entries
 